@@ -1,6 +1,7 @@
 """Core module exports."""
 from .config import get_settings, Settings
 from .clients import (
+    Prop,
     SleeperClient,
     PropOddsClient,
     PropOddsAuthError,
@@ -10,6 +11,7 @@ from .clients import (
 __all__ = [
     "get_settings",
     "Settings",
+    "Prop",
     "SleeperClient",
     "PropOddsClient",
     "PropOddsAuthError",
@@ -1,14 +1,29 @@
 """HTTP clients for external APIs."""
+import asyncio
+import logging
 import os
 import httpx
+import orjson
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, fields
 from typing import Any
 
 from .config import get_settings
 
+logger = logging.getLogger(__name__)
+
+# Settings are snapshotted once at import so client construction doesn't walk
+# the pydantic settings model on every scan.
+_SLEEPER_BASE_URL = get_settings().sleeper_base_url
+_SETTINGS_ODDS_API_KEY = get_settings().prop_odds_api_key
+
 
 # In-memory cache for player metadata (shared)
 _player_metadata_cache: dict[str, dict[str, Any]] = {}
 
+# Player metadata fields retained from Sleeper's /players payload
+_PLAYER_FIELDS = ("first_name", "last_name", "team", "position")
+
 
 class PropOddsAuthError(RuntimeError):
     """Raised when Odds API credentials are rejected."""
@@ -18,11 +33,45 @@ class PropOddsPlanError(RuntimeError):
     """Raised when Odds API plan/quota blocks request."""
 
 
+@dataclass(slots=True)
+class Prop(Mapping[str, Any]):
+    """One bookmaker outcome for a player prop.
+
+    Slotted so full-slate scans stay compact; the read-only mapping interface
+    keeps existing ``prop["market"]`` / ``prop.get(...)`` consumers working.
+    """
+    event_id: str
+    commence_time: str | None
+    home_team: str
+    away_team: str
+    player_name: str
+    market: str
+    line: float
+    side: str
+    odds: int
+    book: str
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _PROP_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PROP_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_PROP_FIELDS)
+
+
+_PROP_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Prop))
+_PROP_FIELD_SET = frozenset(_PROP_FIELDS)
+
+
 class SleeperClient:
     """Client for Sleeper API."""
     
     def __init__(self):
-        self.base_url = get_settings().sleeper_base_url
+        self.base_url = _SLEEPER_BASE_URL
         
     async def get_trending_players(
         self, 
@@ -43,10 +92,14 @@ class SleeperClient:
         async with httpx.AsyncClient() as client:
             response = await client.get(url, params=params)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
     
     async def get_all_players(self, sport: str = "nfl") -> dict[str, Any]:
-        """Fetch all player metadata (cached globally)."""
+        """Fetch all player metadata (cached globally).
+
+        Only the fields callers read (see `_PLAYER_FIELDS`) are kept per player,
+        so the cached slate is a fraction of Sleeper's full payload.
+        """
         global _player_metadata_cache
         
         if sport in _player_metadata_cache:
@@ -57,9 +110,14 @@ class SleeperClient:
         async with httpx.AsyncClient(timeout=60.0) as client:
             response = await client.get(url)
             response.raise_for_status()
-            data = response.json()
-            _player_metadata_cache[sport] = data
-            return data
+            raw = orjson.loads(response.content)
+        data = {
+            pid: {field: player.get(field, "") for field in _PLAYER_FIELDS}
+            for pid, player in raw.items()
+            if isinstance(player, dict)
+        }
+        _player_metadata_cache[sport] = data
+        return data
     
     async def get_trending_with_teams(
         self,
@@ -163,6 +221,9 @@ PROP_MARKETS = {
     ],
 }
 
+# Comma-joined `markets` query values, built once per sport
+_MARKETS_JOINED: dict[str, str] = {sport: ",".join(markets) for sport, markets in PROP_MARKETS.items()}
+
 # ── Per-Book Available Markets ──
 # Only these prop types are offered on each DFS app.
 # Used to filter out props unavailable on the selected book.
@@ -213,6 +274,14 @@ BOOK_AVAILABLE_MARKETS: dict[str, dict[str, set[str]]] = {
 }
 
 
+# Flattened (book, sport) -> markets view of BOOK_AVAILABLE_MARKETS
+FLAT_BOOK_MARKETS: dict[tuple[str, str], frozenset[str]] = {
+    (book, sport): frozenset(markets)
+    for book, per_sport in BOOK_AVAILABLE_MARKETS.items()
+    for sport, markets in per_sport.items()
+}
+
+
 # Common suffixes to strip for fuzzy matching
 _SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
 
@@ -252,34 +321,42 @@ def _name_matches_fuzzy(prop_name: str, norm_names: set[str]) -> bool:
     return False
 
 
-def filter_sleeper_markets(
+def filter_markets(
     props: list[dict[str, Any]],
     sport: str,
+    book: str = "sleeper",
     allowed_player_names: set[str] | None = None,
 ) -> list[dict[str, Any]]:
-    """Filter props to only include markets available on Sleeper.
+    """Filter props to only include markets available on `book`.
 
     If `allowed_player_names` is provided, enforce player-name membership using
     fuzzy matching (tolerates suffixes like Jr./III and initial formatting).
     """
-    allowed = SLEEPER_AVAILABLE_MARKETS.get(sport, set())
+    allowed = FLAT_BOOK_MARKETS.get((book, sport), frozenset())
     norm_names: set[str] | None = None
     if allowed_player_names:
         norm_names = {_normalize_player_name(n) for n in allowed_player_names if str(n).strip()}
 
     if not allowed and norm_names is None:
         return props
+    if norm_names is None:
+        return [p for p in props if p.get("market", "") in allowed]
+    if not allowed:
+        return [p for p in props if _name_matches_fuzzy(str(p.get("player_name", "")), norm_names)]
+    return [
+        p for p in props
+        if p.get("market", "") in allowed
+        and _name_matches_fuzzy(str(p.get("player_name", "")), norm_names)
+    ]
 
-    filtered: list[dict[str, Any]] = []
-    for p in props:
-        market_ok = (not allowed) or (p.get("market", "") in allowed)
-        if not market_ok:
-            continue
-        if norm_names is not None:
-            if not _name_matches_fuzzy(str(p.get("player_name", "")), norm_names):
-                continue
-        filtered.append(p)
-    return filtered
+
+def filter_sleeper_markets(
+    props: list[dict[str, Any]],
+    sport: str,
+    allowed_player_names: set[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Filter props to only include markets available on Sleeper."""
+    return filter_markets(props, sport, book="sleeper", allowed_player_names=allowed_player_names)
 
 # Mapping: Sleeper team abbreviation -> The Odds API team name
 # This is approximate and may need tuning
@@ -328,15 +405,21 @@ SOCCER_TEAM_MAP: dict[str, str] = {
 }
 
 
+# Transient Odds API failures (timeouts, dropped connections, 5xx) are retried
+# with exponential backoff; auth/plan/other 4xx errors propagate immediately.
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.25
+_RETRY_STATUSES = frozenset({500, 502, 503})
+
+
 class PropOddsClient:
     """Client for The Odds API (player props)."""
     
     def __init__(self):
-        settings_key = get_settings().prop_odds_api_key
         self.api_key = (
             os.getenv("PROP_ODDS_API_KEY")
             or os.getenv("THE_ODDS_API_KEY")
-            or settings_key
+            or _SETTINGS_ODDS_API_KEY
             or ""
         ).strip()
         self.base_url = "https://api.the-odds-api.com"
@@ -347,7 +430,19 @@ class PropOddsClient:
                 "Odds API key is missing. Set PROP_ODDS_API_KEY (or THE_ODDS_API_KEY) in backend .env."
             )
         async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url, params=params)
+            for attempt in range(_RETRY_ATTEMPTS):
+                last_attempt = attempt == _RETRY_ATTEMPTS - 1
+                try:
+                    response = await client.get(url, params=params)
+                except (httpx.TimeoutException, httpx.RemoteProtocolError) as e:
+                    if last_attempt:
+                        raise
+                    logger.debug("Odds API transient error (%s), retrying: %s", type(e).__name__, e)
+                else:
+                    if response.status_code not in _RETRY_STATUSES or last_attempt:
+                        break
+                    logger.debug("Odds API returned %d, retrying", response.status_code)
+                await asyncio.sleep(_RETRY_BASE_DELAY * (2 ** attempt))
 
         if response.status_code == 401:
             raise PropOddsAuthError(
@@ -360,7 +455,7 @@ class PropOddsClient:
                 "Upgrade plan or reduce scan usage."
             )
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
         
     async def get_upcoming_events(self, sport: str = "nfl") -> list[dict[str, Any]]:
         """
@@ -387,13 +482,15 @@ class PropOddsClient:
         sport_key = SPORT_KEY_MAP.get(sport, f"americanfootball_{sport}")
         
         if markets is None:
-            markets = PROP_MARKETS.get(sport, ["player_points"])
+            markets_str = _MARKETS_JOINED.get(sport, "player_points")
+        else:
+            markets_str = ",".join(markets)
         
         url = f"{self.base_url}/v4/sports/{sport_key}/events/{event_id}/odds"
         params = {
             "apiKey": self.api_key,
             "regions": "us,us2",   # us2 covers DFS books (PrizePicks/Underdog/Sleeper)
-            "markets": ",".join(markets),
+            "markets": markets_str,
             "oddsFormat": "american",
         }
         return await self._get_json(url, params=params, timeout=15.0)
@@ -402,37 +499,37 @@ class PropOddsClient:
         self,
         event: dict[str, Any],
         event_odds: dict[str, Any]
-    ) -> list[dict[str, Any]]:
+    ) -> list[Prop]:
         """Parse bookmaker data into flat prop list."""
-        props = []
-        for bookmaker in event_odds.get("bookmakers", []):
-            book_name = bookmaker.get("key", "unknown")
-            
-            for market in bookmaker.get("markets", []):
-                market_key = market.get("key", "unknown")
-                
-                for outcome in market.get("outcomes", []):
-                    prop = {
-                        "event_id": event["id"],
-                        "commence_time": event.get("commence_time"),
-                        "home_team": event.get("home_team", ""),
-                        "away_team": event.get("away_team", ""),
-                        "player_name": outcome.get("description", "Unknown"),
-                        "market": market_key,
-                        "line": outcome.get("point", 0),
-                        "side": outcome.get("name", "Over"),
-                        "odds": outcome.get("price", -110),
-                        "book": book_name,
-                    }
-                    props.append(prop)
-        return props
+        event_id = event["id"]
+        commence_time = event.get("commence_time")
+        home_team = event.get("home_team", "")
+        away_team = event.get("away_team", "")
+
+        return [
+            Prop(
+                event_id,
+                commence_time,
+                home_team,
+                away_team,
+                outcome.get("description", "Unknown"),
+                market.get("key", "unknown"),
+                outcome.get("point", 0),
+                outcome.get("name", "Over"),
+                outcome.get("price", -110),
+                bookmaker.get("key", "unknown"),
+            )
+            for bookmaker in event_odds.get("bookmakers", [])
+            for market in bookmaker.get("markets", [])
+            for outcome in market.get("outcomes", [])
+        ]
     
     async def smart_scan(
         self,
         trending_players: list[dict[str, Any]],
         sport: str = "nfl",
         max_games: int = 3
-    ) -> list[dict[str, Any]]:
+    ) -> list[Prop]:
         """
         Smart Scan: Only fetch props for games that have trending players.
         
@@ -454,20 +551,20 @@ class PropOddsClient:
                 trending_teams.add(team_map[team_abbrev])
         
         if not trending_teams:
-            print(f"DEBUG: No valid teams found. Trending raw: {len(trending_players)} items.")
-            print(f"DEBUG: Sample trending player: {trending_players[0] if trending_players else 'None'}")
+            logger.debug("No valid teams found. Trending raw: %d items.", len(trending_players))
+            logger.debug("Sample trending player: %s", trending_players[0] if trending_players else None)
             return []
         
-        print(f"DEBUG: Found {len(trending_teams)} unique trending teams: {trending_teams}")
+        logger.debug("Found %d unique trending teams: %s", len(trending_teams), trending_teams)
 
         # Step 2: Get upcoming events
         try:
             events = await self.get_upcoming_events(sport)
-            print(f"DEBUG: Fetched {len(events)} upcoming events for {sport}")
+            logger.debug("Fetched %d upcoming events for %s", len(events), sport)
         except (PropOddsAuthError, PropOddsPlanError):
             raise
         except Exception as e:
-            print(f"Error fetching events: {e}")
+            logger.warning("Error fetching events: %s", e)
             return []
         
         # Step 3: Score each event by how many trending teams are playing
@@ -481,7 +578,7 @@ class PropOddsClient:
             if away in trending_teams:
                 score += 1
             
-            print(f"DEBUG: Analyzing Game {home} vs {away} - Score: {score}")
+            logger.debug("Analyzing game %s vs %s - score: %d", home, away, score)
 
             if score > 0:
                 scored_events.append((score, event))
@@ -491,13 +588,16 @@ class PropOddsClient:
         selected_events = [ev for _, ev in scored_events[:max_games]]
         
         if not selected_events:
-            print("No games found matching trending player teams")
+            logger.info("No games found matching trending player teams")
             return []
         
-        print(f"Smart Scan: Querying {len(selected_events)} games (saved {len(events) - len(selected_events)} API calls)")
+        logger.info(
+            "Smart Scan: querying %d games (saved %d API calls)",
+            len(selected_events), len(events) - len(selected_events),
+        )
         
         # Step 5: Fetch props only for selected events
-        all_props: list[dict[str, Any]] = []
+        all_props: list[Prop] = []
         for event in selected_events:
             try:
                 event_odds = await self.get_event_player_props(
@@ -509,7 +609,7 @@ class PropOddsClient:
             except (PropOddsAuthError, PropOddsPlanError):
                 raise
             except Exception as e:
-                print(f"Error fetching props for event {event.get('id')}: {e}")
+                logger.warning("Error fetching props for event %s: %s", event.get("id"), e)
                 continue
         
         return all_props
@@ -518,7 +618,7 @@ class PropOddsClient:
         self,
         sport: str = "nba",
         max_games: int = 10,
-    ) -> list[dict[str, Any]]:
+    ) -> list[Prop]:
         """
         Full Scan: Fetch ALL props for ALL upcoming games.
         This powers the 'Daily Grind' bulk EV dashboard.
@@ -533,18 +633,18 @@ class PropOddsClient:
         # Step 1: Get all upcoming events
         try:
             events = await self.get_upcoming_events(sport)
-            print(f"FULL SCAN: Fetched {len(events)} upcoming events for {sport}")
+            logger.debug("Full scan: fetched %d upcoming events for %s", len(events), sport)
         except (PropOddsAuthError, PropOddsPlanError):
             raise
         except Exception as e:
-            print(f"Error fetching events: {e}")
+            logger.warning("Error fetching events: %s", e)
             return []
 
         selected = events[:max_games]
-        print(f"FULL SCAN: Querying {len(selected)} games for all props")
+        logger.info("Full scan: querying %d games for all props", len(selected))
 
         # Step 2: Fetch props for every selected event
-        all_props: list[dict[str, Any]] = []
+        all_props: list[Prop] = []
         for event in selected:
             try:
                 event_odds = await self.get_event_player_props(
@@ -556,8 +656,8 @@ class PropOddsClient:
             except (PropOddsAuthError, PropOddsPlanError):
                 raise
             except Exception as e:
-                print(f"Error fetching props for event {event.get('id')}: {e}")
+                logger.warning("Error fetching props for event %s: %s", event.get("id"), e)
                 continue
 
-        print(f"FULL SCAN: Total props fetched: {len(all_props)}")
+        logger.info("Full scan: total props fetched: %d", len(all_props))
         return all_props
@@ -1,6 +1,5 @@
 """Apex DFS Configuration."""
 from pydantic_settings import BaseSettings
-from functools import lru_cache
 
 
 class Settings(BaseSettings):
@@ -22,7 +21,12 @@ class Settings(BaseSettings):
         extra = "ignore"
 
 
-@lru_cache
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
-    """Cached settings instance."""
-    return Settings()
+    """Cached settings instance (built once on first use)."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
@@ -2,6 +2,7 @@
 from .strategy_engine import (
     PropOpportunity,
     american_to_implied,
+    american_to_implied_vec,
     calculate_edge,
     evaluate_prop,
     scan_for_opportunities,
@@ -11,6 +12,7 @@ from .slip_optimizer import generate_top_slips
 __all__ = [
     "PropOpportunity",
     "american_to_implied",
+    "american_to_implied_vec",
     "calculate_edge",
     "evaluate_prop",
     "scan_for_opportunities",
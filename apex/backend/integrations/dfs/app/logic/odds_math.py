@@ -0,0 +1,30 @@
+"""Shared American-odds conversions used by the strategy engine and slip optimizer."""
+import numpy as np
+
+
+def american_to_implied(odds: int) -> float:
+    """
+    Convert American odds to implied probability.
+
+    Both signs share the denominator |odds| + 100; only the numerator
+    differs (|odds| for favourites, 100 for underdogs). 0 is not a valid
+    American price and maps to 0.0.
+
+    Examples:
+        -140 -> 0.583 (58.3%)
+        +120 -> 0.455 (45.5%)
+        -110 -> 0.524 (52.4%)
+    """
+    if odds == 0:
+        return 0.0
+    a = abs(odds)
+    return (a if odds < 0 else 100) / (a + 100)
+
+
+def american_to_implied_vec(odds: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`american_to_implied` over an array of American odds."""
+    odds = np.asarray(odds, dtype=np.float64)
+    a = np.abs(odds)
+    # Select the numerator, then a single division with a denominator >= 100
+    implied = np.where(odds < 0, a, 100.0) / (a + 100)
+    return np.where(odds == 0, 0.0, implied)
@@ -1,7 +1,15 @@
 """Slip Optimizer - Generates ranked parlay combinations for DFS books."""
+import heapq
 from dataclasses import dataclass
-from itertools import combinations
-from typing import Any
+from functools import lru_cache
+from itertools import chain, combinations
+from math import comb as _comb
+from typing import Any, Callable
+
+import numpy as np
+from numpy.polynomial import polynomial as P
+
+from .odds_math import american_to_implied as american_to_implied_prob
 
 
 @dataclass
@@ -17,6 +25,37 @@ class SlipCandidate:
     book: str = "sleeper"
 
 
+@dataclass(slots=True)
+class PoolLeg:
+    """Display fields and pick identity of a slip pool leg, read from its scan row once."""
+    player_name: str
+    market: str
+    line: float
+    side: str
+    edge_pct: float
+    identity: tuple[str, str, str, float]
+
+    @classmethod
+    def from_row(cls, p: dict[str, Any], identity: tuple[str, str, str, float]) -> "PoolLeg":
+        return cls(
+            player_name=p.get("player_name", "Unknown"),
+            market=p.get("market", "unknown"),
+            line=p.get("line", 0),
+            side=p.get("side", "over"),
+            edge_pct=p.get("edge_pct", 0),
+            identity=identity,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "player_name": self.player_name,
+            "market": self.market,
+            "line": self.line,
+            "side": self.side,
+            "edge_pct": self.edge_pct,
+        }
+
+
 # ── Payout tables per book ────────────────────────────────────────────────────
 #
 # Power: must hit ALL legs to win.
@@ -28,6 +67,10 @@ class SlipCandidate:
 #   Underdog:   https://underdogfantasy.com/picks
 #   Sleeper:    ~1.75x per leg (dynamic, no official table)
 
+# Sleeper power multiplier indexed directly by leg count (round(1.75 ** n, 2));
+# 0- and 1-leg slips are not offered.
+_SLEEPER_POWER_MULT: tuple[float, ...] = (0.0, 0.0, 3.06, 5.36, 9.38, 16.41, 28.72)
+
 BOOK_PAYOUTS: dict[str, dict[str, Any]] = {
     "prizepicks": {
         "power": {
@@ -62,13 +105,19 @@ BOOK_PAYOUTS: dict[str, dict[str, Any]] = {
     },
     "sleeper": {
         # Sleeper uses a fixed multiplier per leg (~1.75x)
-        "power": {n: round(1.75 ** n, 2) for n in range(2, 7)},
+        "power": {n: _SLEEPER_POWER_MULT[n] for n in range(2, 7)},
     },
 }
 
 # Fallback for unknown books
 _LEGACY_PAYOUTS = {2: 3.0, 3: 5.0, 4: 10.0, 5: 20.0, 6: 40.0}
 
+# Binomial coefficients C(n, k) for k = 0..n, per slip size
+_BINOM: dict[int, np.ndarray] = {
+    n: np.array([_comb(n, k) for k in range(n + 1)], dtype=np.float64) for n in range(1, 7)
+}
+
+
 
 def get_payout(book: str, mode: str, n_legs: int) -> float | dict[int, float]:
     """
@@ -83,13 +132,40 @@ def get_payout(book: str, mode: str, n_legs: int) -> float | dict[int, float]:
     return mode_data.get(n_legs, _LEGACY_PAYOUTS.get(n_legs, 2.0))
 
 
-# ── Probability helpers ───────────────────────────────────────────────────────
+_PayoutSpec = tuple[bool, np.ndarray, float]
 
-def american_to_implied_prob(odds: int) -> float:
-    if odds > 0:
-        return 100 / (odds + 100)
-    return abs(odds) / (abs(odds) + 100)
 
+def _build_payout_spec(payout_info: float | dict[int, float], n_legs: int) -> _PayoutSpec:
+    """Flatten a `get_payout` result into (is_flex, multiplier vector, display multiplier).
+
+    Flex tables become a dense vector indexed by legs hit; power payouts are a
+    one-element vector.
+    """
+    if isinstance(payout_info, dict):
+        mult = np.array([payout_info.get(k, 0.0) for k in range(n_legs + 1)], dtype=np.float64)
+        display = payout_info.get(n_legs, payout_info.get(max(payout_info), 0.0))
+        return True, mult, float(display)
+    payout_mult = float(payout_info)
+    return False, np.array([payout_mult]), payout_mult
+
+
+# Every known (book, mode, legs) payout, flattened once at import
+_PAYOUT_CACHE: dict[tuple[str, str, int], _PayoutSpec] = {
+    (book, mode, n): _build_payout_spec(get_payout(book, mode, n), n)
+    for book, modes in BOOK_PAYOUTS.items()
+    for mode in modes
+    for n in range(1, 7)
+}
+
+
+def _payout_spec(book: str, mode: str, n_legs: int) -> _PayoutSpec:
+    spec = _PAYOUT_CACHE.get((book, mode, n_legs))
+    if spec is None:
+        spec = _build_payout_spec(get_payout(book, mode, n_legs), n_legs)
+    return spec
+
+
+# ── Probability helpers ───────────────────────────────────────────────────────
 
 def no_vig_prob(main_odds: int, opposing_odds: int | None) -> float:
     p_main = american_to_implied_prob(main_odds)
@@ -114,29 +190,40 @@ def confidence_adjusted_prob(probability: float, confidence: float) -> float:
 
 # ── Combinatorial helpers ─────────────────────────────────────────────────────
 
-from math import comb as _comb
+def _flex_poly(n: int, mult: np.ndarray, binom: np.ndarray) -> np.ndarray:
+    """Coefficients (highest degree first) of the flex payout polynomial in p.
+
+    sum_k C(n,k) * p^k*(1-p)^(n-k) * m[k] is a degree-n polynomial in p, so
+    it can be expanded once and evaluated with Horner's rule.
+    """
+    coef = np.zeros(n + 1)
+    for k in range(n + 1):
+        # C(n,k) * m[k] * p^k * (1-p)^(n-k), ascending powers of p
+        coef[k:] += binom[k] * mult[k] * P.polypow([1.0, -1.0], n - k)
+    return coef[::-1]
 
 
-def _flex_ev(leg_probs: list[float], payout_table: dict[int, float]) -> float:
+def _flex_ev_batch(p_avg: np.ndarray, n: int, mult: np.ndarray, binom: np.ndarray) -> np.ndarray:
+    """Flex EV for many slips at once, given each slip's average leg probability."""
+    return np.polyval(_flex_poly(n, mult, binom), p_avg) - 1.0
+
+
+def _flex_ev(leg_probs: list[float], mult: np.ndarray) -> float:
     """
     Compute expected value for a flex slip with partial payouts.
 
     EV = sum_{k=0}^{n} C(n,k) * p^k*(1-p)^(n-k) * m[k] - 1
 
     This uses the independent-legs assumption.  For simplicity we use the
-    average per-leg probability across all legs.
+    average per-leg probability across all legs.  `mult` is the dense
+    per-hit multiplier vector from `_PAYOUT_CACHE`.
     """
     n = len(leg_probs)
     p_avg = sum(leg_probs) / n if n else 0.5
-
-    ev = -1.0
-    for k in range(n + 1):
-        m = payout_table.get(k, 0.0)
-        if m == 0:
-            continue
-        prob_k = _comb(n, k) * (p_avg ** k) * ((1 - p_avg) ** (n - k))
-        ev += prob_k * m
-    return ev
+    binom = _BINOM.get(n)
+    if binom is None:
+        binom = np.array([_comb(n, i) for i in range(n + 1)], dtype=np.float64)
+    return float(_flex_ev_batch(np.array([p_avg]), n, mult, binom)[0])
 
 
 # ── Core EV calculation ───────────────────────────────────────────────────────
@@ -148,7 +235,7 @@ def calculate_slip_ev(
     mode: str = "power",
 ) -> SlipCandidate:
     """Calculate Expected Value of a slip."""
-    payout_info = get_payout(book, mode, slip_size)
+    is_flex, mult, display_multiplier = _payout_spec(book, mode, slip_size)
 
     confidences: list[float] = []
     leg_probs: list[float] = []
@@ -164,18 +251,12 @@ def calculate_slip_ev(
     for lp in leg_probs:
         win_prob *= lp
 
-    is_flex = isinstance(payout_info, dict)
     if is_flex:
-        payout_table: dict[int, float] = payout_info  # type: ignore[assignment]
-        expected_value = _flex_ev(leg_probs, payout_table)
-        # "payout multiplier" for display = all-in-multiplier (max hits)
-        display_multiplier = payout_table.get(slip_size, payout_table.get(max(payout_table), 0.0))
-        breakeven_prob = 1.0 / display_multiplier if display_multiplier > 0 else 1.0
+        expected_value = _flex_ev(leg_probs, mult)
     else:
-        payout_mult: float = float(payout_info)  # type: ignore[arg-type]
-        expected_value = (win_prob * payout_mult) - 1.0
-        breakeven_prob = 1.0 / payout_mult if payout_mult > 0 else 1.0
-        display_multiplier = payout_mult
+        expected_value = (win_prob * display_multiplier) - 1.0
+    # "payout multiplier" for display = all-in-multiplier (max hits)
+    breakeven_prob = 1.0 / display_multiplier if display_multiplier > 0 else 1.0
 
     combined_edge = (win_prob - breakeven_prob) * 100.0
 
@@ -196,30 +277,30 @@ def calculate_slip_ev(
 # ── DFS book market lookup (used by availability filter) ──────────────────────
 # Maps book key -> sport -> set of allowed market keys
 # Mirrors the BOOK_AVAILABLE_MARKETS in clients.py without a circular import.
-_DFS_BOOK_MARKETS: dict[str, dict[str, set[str]]] = {
+_DFS_BOOK_MARKETS: dict[str, dict[str, frozenset[str]]] = {
     "sleeper": {
-        "nba": {
+        "nba": frozenset({
             "player_points", "player_rebounds", "player_assists",
             "player_threes", "player_blocks", "player_steals",
             "player_turnovers", "player_points_rebounds_assists",
             "player_points_rebounds", "player_points_assists",
             "player_rebounds_assists", "player_double_double",
             "player_blocks_steals", "player_triple_double",
-        },
-        "nfl": {
+        }),
+        "nfl": frozenset({
             "player_pass_yds", "player_pass_tds", "player_pass_completions",
             "player_pass_attempts", "player_pass_interceptions",
             "player_rush_yds", "player_rush_attempts", "player_rush_tds",
             "player_receptions", "player_reception_yds", "player_reception_tds",
             "player_rush_reception_yds", "player_rush_reception_tds",
             "player_anytime_td", "player_kicking_points",
-        },
-        "mlb": {
+        }),
+        "mlb": frozenset({
             "pitcher_strikeouts", "pitcher_outs", "batter_hits",
             "batter_total_bases", "batter_rbis", "batter_runs_scored",
             "batter_walks", "batter_stolen_bases", "batter_home_runs",
-        },
-        "soccer": {"player_shots", "player_shots_on_target", "player_goal_scorer_anytime"},
+        }),
+        "soccer": frozenset({"player_shots", "player_shots_on_target", "player_goal_scorer_anytime"}),
     },
 }
 _DFS_BOOK_MARKETS["prizepicks"] = dict(_DFS_BOOK_MARKETS["sleeper"])
@@ -227,22 +308,25 @@ _DFS_BOOK_MARKETS["prizepicks"]["mlb"] = _DFS_BOOK_MARKETS["sleeper"]["mlb"] | {
 _DFS_BOOK_MARKETS["underdog"] = _DFS_BOOK_MARKETS["prizepicks"]
 
 
+_BOOK_ALIASES = {
+    "sleeper": "sleeper",
+    "prizepicks": "prizepicks",
+    "underdog": "underdog",
+    "underdogsports": "underdog",
+    "draftkings": "draftkings",
+    "fanduel": "fanduel",
+    "betmgm": "betmgm",
+    "mgm": "betmgm",
+    "pinnacle": "pinnacle",
+    "bookmaker": "bookmaker",
+}
+
+
+@lru_cache(maxsize=128)
 def _canonical_book_name(book: str) -> str:
     """Normalize sportsbook aliases to a stable key."""
     raw = "".join(ch for ch in str(book or "").lower() if ch.isalnum())
-    aliases = {
-        "sleeper": "sleeper",
-        "prizepicks": "prizepicks",
-        "underdog": "underdog",
-        "underdogsports": "underdog",
-        "draftkings": "draftkings",
-        "fanduel": "fanduel",
-        "betmgm": "betmgm",
-        "mgm": "betmgm",
-        "pinnacle": "pinnacle",
-        "bookmaker": "bookmaker",
-    }
-    return aliases.get(raw, raw)
+    return _BOOK_ALIASES.get(raw, raw)
 
 
 def _pick_identity(p: dict[str, Any]) -> tuple[str, str, str, float]:
@@ -263,13 +347,90 @@ def _row_quality(p: dict[str, Any]) -> tuple[float, float, float]:
     return (edge, books, coverage)
 
 
-def _overlap_ratio(a: set[tuple[str, str, str, float]], b: set[tuple[str, str, str, float]]) -> float:
-    if not a or not b:
-        return 0.0
-    union = len(a.union(b))
-    if union <= 0:
-        return 0.0
-    return len(a.intersection(b)) / union
+# Slips sharing more than this Jaccard fraction of picks count as duplicates.
+_MAX_SLIP_OVERLAP = 0.82
+
+
+def _max_overlap_ratio(
+    sig: frozenset[tuple[str, str, str, float]],
+    postings: dict[tuple[str, str, str, float], list[int]],
+    selected_sizes: list[int],
+) -> float:
+    """Highest Jaccard overlap between `sig` and any already-selected slip.
+
+    `postings` maps each pick identity to the selected slips containing it, so
+    only slips that share at least one pick are ever compared and the
+    intersection sizes come from counting postings instead of set algebra.
+    """
+    shared: dict[int, int] = {}
+    for ident in sig:
+        for j in postings.get(ident, ()):
+            shared[j] = shared.get(j, 0) + 1
+    best = 0.0
+    for j, inter in shared.items():
+        ratio = inter / (len(sig) + selected_sizes[j] - inter)
+        if ratio > best:
+            best = ratio
+    return best
+
+
+@lru_cache(maxsize=None)
+def _get_ev_kernel(book: str, mode: str, size: int) -> Callable[[np.ndarray], np.ndarray]:
+    """EV over an (m, size) matrix of leg probabilities, specialized per payout.
+
+    The payout lookup, flex/power dispatch and flex polynomial are resolved
+    once per (book, mode, size) and baked into the returned closure.
+    """
+    is_flex, mult, payout_mult = _payout_spec(book, mode, size)
+    if is_flex:
+        coef = _flex_poly(size, mult, _BINOM[size])
+
+        def kernel(probs: np.ndarray) -> np.ndarray:
+            return np.polyval(coef, probs.mean(axis=1)) - 1.0
+    else:
+        def kernel(probs: np.ndarray) -> np.ndarray:
+            return probs.prod(axis=1) * payout_mult - 1.0
+    return kernel
+
+
+def _evaluate_size(
+    leg_prob: np.ndarray,
+    name_ids: np.ndarray,
+    size: int,
+    book: str,
+    mode: str,
+    keep: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the best `keep` combos of one slip size and their EVs.
+
+    Combos come back as a (m, size) pool-index matrix ordered by EV, best
+    first, with ties kept in combinations() order.
+    """
+    # Full enumeration is cheap here: pools are capped at 18 legs, so the
+    # largest case is C(18, 6) = 18,564 combos.
+    n_combos = _comb(len(leg_prob), size)
+    # (num_combos, size) matrix of pool indices, in combinations() order.
+    idx = np.fromiter(
+        chain.from_iterable(combinations(range(len(leg_prob)), size)),
+        dtype=np.int32,
+        count=n_combos * size,
+    ).reshape(n_combos, size)
+    # Drop combos that repeat a player (pool legs are already identity-unique).
+    names = np.sort(name_ids[idx], axis=1)
+    idx = idx[(names[:, 1:] != names[:, :-1]).all(axis=1)]
+    if not len(idx):
+        return idx, np.empty(0)
+
+    ev = _get_ev_kernel(book, mode, size)(leg_prob[idx])
+
+    # Top-K by EV without a full sort; ties keep combinations() order.
+    if len(ev) > keep:
+        kth = ev[np.argpartition(-ev, keep - 1)[keep - 1]]
+        top = np.flatnonzero(ev >= kth)
+    else:
+        top = np.arange(len(ev))
+    top = top[np.lexsort((top, -ev[top]))][:keep]
+    return idx[top], ev[top]
 
 
 def generate_top_slips(
@@ -316,99 +477,145 @@ def generate_top_slips(
 
     # ── Book-specific availability filter ──────────────────────────────────────
     # Only keep props that are offered on the selected DFS book.
+    allowed = _DFS_BOOK_MARKETS.get(canonical_book, _DFS_BOOK_MARKETS.get(book, {})).get(sport)
+
     def _is_available(opp: dict[str, Any]) -> bool:
-        target = canonical_book
-        if target == "sleeper":
-            # Prefer scanner-provided compatibility flag when present.
-            if "available_on_sleeper_compatible" in opp:
-                return bool(opp.get("available_on_sleeper_compatible"))
-            allowed = _DFS_BOOK_MARKETS.get("sleeper", {}).get(sport)
-            return str(opp.get("market", "")) in (allowed or set())
         # 1. Check whether the book appears explicitly in book_odds
         for entry in (opp.get("book_odds") or []):
             if isinstance(entry, dict):
-                if _canonical_book_name(str(entry.get("book", ""))) == target:
+                if _canonical_book_name(str(entry.get("book", ""))) == canonical_book:
                     return True
         # 2. Fall back to market-type whitelist
-        allowed = _DFS_BOOK_MARKETS.get(target, _DFS_BOOK_MARKETS.get(book, {})).get(sport)
         if allowed is not None:
             return str(opp.get("market", "")) in allowed
         # Unknown book — allow everything
         return True
 
-    eligible = [
-        p for p in opportunities
-        if p.get("edge_pct", 0) >= min_edge and _is_available(p)
-    ]
-    # Deduplicate exact duplicate legs before combinatorics.
-    deduped: dict[tuple[str, str, str, float], dict[str, Any]] = {}
+    if canonical_book == "sleeper":
+        # Prefer scanner-provided compatibility flag when present.
+        sleeper_markets = allowed or frozenset()
+        eligible = [
+            p for p in opportunities
+            if p.get("edge_pct", 0) >= min_edge
+            and (
+                bool(p["available_on_sleeper_compatible"])
+                if "available_on_sleeper_compatible" in p
+                else str(p.get("market", "")) in sleeper_markets
+            )
+        ]
+    else:
+        eligible = [
+            p for p in opportunities
+            if p.get("edge_pct", 0) >= min_edge and _is_available(p)
+        ]
+    # Deduplicate exact duplicate legs before combinatorics. Each leg's pick
+    # identity and quality are computed once and carried alongside it.
+    deduped: dict[tuple[str, str, str, float], tuple[tuple[float, float, float], dict[str, Any]]] = {}
     for p in eligible:
         key = _pick_identity(p)
+        quality = _row_quality(p)
         cur = deduped.get(key)
-        if cur is None or _row_quality(p) > _row_quality(cur):
-            deduped[key] = p
-    eligible = list(deduped.values())
-    eligible.sort(key=_row_quality, reverse=True)
-    pool = eligible[:24]  # Keep combinatorics manageable
+        if cur is None or quality > cur[0]:
+            deduped[key] = (quality, p)
+    ranked = sorted(deduped.items(), key=lambda kv: kv[1][0], reverse=True)[:24]  # Keep combinatorics manageable
 
     all_candidates: list[SlipCandidate] = []
+    candidate_rows: list[list[int]] = []
+    slip_book = canonical_book or book
+    keep_per_size = max(10, top_n * 6)
+
+    # Per-leg features, computed once per candidate leg rather than per combo.
+    feats: list[tuple[float, float]] = []
+    for _, (_, p) in ranked:
+        confidence = leg_confidence_weight(p)
+        fair = no_vig_prob(p.get("sharp_odds", -110), p.get("opposing_odds"))
+        feats.append((confidence_adjusted_prob(fair, confidence), confidence))
+
+    # Slip EV rises with every leg's probability (product for power, mean for
+    # flex), so the best slips are built from the most likely legs. Trim to
+    # those before enumerating; flex keeps a little more room for variety.
+    max_size = min(max(slip_sizes, default=6), 6)
+    flex_mode = _payout_spec(slip_book, mode, max_size)[0]
+    pool_limit = 18 if flex_mode else max(3 * max_size, 12)
+    if len(ranked) > pool_limit:
+        keep = sorted(sorted(range(len(ranked)), key=lambda i: feats[i][0], reverse=True)[:pool_limit])
+        ranked = [ranked[i] for i in keep]
+        feats = [feats[i] for i in keep]
+    pool = [p for _, (_, p) in ranked]
+    legs = [PoolLeg.from_row(p, key) for key, (_, p) in ranked]
+    leg_prob = np.array([f[0] for f in feats], dtype=np.float64)
+    conf = np.array([f[1] for f in feats], dtype=np.float64)
+    name_index: dict[str, int] = {}
+    name_ids = np.array(
+        [name_index.setdefault(leg.identity[0], len(name_index)) for leg in legs],
+        dtype=np.int32,
+    )
 
+    # Only the per-size survivors become SlipCandidate objects; their numeric
+    # fields come straight from the pool arrays.
     for size in slip_sizes:
         if len(pool) < size or size > 6:
             continue
-
-        size_candidates: list[SlipCandidate] = []
-        combo_seen: set[tuple[tuple[str, str, str, float], ...]] = set()
-        for combo in combinations(pool, size):
-            player_names = [p.get("player_name", "").strip().lower() for p in combo]
-            if len(player_names) != len(set(player_names)):
-                continue
-            combo_key = tuple(sorted(_pick_identity(p) for p in combo))
-            if combo_key in combo_seen:
-                continue
-            combo_seen.add(combo_key)
-            candidate = calculate_slip_ev(list(combo), size, book=canonical_book or book, mode=mode)
-            size_candidates.append(candidate)
-        if size_candidates:
-            size_candidates.sort(key=lambda c: c.expected_value, reverse=True)
-            all_candidates.extend(size_candidates[: max(10, top_n * 6)])
+        rows, ev = _evaluate_size(leg_prob, name_ids, size, slip_book, mode, keep_per_size)
+        if not len(rows):
+            continue
+        display_mult = _payout_spec(slip_book, mode, size)[2]
+        breakeven_prob = 1.0 / display_mult if display_mult > 0 else 1.0
+        win_prob = leg_prob[rows].prod(axis=1)
+        combined_edge = (win_prob - breakeven_prob) * 100.0
+        avg_conf = conf[rows].mean(axis=1)
+        for row, row_ev, row_win, row_edge, row_conf in zip(
+            rows.tolist(), ev.tolist(), win_prob.tolist(), combined_edge.tolist(), avg_conf.tolist()
+        ):
+            candidate_rows.append(row)
+            all_candidates.append(
+                SlipCandidate(
+                    players=[pool[i] for i in row],
+                    combined_edge=row_edge,
+                    estimated_win_prob=row_win,
+                    expected_value=row_ev,
+                    payout_multiplier=display_mult,
+                    avg_leg_confidence=row_conf,
+                    mode=mode,
+                    book=slip_book,
+                )
+            )
 
     if not all_candidates:
         return []
 
-    all_candidates.sort(key=lambda c: c.expected_value, reverse=True)
-    selected: list[SlipCandidate] = []
-    selected_sets: list[set[tuple[str, str, str, float]]] = []
-    for cand in all_candidates:
-        sig = {_pick_identity(p) for p in cand.players}
-        if any(_overlap_ratio(sig, prev) > 0.82 for prev in selected_sets):
+    # Rank lazily: pop candidates best-first (ties in generation order) and stop
+    # as soon as top_n survive the overlap filter, instead of sorting them all.
+    ranking = [(-c.expected_value, i) for i, c in enumerate(all_candidates)]
+    heapq.heapify(ranking)
+    selected: list[int] = []
+    selected_sizes: list[int] = []
+    postings: dict[tuple[str, str, str, float], list[int]] = {}
+    while ranking:
+        _, i = heapq.heappop(ranking)
+        sig = frozenset(legs[j].identity for j in candidate_rows[i])
+        if sig and _max_overlap_ratio(sig, postings, selected_sizes) > _MAX_SLIP_OVERLAP:
             continue
-        selected.append(cand)
-        selected_sets.append(sig)
+        for ident in sig:
+            postings.setdefault(ident, []).append(len(selected))
+        selected.append(i)
+        selected_sizes.append(len(sig))
         if len(selected) >= top_n:
             break
     if not selected:
-        selected = all_candidates[:top_n]
+        selected = heapq.nlargest(top_n, range(len(all_candidates)), key=lambda i: all_candidates[i].expected_value)
 
     # Serialize
     results = []
-    for slip in selected:
+    for i in selected:
+        slip = all_candidates[i]
         size = len(slip.players)
         results.append({
             "rank": len(results) + 1,
             "slip_size": size,
             "book": canonical_book or book,
             "mode": mode,
-            "players": [
-                {
-                    "player_name": p.get("player_name", "Unknown"),
-                    "market": p.get("market", "unknown"),
-                    "line": p.get("line", 0),
-                    "side": p.get("side", "over"),
-                    "edge_pct": p.get("edge_pct", 0),
-                }
-                for p in slip.players
-            ],
+            "players": [legs[j].to_dict() for j in candidate_rows[i]],
             "combined_edge_pct": round(slip.combined_edge, 2),
             "win_probability_pct": round(slip.estimated_win_prob * 100, 2),
             "payout_multiplier": slip.payout_multiplier,
@@ -6,8 +6,12 @@ This module implements the core "Blind Proxy" algorithm for finding +EV DFS play
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from app.core import get_settings
 
+from .odds_math import american_to_implied, american_to_implied_vec
+
 
 @dataclass
 class PropOpportunity:
@@ -29,21 +33,6 @@ class PropOpportunity:
     vig_pct: float | None = None  # Bookmaker vig percentage
 
 
-def american_to_implied(odds: int) -> float:
-    """
-    Convert American odds to implied probability.
-    
-    Examples:
-        -140 -> 0.583 (58.3%)
-        +120 -> 0.455 (45.5%)
-        -110 -> 0.524 (52.4%)
-    """
-    if odds < 0:
-        return abs(odds) / (abs(odds) + 100)
-    else:
-        return 100 / (odds + 100)
-
-
 def calculate_edge(
     sharp_odds: int,
     fixed_implied_prob: Optional[float] = None,
@@ -107,6 +96,41 @@ def calculate_edge(
     return result
 
 
+def _edge_arrays(
+    sharp_odds: np.ndarray,
+    opposing_odds: np.ndarray,
+    fixed_implied_prob: float,
+    assumed_vig: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of calculate_edge for the batch scanner.
+
+    Rows with opposing odds are devigged multiplicatively against both sides;
+    rows without them scale out assumed_vig (see calculate_edge). Single
+    props stay on calculate_edge's scalar math, which is far cheaper than
+    building one-element arrays.
+
+    Args:
+        sharp_odds: American odds from the sharp book
+        opposing_odds: American odds for the other side, NaN where unknown
+        fixed_implied_prob: Implied probability of the DFS payout
+        assumed_vig: Fraction of vig to remove when opposing odds are unknown
+
+    Returns:
+        (sharp_prob, opposing_prob, fair_prob, vig_pct, edge) arrays;
+        opposing_prob is NaN where opposing odds are unknown
+    """
+    has_opp = ~np.isnan(opposing_odds)
+    sharp_p = american_to_implied_vec(sharp_odds)
+    opp_p = np.where(has_opp, american_to_implied_vec(np.where(has_opp, opposing_odds, -110.0)), np.nan)
+    # Total implied > 1.0 due to vig; NaN on single-side rows
+    total_p = sharp_p + opp_p
+    assumed_total = 1.0 + max(0.0, float(assumed_vig))
+    fair_p = np.where(has_opp, sharp_p / total_p, sharp_p / assumed_total)
+    vig_pct = np.where(has_opp, (total_p - 1.0) * 100, assumed_vig * 100)
+    return sharp_p, opp_p, fair_p, vig_pct, fair_p - fixed_implied_prob
+
+
 def evaluate_prop(
     player_id: str,
     player_name: str,
@@ -158,7 +182,8 @@ def evaluate_prop(
 async def scan_for_opportunities(
     trending_players: list[dict],
     player_metadata: dict,
-    prop_odds_data: list[dict]
+    prop_odds_data: list[dict],
+    min_edge: float | None = None,
 ) -> list[PropOpportunity]:
     """
     Main scanning function that combines trending data with prop odds.
@@ -167,37 +192,77 @@ async def scan_for_opportunities(
         trending_players: List from Sleeper trending endpoint
         player_metadata: Full player data from Sleeper
         prop_odds_data: Prop odds from PropOdds API
+        min_edge: Optional edge floor; rows below it are dropped before
+            PropOpportunity objects are built
         
     Returns:
         List of PropOpportunity sorted by edge (highest first)
     """
-    opportunities: list[PropOpportunity] = []
-    
+    settings = get_settings()
+    fixed_prob = settings.dfs_fixed_implied_prob
+    assumed_vig = 0.05
+
     # Build a map of player_id -> player_name
     player_names = {
         pid: f"{data.get('first_name', '')} {data.get('last_name', '')}"
         for pid, data in player_metadata.items()
     }
-    
-    # For each trending player, check if we have prop odds
+
+    # Index props by lowercased player name once instead of rescanning per player
+    prop_index: dict[str, list[dict]] = {}
+    for prop in prop_odds_data:
+        prop_index.setdefault(prop.get("player_name", "").lower(), []).append(prop)
+
+    # For each trending player, collect matching prop odds (simplified matching logic)
+    matches: list[tuple[str, str, dict]] = []
     for trend in trending_players:
         player_id = trend.get("player_id", "")
         player_name = player_names.get(player_id, f"Unknown ({player_id})")
-        
-        # Find matching prop odds (simplified matching logic)
-        for prop in prop_odds_data:
-            if prop.get("player_name", "").lower() == player_name.lower():
-                opp = evaluate_prop(
-                    player_id=player_id,
-                    player_name=player_name,
-                    market=prop.get("market", "unknown"),
-                    line=prop.get("line", 0.0),
-                    sharp_odds=prop.get("odds", -110),
-                    sharp_book=prop.get("book", "unknown")
-                )
-                opportunities.append(opp)
-    
+
+        for prop in prop_index.get(player_name.lower(), ()):
+            matches.append((player_id, player_name, prop))
+
+    if not matches:
+        return []
+
+    # Score every match in one vectorized pass with calculate_edge's kernel.
+    sharp_odds = [prop.get("odds", -110) for _, _, prop in matches]
+    opp_odds = [prop.get("opposing_odds") for _, _, prop in matches]
+    sharp_p, opp_p, fair_p, vig_pct, edge = _edge_arrays(
+        np.array(sharp_odds, dtype=np.float64),
+        np.array([np.nan if o is None else o for o in opp_odds], dtype=np.float64),
+        fixed_prob,
+        assumed_vig,
+    )
+
+    # Only materialize rows that clear min_edge (all rows when it is None).
+    keep = np.arange(len(matches)) if min_edge is None else np.flatnonzero(edge >= min_edge)
+
+    opportunities: list[PropOpportunity] = []
+    for i in keep.tolist():
+        player_id, player_name, prop = matches[i]
+        row_edge = float(edge[i])
+        opposing = opp_odds[i]
+        opportunities.append(
+            PropOpportunity(
+                player_id=player_id,
+                player_name=player_name,
+                market=prop.get("market", "unknown"),
+                line=prop.get("line", 0.0),
+                sharp_odds=sharp_odds[i],
+                sharp_book=prop.get("book", "unknown"),
+                sharp_implied_prob=round(float(sharp_p[i]), 4),
+                fixed_implied_prob=round(fixed_prob, 4),
+                edge=round(row_edge, 4),
+                is_play=row_edge >= settings.edge_threshold,
+                opposing_odds=opposing,
+                opposing_implied_prob=round(float(opp_p[i]), 4) if opposing is not None else None,
+                fair_prob=round(float(fair_p[i]), 4),
+                vig_pct=round(float(vig_pct[i]), 2),
+            )
+        )
+
     # Sort by edge, highest first
     opportunities.sort(key=lambda x: x.edge, reverse=True)
-    
+
     return opportunities
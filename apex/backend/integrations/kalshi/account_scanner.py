@@ -1,15 +1,45 @@
 """
 Account scanner for analyzing Kalshi accounts
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+import numpy as np
 from api_client import KalshiAPI
 from bot_detector import BotDetector
-from utils import format_timestamp, format_usd, truncate_address, calculate_statistics
+from utils import TradeFeatures, extract_trade_features, format_timestamp, format_usd, run_async, truncate_address
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on fill pages pulled per account scan (1000 fills per page)
+_SCAN_MAX_FILL_PAGES = 10
+
+# Indicator bars for scores in [0, 1] (20 cells wide), built once
+_BARS = ["█" * i for i in range(21)]
+
+
+def _summary_stats(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Mean, median, min and max of a non-empty array
+    
+    A single partition places the extremes and the middle element(s), so
+    the order statistics come from one pass instead of separate
+    median/min/max reductions.
+    """
+    n = len(values)
+    lo_mid, hi_mid = (n - 1) // 2, n // 2
+    part = np.partition(values, sorted({0, lo_mid, hi_mid, n - 1}))
+    median = (part[lo_mid] + part[hi_mid]) / 2
+    return float(values.mean()), float(median), float(part[0]), float(part[-1])
+
+
+@lru_cache(maxsize=128)
+def _indicator_title(name: str) -> str:
+    return name.replace('_', ' ').title()
+
 
 class AccountScanner:
     """Scanner for analyzing Kalshi account activity"""
@@ -38,8 +68,7 @@ class AccountScanner:
         logger.info(f"Scanning account: {account_id or 'authenticated user'}")
         
         # Fetch account data
-        trades = self.api.get_account_trades(account_id)
-        positions = self.api.get_positions() if not account_id else []
+        trades, positions = self._fetch_account_data(account_id)
         
         if not trades:
             return {
@@ -47,11 +76,14 @@ class AccountScanner:
                 'account_id': account_id
             }
         
+        # Extract per-trade columns once for both bot detection and stats
+        features = extract_trade_features(trades)
+        
         # Run bot detection
-        bot_analysis = self.bot_detector.analyze_account(trades, positions)
+        bot_analysis = self.bot_detector.analyze_account(trades, positions, features=features)
         
         # Calculate trading statistics
-        trade_stats = self._calculate_trade_stats(trades)
+        trade_stats = self._calculate_trade_stats(trades, features)
         
         # Calculate position statistics if available
         position_stats = self._calculate_position_stats(positions) if positions else {}
@@ -73,6 +105,33 @@ class AccountScanner:
         
         return analysis
     
+    def _fetch_account_data(self, account_id: str = None):
+        """Fetch trades and positions, concurrently when no event loop is running"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_async(self._fetch_account_data_async(account_id))
+        
+        # Called from inside an event loop: fall back to sync requests
+        trades = [
+            trade
+            for page in self.api.iter_account_trades(account_id, max_pages=_SCAN_MAX_FILL_PAGES)
+            for trade in page
+        ]
+        positions = self.api.get_positions() if not account_id else []
+        return trades, positions
+    
+    async def _fetch_account_data_async(self, account_id: str = None):
+        async with self.api.async_session():
+            if account_id:
+                trades = await self.api.get_account_trades_async(account_id, max_pages=_SCAN_MAX_FILL_PAGES)
+                return trades, []
+            trades, positions = await asyncio.gather(
+                self.api.get_account_trades_async(max_pages=_SCAN_MAX_FILL_PAGES),
+                self.api.get_positions_async()
+            )
+        return trades, positions
+    
     def scan_top_traders(self, limit: int = 50) -> List[Dict]:
         """
         Scan top traders for bot activity
@@ -89,61 +148,62 @@ class AccountScanner:
         logger.warning("This feature requires account IDs to be provided manually")
         return []
     
-    def _calculate_trade_stats(self, trades: List[Dict]) -> Dict:
+    def _calculate_trade_stats(self, trades: List[Dict],
+                               features: Optional[TradeFeatures] = None) -> Dict:
         """Calculate trading statistics"""
         if not trades:
             return {}
         
-        # Extract trade data
-        sizes = []
-        prices = []
-        timestamps = []
-        tickers = []
-        
-        for trade in trades:
-            size = trade.get('count', trade.get('quantity', 0))
-            if size > 0:
-                sizes.append(size)
-            
-            price = trade.get('yes_price', trade.get('no_price', trade.get('price', 0)))
-            if price > 0:
-                prices.append(price / 100)  # Convert cents to dollars
-            
-            ts = trade.get('created_time', trade.get('timestamp'))
-            if ts:
-                timestamps.append(ts)
-            
-            ticker = trade.get('ticker', '')
-            if ticker:
-                tickers.append(ticker)
-        
-        # Calculate statistics
+        # Per-trade arrays stay aligned by trade (0 marks a missing size or price)
+        if features is None:
+            features = extract_trade_features(trades)
+        n = len(trades)
+        trade_sizes = features.sizes
+        trade_prices = features.prices / 100  # Convert cents to dollars
+        has_size = trade_sizes > 0
+        has_price = trade_prices > 0
+        sizes = trade_sizes[has_size]
+        prices = trade_prices[has_price]
+        timestamps = [ts for ts in features.timestamps if ts]
+        tickers = set(features.tickers)
+        tickers.discard('')
+        
+        # Calculate statistics (volume only counts trades with both a size and a price)
+        priced = has_size & has_price
         stats = {
-            'total_trades': len(trades),
-            'unique_markets': len(set(tickers)) if tickers else 0,
-            'total_volume': sum(s * p for s, p in zip(sizes[:len(prices)], prices)) if sizes and prices else 0
+            'total_trades': n,
+            'unique_markets': len(tickers),
+            'total_volume': float(np.dot(trade_sizes[priced], trade_prices[priced])) if priced.any() else 0
         }
         
-        if sizes:
-            size_stats = calculate_statistics(sizes)
+        if len(sizes):
+            mean, median, lo, hi = _summary_stats(sizes)
             stats.update({
-                'avg_size': size_stats['mean'],
-                'median_size': size_stats['median'],
-                'min_size': size_stats['min'],
-                'max_size': size_stats['max']
+                'avg_size': mean,
+                'median_size': median,
+                'min_size': lo,
+                'max_size': hi
             })
         
-        if prices:
-            price_stats = calculate_statistics(prices)
+        if len(prices):
+            mean, median, _, _ = _summary_stats(prices)
             stats.update({
-                'avg_price': price_stats['mean'],
-                'median_price': price_stats['median']
+                'avg_price': mean,
+                'median_price': median
             })
         
         if len(timestamps) >= 2:
-            # Calculate time span
-            first_trade = min(timestamps) if isinstance(timestamps[0], (int, float)) else timestamps[-1]
-            last_trade = max(timestamps) if isinstance(timestamps[0], (int, float)) else timestamps[0]
+            # Calculate time span (numeric timestamps: one pass tracking both ends;
+            # ISO strings arrive newest first)
+            if isinstance(timestamps[0], (int, float)):
+                first_trade = last_trade = timestamps[0]
+                for ts in timestamps:
+                    if ts < first_trade:
+                        first_trade = ts
+                    elif ts > last_trade:
+                        last_trade = ts
+            else:
+                first_trade, last_trade = timestamps[-1], timestamps[0]
             stats['first_trade'] = first_trade
             stats['last_trade'] = last_trade
         
@@ -154,48 +214,45 @@ class AccountScanner:
         if not positions:
             return {}
         
-        total_value = 0
-        total_pnl = 0
+        n = len(positions)
         
-        for pos in positions:
-            value = pos.get('position', 0) * pos.get('market_price', 0) / 100
-            total_value += value
-            total_pnl += pos.get('realized_pnl', 0) + pos.get('unrealized_pnl', 0)
+        def column(key: str) -> np.ndarray:
+            return np.fromiter((pos.get(key, 0) or 0 for pos in positions), dtype=np.float64, count=n)
+        
+        contracts = column('position')
+        market_prices = column('market_price')
+        pnl = column('realized_pnl') + column('unrealized_pnl')
         
         return {
-            'total_positions': len(positions),
-            'total_value': total_value,
-            'total_pnl': total_pnl
+            'total_positions': n,
+            'total_value': float(np.dot(contracts, market_prices)) / 100,
+            'total_pnl': float(pnl.sum())
         }
     
     def _format_trades(self, trades: List[Dict]) -> List[Dict]:
         """Format trades for display"""
-        formatted = []
-        
-        for trade in trades:
-            formatted.append({
+        return [
+            {
                 'ticker': trade.get('ticker', 'N/A'),
                 'side': trade.get('side', 'N/A'),
                 'count': trade.get('count', 0),
-                'price': trade.get('yes_price', trade.get('no_price', 0)),
-                'timestamp': trade.get('created_time', trade.get('timestamp', 'N/A'))
-            })
-        
-        return formatted
+                'price': trade['yes_price'] if 'yes_price' in trade else trade.get('no_price', 0),
+                'timestamp': trade['created_time'] if 'created_time' in trade else trade.get('timestamp', 'N/A')
+            }
+            for trade in trades
+        ]
     
     def _format_positions(self, positions: List[Dict]) -> List[Dict]:
         """Format positions for display"""
-        formatted = []
-        
-        for pos in positions:
-            formatted.append({
+        return [
+            {
                 'ticker': pos.get('ticker', 'N/A'),
                 'position': pos.get('position', 0),
                 'market_price': pos.get('market_price', 0),
                 'unrealized_pnl': pos.get('unrealized_pnl', 0)
-            })
-        
-        return formatted
+            }
+            for pos in positions
+        ]
     
     def generate_report(self, analysis: Dict) -> str:
         """
@@ -249,10 +306,10 @@ class AccountScanner:
             lines.append("-" * 60)
             
             indicators = bot_analysis.get('indicators', {})
-            for name, score in sorted(indicators.items(), key=lambda x: x[1], reverse=True):
+            for name, score in sorted(indicators.items(), key=itemgetter(1), reverse=True):
                 bar_length = int(score * 20)
-                bar = "█" * bar_length
-                lines.append(f"{name.replace('_', ' ').title():.<30} {score:.2f} {bar}")
+                bar = _BARS[bar_length] if 0 <= bar_length <= 20 else "█" * bar_length
+                lines.append(f"{_indicator_title(name):.<30} {score:.2f} {bar}")
             
             lines.append("")
         
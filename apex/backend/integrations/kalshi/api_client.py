@@ -2,22 +2,79 @@
 Unified API client for Kalshi
 Wraps Kalshi API with RSA signature-based authentication
 """
-import requests
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import httpx
 import logging
+import orjson
 import base64
 import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.hazmat.backends import default_backend
 from config import Config
-from utils import RateLimiter
+from utils import AsyncRateLimiter, TradeFeatures, extract_trade_features, parse_orderbook_levels, run_async
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of recent request signatures kept per client
+_SIG_CACHE_SIZE = 64
+
+# Connection pool shared by the sync client and each async session
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Async client of the innermost async_session in the current context. One
+# KalshiAPI is shared across threads that each run their own event loop, so
+# the session client must follow the caller's context, not the instance
+_session_client: contextvars.ContextVar[Optional[httpx.AsyncClient]] = contextvars.ContextVar(
+    'kalshi_session_client', default=None
+)
+
+
+def _require_auth(action: str, empty: Optional[Callable[[], Any]] = None,
+                  empty_for: Optional[Callable[..., Any]] = None):
+    """
+    Guard an authenticated endpoint behind the client's auth state
+    
+    Args:
+        action: Description used in the log message, e.g. "place orders"
+        empty: Factory for the value returned when unauthenticated
+               (None returns None)
+        empty_for: Like empty, but called with the guarded call's arguments,
+                   for results shaped by the input
+    """
+    def decorator(fn):
+        def fail(args, kwargs):
+            logger.error(f"Authentication required to {action}")
+            if empty_for is not None:
+                return empty_for(*args, **kwargs)
+            return empty() if empty is not None else None
+        
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                if not self.token:
+                    return fail(args, kwargs)
+                return await fn(self, *args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if not self.token:
+                return fail(args, kwargs)
+            return fn(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class KalshiAPI:
     """Unified Kalshi API client with RSA authentication"""
@@ -33,19 +90,38 @@ class KalshiAPI:
         self.api_key_id = api_key_id or Config.KALSHI_API_KEY_ID
         private_key_input = private_key or Config.KALSHI_PRIVATE_KEY
         self.api_url = Config.get_api_url()
+        # Path prefix of every signed request (e.g. /trade-api/v2), parsed once
+        self._api_base_path = urlparse(self.api_url).path
         self.token = None  # Back-compat flag used by legacy auth checks.
         
-        # Session for connection pooling
-        self.session = requests.Session()
+        # Persistent HTTP/2 client; keep-alive connections are reused across
+        # every strategy sharing this API instance
+        self._client = httpx.Client(http2=True, timeout=10, limits=_HTTP_LIMITS)
+        
+        # Recent signatures keyed by (timestamp, method, path); requests for the
+        # same path within one millisecond can reuse a signature
+        self._sig_cache: Dict[tuple, str] = {}
+        self._sig_cache_lock = threading.Lock()
         
         # Rate limiter
-        self.rate_limiter = RateLimiter(calls_per_second=Config.API_CALLS_PER_SECOND)
+        self.rate_limiter = AsyncRateLimiter(calls_per_second=Config.API_CALLS_PER_SECOND)
+        
+        # Signing parameters are immutable, so build them once per client
+        # (Kalshi expects RSA-PSS with SHA256 and DIGEST_LENGTH salt)
+        self._hash_algo = hashes.SHA256()
+        self._pss_padding = padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.DIGEST_LENGTH
+        )
         
         # Load private key
         self.private_key_obj = None
+        self._sign: Optional[Callable[[bytes], bytes]] = None
         if private_key_input:
             try:
-                self.private_key_obj = self._load_private_key(private_key_input)
+                private_key_obj = self._load_private_key(private_key_input)
+                self._sign = self._make_signer(private_key_obj)
+                self.private_key_obj = private_key_obj
                 self.token = "rsa_auth"
                 logger.info("Kalshi API client initialized successfully with RSA authentication")
             except Exception as e:
@@ -82,6 +158,28 @@ class KalshiAPI:
             logger.error(f"Failed to parse private key: {e}")
             raise
     
+    def _make_signer(self, private_key) -> Callable[[bytes], bytes]:
+        """
+        Bind the RSA-PSS/SHA256 signing routine for the loaded key
+        
+        Kalshi only issues RSA API keys, so any other key type is rejected
+        rather than producing signatures every request would fail on.
+        
+        Args:
+            private_key: Loaded private key object
+        
+        Returns:
+            Callable mapping message bytes to raw signature bytes
+        
+        Raises:
+            ValueError: If the key is not an RSA private key
+        """
+        if not isinstance(private_key, rsa.RSAPrivateKey):
+            raise ValueError(
+                f"Kalshi API keys must be RSA, got {type(private_key).__name__}"
+            )
+        return lambda message: private_key.sign(message, self._pss_padding, self._hash_algo)
+    
     def _generate_signature(self, timestamp: str, method: str, path: str) -> str:
         """
         Generate KALSHI-ACCESS-SIGNATURE for authentication
@@ -94,22 +192,14 @@ class KalshiAPI:
         Returns:
             Base64-encoded signature
         """
-        if not self.private_key_obj:
+        if not self._sign:
             raise ValueError("Private key not loaded")
         
         # Create message to sign: timestamp + method + full path (no query params)
         message = f"{timestamp}{method.upper()}{path.split('?')[0]}"
         message_bytes = message.encode('utf-8')
         
-        # Sign with RSA-PSS and SHA256 (Kalshi expects DIGEST_LENGTH salt)
-        signature = self.private_key_obj.sign(
-            message_bytes,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH
-            ),
-            hashes.SHA256()
-        )
+        signature = self._sign(message_bytes)
         
         # Base64 encode
         return base64.b64encode(signature).decode('utf-8')
@@ -128,11 +218,19 @@ class KalshiAPI:
         if not self.api_key_id or not self.private_key_obj:
             return {}
         
-        # Generate timestamp in milliseconds
-        timestamp = str(int(time.time() * 1000))
+        # Generate timestamp in milliseconds (integer clock, no float round trip)
+        timestamp = f"{time.time_ns() // 1_000_000}"
         
-        # Generate signature
-        signature = self._generate_signature(timestamp, method, path)
+        # Generate signature (or reuse one made for this exact message)
+        cache_key = (timestamp, method, path)
+        with self._sig_cache_lock:
+            signature = self._sig_cache.get(cache_key)
+        if signature is None:
+            signature = self._generate_signature(timestamp, method, path)
+            with self._sig_cache_lock:
+                if len(self._sig_cache) >= _SIG_CACHE_SIZE:
+                    self._sig_cache.pop(next(iter(self._sig_cache)))
+                self._sig_cache[cache_key] = signature
         
         return {
             'KALSHI-ACCESS-KEY': self.api_key_id,
@@ -159,26 +257,80 @@ class KalshiAPI:
         url = f"{self.api_url}{endpoint}"
         
         # Sign the exact request path Kalshi expects (e.g. /trade-api/v2/portfolio/balance)
-        parsed = urlparse(url)
-        path = parsed.path
+        path = self._api_base_path + endpoint
         
         # Get authentication headers
         headers = self._get_auth_headers(method.upper(), path)
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers=headers,
-                timeout=10
+            response = self._client.request(
+                method, url, params=params, json=json, headers=headers
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             logger.error(f"API request failed: {method} {endpoint} - {e}")
-            if hasattr(e, 'response') and e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
+                logger.error(f"Response: {e.response.text}")
+            return None
+    
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self._client.close()
+    
+    @contextlib.asynccontextmanager
+    async def async_session(self):
+        """
+        Share one HTTP/2 client across the async requests made inside the block
+        
+        Concurrent calls issued within the session are multiplexed over a
+        single connection instead of each opening their own. The client is
+        bound to the caller's context, so sessions opened from different
+        threads on the same instance don't see each other's client.
+        """
+        async with httpx.AsyncClient(http2=True, timeout=10, limits=_HTTP_LIMITS) as client:
+            token = _session_client.set(client)
+            try:
+                yield self
+            finally:
+                _session_client.reset(token)
+    
+    async def _make_request_async(self, method: str, endpoint: str,
+                                  params: Dict = None, json: Dict = None) -> Any:
+        """
+        Async counterpart of _make_request with the same signing and rate limiting
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            json: JSON body
+        
+        Returns:
+            Response JSON data
+        """
+        await self.rate_limiter.acquire()
+        
+        url = f"{self.api_url}{endpoint}"
+        path = self._api_base_path + endpoint
+        headers = self._get_auth_headers(method.upper(), path)
+        
+        try:
+            session_client = _session_client.get()
+            if session_client is not None:
+                response = await session_client.request(
+                    method, url, params=params, json=json, headers=headers
+                )
+            else:
+                async with httpx.AsyncClient(http2=True, timeout=10) as client:
+                    response = await client.request(
+                        method, url, params=params, json=json, headers=headers
+                    )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error(f"API request failed: {method} {endpoint} - {e}")
+            if isinstance(e, httpx.HTTPStatusError):
                 logger.error(f"Response: {e.response.text}")
             return None
     
@@ -249,9 +401,51 @@ class KalshiAPI:
             ticker: Market ticker
         
         Returns:
-            Orderbook data with bids and asks
+            Orderbook response with each side's orders as utils.Level objects
         """
-        return self._make_request('GET', f'/markets/{ticker}/orderbook')
+        return self._parse_orderbook(self._make_request('GET', f'/markets/{ticker}/orderbook'))
+    
+    async def get_orderbook_async(self, ticker: str) -> Optional[Dict]:
+        """Async variant of get_orderbook"""
+        return self._parse_orderbook(await self._make_request_async('GET', f'/markets/{ticker}/orderbook'))
+    
+    @staticmethod
+    def _parse_orderbook(result: Any) -> Optional[Dict]:
+        """Convert the YES/NO sides of an orderbook response to Level lists once, at parse time"""
+        if not result:
+            return result
+        orderbook = result.get('orderbook')
+        if orderbook:
+            result['orderbook'] = {
+                **orderbook,
+                'yes': parse_orderbook_levels(orderbook.get('yes')),
+                'no': parse_orderbook_levels(orderbook.get('no')),
+            }
+        return result
+    
+    def get_orderbooks(self, tickers: List[str]) -> List[Optional[Dict]]:
+        """
+        Get orderbooks for several markets in one batch
+        
+        Args:
+            tickers: Market tickers
+        
+        Returns:
+            Orderbook responses aligned with `tickers` (None where a fetch failed)
+        """
+        return run_async(self.get_orderbooks_async(tickers))
+    
+    async def get_orderbooks_async(self, tickers: List[str]) -> List[Optional[Dict]]:
+        """
+        Async variant of get_orderbooks
+        
+        Kalshi has no bulk orderbook endpoint, so the requests are issued
+        together and multiplexed over the session's HTTP/2 connection.
+        """
+        if _session_client.get() is None:
+            async with self.async_session():
+                return await self.get_orderbooks_async(tickers)
+        return list(await asyncio.gather(*(self.get_orderbook_async(t) for t in tickers)))
     
     def get_trades(self, ticker: str = None, limit: int = 100) -> List[Dict]:
         """
@@ -277,6 +471,29 @@ class KalshiAPI:
     
     # Account Analysis Methods
     
+    @staticmethod
+    def _fills_params(member_id: Optional[str], limit: int, cursor: Optional[str]) -> Dict:
+        params = {'limit': limit}
+        
+        if member_id:
+            params['member_id'] = member_id
+        if cursor:
+            params['cursor'] = cursor
+        return params
+    
+    @staticmethod
+    def _parse_fills_page(result: Any) -> Tuple[List[Dict], Optional[str]]:
+        if result and 'fills' in result:
+            return result['fills'], result.get('cursor') or None
+        return [], None
+    
+    def _get_fills_page(self, member_id: str = None, limit: int = 1000,
+                        cursor: str = None) -> Tuple[List[Dict], Optional[str]]:
+        """Fetch one page of fills and the cursor for the next page (None when done)"""
+        result = self._make_request('GET', '/portfolio/fills',
+                                    params=self._fills_params(member_id, limit, cursor))
+        return self._parse_fills_page(result)
+    
     def get_account_trades(self, member_id: str = None, limit: int = 1000) -> List[Dict]:
         """
         Get trade history for an account
@@ -295,17 +512,82 @@ class KalshiAPI:
             logger.warning("Cannot fetch other users' trades without authentication")
             return []
         
-        params = {'limit': limit}
+        return self._get_fills_page(member_id, limit)[0]
+    
+    def get_account_trades_soa(self, member_id: str = None, limit: int = 1000) -> TradeFeatures:
+        """
+        Get trade history as aligned per-field arrays
         
-        if member_id:
-            params['member_id'] = member_id
+        Fills are converted from dicts once, here, so analysis code
+        (e.g. BotDetector.analyze_account(None, features=...)) works on
+        NumPy columns without touching the per-fill dicts again.
         
-        result = self._make_request('GET', '/portfolio/fills', params=params)
+        Args:
+            member_id: Member ID (uses authenticated user if not provided)
+            limit: Maximum number of trades to return
         
-        if result and 'fills' in result:
-            return result['fills']
-        return []
+        Returns:
+            TradeFeatures with sizes, prices (cents), timestamps and tickers
+        """
+        return extract_trade_features(self.get_account_trades(member_id, limit))
     
+    def iter_account_trades(self, member_id: str = None, page_size: int = 1000,
+                            max_pages: int = None) -> Iterator[List[Dict]]:
+        """
+        Yield pages of account fills, following the pagination cursor
+        
+        The next page is requested in the background while the caller
+        processes the current one.
+        
+        Args:
+            member_id: Member ID (uses authenticated user if not provided)
+            page_size: Fills requested per page
+            max_pages: Stop after this many pages (no limit if None)
+        
+        Yields:
+            Lists of trade dictionaries, one per page
+        """
+        if not self.token and member_id:
+            logger.warning("Cannot fetch other users' trades without authentication")
+            return
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._get_fills_page, member_id, page_size, None)
+            pages = 0
+            while pending is not None:
+                fills, cursor = pending.result()
+                pages += 1
+                more = bool(fills and cursor) and (max_pages is None or pages < max_pages)
+                pending = executor.submit(self._get_fills_page, member_id, page_size, cursor) if more else None
+                if fills:
+                    yield fills
+    
+    async def get_account_trades_async(self, member_id: str = None, limit: int = 1000,
+                                       max_pages: int = 1) -> List[Dict]:
+        """
+        Async variant of get_account_trades
+        
+        Follows the pagination cursor for up to `max_pages` pages of `limit`
+        fills each (None for no limit).
+        """
+        if not self.token and member_id:
+            logger.warning("Cannot fetch other users' trades without authentication")
+            return []
+        
+        trades: List[Dict] = []
+        cursor = None
+        pages = 0
+        while True:
+            result = await self._make_request_async(
+                'GET', '/portfolio/fills', params=self._fills_params(member_id, limit, cursor)
+            )
+            fills, cursor = self._parse_fills_page(result)
+            trades.extend(fills)
+            pages += 1
+            if not (fills and cursor) or (max_pages is not None and pages >= max_pages):
+                return trades
+    
+    @_require_auth("get portfolio")
     def get_portfolio(self) -> Optional[Dict]:
         """
         Get current portfolio for authenticated user
@@ -313,12 +595,9 @@ class KalshiAPI:
         Returns:
             Portfolio data with positions and balance
         """
-        if not self.token:
-            logger.error("Authentication required to get portfolio")
-            return None
-        
         return self._make_request('GET', '/portfolio')
     
+    @_require_auth("get positions", empty=list)
     def get_positions(self) -> List[Dict]:
         """
         Get current positions for authenticated user
@@ -326,16 +605,22 @@ class KalshiAPI:
         Returns:
             List of position dictionaries
         """
-        if not self.token:
-            logger.error("Authentication required to get positions")
-            return []
-        
         result = self._make_request('GET', '/portfolio/positions')
         
         if result and 'positions' in result:
             return result['positions']
         return []
     
+    @_require_auth("get positions", empty=list)
+    async def get_positions_async(self) -> List[Dict]:
+        """Async variant of get_positions"""
+        result = await self._make_request_async('GET', '/portfolio/positions')
+        
+        if result and 'positions' in result:
+            return result['positions']
+        return []
+    
+    @_require_auth("get balance")
     def get_balance(self) -> Optional[Dict]:
         """
         Get account balance
@@ -343,14 +628,11 @@ class KalshiAPI:
         Returns:
             Balance information
         """
-        if not self.token:
-            logger.error("Authentication required to get balance")
-            return None
-        
         return self._make_request('GET', '/portfolio/balance')
     
     # Trading Methods
     
+    @_require_auth("place orders")
     def place_order(self, ticker: str, side: str, quantity: int, 
                    order_type: str = 'limit', price: int = None,
                    expiration_ts: int = None) -> Optional[Dict]:
@@ -368,10 +650,6 @@ class KalshiAPI:
         Returns:
             Order response or None
         """
-        if not self.token:
-            logger.error("Authentication required to place orders")
-            return None
-        
         if not Config.ENABLE_TRADING:
             logger.warning(
                 f"DRY RUN: Would place {side.upper()} order for {quantity} "
@@ -385,6 +663,20 @@ class KalshiAPI:
                 'price': price
             }
         
+        payload = self._order_payload(ticker, side, quantity, order_type, price, expiration_ts)
+        
+        try:
+            result = self._make_request('POST', '/portfolio/orders', json=payload)
+            logger.info(f"Order placed: {result}")
+            return result
+        except Exception as e:
+            logger.error(f"Failed to place order: {e}")
+            return None
+    
+    @staticmethod
+    def _order_payload(ticker: str, side: str, quantity: int, order_type: str = 'limit',
+                       price: int = None, expiration_ts: int = None) -> Dict:
+        """Build the create-order request body for one order"""
         payload = {
             'ticker': ticker,
             'action': 'buy',  # Always 'buy' for Kalshi
@@ -400,14 +692,97 @@ class KalshiAPI:
         if expiration_ts:
             payload['expiration_ts'] = expiration_ts
         
-        try:
-            result = self._make_request('POST', '/portfolio/orders', json=payload)
-            logger.info(f"Order placed: {result}")
-            return result
-        except Exception as e:
-            logger.error(f"Failed to place order: {e}")
-            return None
+        return payload
     
+    @_require_auth("place orders", empty_for=lambda orders: [None] * len(orders))
+    def place_orders_batch(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Place several orders in a single request
+        
+        Kalshi accepts or rejects each order of a batch independently, so
+        callers still need to handle partial fills of the batch.
+        
+        Args:
+            orders: place_order keyword arguments, one dict per order
+        
+        Returns:
+            Placed orders aligned with `orders` (None where an order was rejected)
+        """
+        if not Config.ENABLE_TRADING:
+            logger.warning(f"DRY RUN: Would place a batch of {len(orders)} orders")
+            return [
+                {
+                    'status': 'dry_run',
+                    'ticker': order['ticker'],
+                    'side': order['side'],
+                    'quantity': order['quantity'],
+                    'price': order.get('price')
+                }
+                for order in orders
+            ]
+        
+        payload = {'orders': [self._order_payload(**order) for order in orders]}
+        result = self._make_request('POST', '/portfolio/orders/batched', json=payload)
+        entries = result.get('orders', []) if result else []
+        if len(entries) != len(orders):
+            logger.error(f"Batch order request failed: {len(entries)} of {len(orders)} orders acknowledged")
+            return [None] * len(orders)
+        
+        placed = []
+        for entry in entries:
+            if entry.get('error') or not entry.get('order'):
+                logger.error(f"Order rejected: {entry.get('error')}")
+                placed.append(None)
+            else:
+                placed.append(entry['order'])
+        logger.info(f"Batch placed: {sum(o is not None for o in placed)}/{len(orders)} orders")
+        return placed
+    
+    @_require_auth("amend orders")
+    def amend_order(self, order_id: str, ticker: str, side: str, quantity: int,
+                    price: int, order_type: str = 'limit') -> Optional[Dict]:
+        """
+        Move a resting limit order to a new price and size in place
+        
+        Args:
+            order_id: Order ID to amend
+            ticker: Market ticker of the order
+            side: 'yes' or 'no'
+            quantity: New number of contracts
+            price: New limit price in cents
+            order_type: Must be 'limit'; accepted so place_order arguments can be reused
+        
+        Returns:
+            The amended order, or None if the amendment was rejected
+        """
+        if not Config.ENABLE_TRADING:
+            logger.warning(f"DRY RUN: Would amend order {order_id} to {quantity} @ {price} cents")
+            return {'status': 'dry_run', 'order_id': order_id, 'quantity': quantity, 'price': price}
+        
+        payload = self._order_payload(ticker, side, quantity, order_type, price)
+        del payload['type']
+        result = self._make_request('POST', f'/portfolio/orders/{order_id}/amend', json=payload)
+        if result and result.get('order'):
+            return result['order']
+        return None
+    
+    def amend_orders(self, amendments: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Amend several orders concurrently over the pooled connection
+        
+        Args:
+            amendments: amend_order keyword arguments, one dict per order
+        
+        Returns:
+            Amended orders aligned with `amendments` (None where rejected)
+        """
+        if not amendments:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(amendments))) as executor:
+            return list(executor.map(lambda amendment: self.amend_order(**amendment), amendments))
+    
+    @_require_auth("cancel orders", empty=bool)
     def cancel_order(self, order_id: str) -> bool:
         """
         Cancel an order
@@ -418,10 +793,6 @@ class KalshiAPI:
         Returns:
             True if successful
         """
-        if not self.token:
-            logger.error("Authentication required to cancel orders")
-            return False
-        
         try:
             self._make_request('DELETE', f'/portfolio/orders/{order_id}')
             logger.info(f"Order cancelled: {order_id}")
@@ -430,6 +801,7 @@ class KalshiAPI:
             logger.error(f"Failed to cancel order: {e}")
             return False
     
+    @_require_auth("get open orders", empty=list)
     def get_open_orders(self) -> List[Dict]:
         """
         Get all open orders for the authenticated account
@@ -437,16 +809,13 @@ class KalshiAPI:
         Returns:
             List of open orders
         """
-        if not self.token:
-            logger.error("Authentication required to get open orders")
-            return []
-        
         result = self._make_request('GET', '/portfolio/orders')
         
         if result and 'orders' in result:
             return result['orders']
         return []
     
+    @_require_auth("cancel orders", empty=bool)
     def cancel_all_orders(self, ticker: str = None) -> bool:
         """
         Cancel all open orders, optionally filtered by ticker
@@ -457,18 +826,17 @@ class KalshiAPI:
         Returns:
             True if successful
         """
-        if not self.token:
-            logger.error("Authentication required to cancel orders")
-            return False
-        
         orders = self.get_open_orders()
         
         if ticker:
             orders = [o for o in orders if o.get('ticker') == ticker]
         
-        success = True
-        for order in orders:
-            if not self.cancel_order(order.get('order_id')):
-                success = False
+        if not orders:
+            return True
+        
+        # Cancels are independent and latency-bound, so overlap them; the
+        # shared rate limiter still caps the request rate.
+        with ThreadPoolExecutor(max_workers=min(16, len(orders))) as executor:
+            results = list(executor.map(self.cancel_order, (o.get('order_id') for o in orders)))
         
-        return success
+        return all(results)
@@ -1,19 +1,146 @@
 """
 Bot detection heuristics for analyzing Kalshi accounts
 """
+import heapq
 import logging
-from typing import Dict, List, Tuple
-from datetime import datetime, timedelta
-from collections import Counter
+import math
+from bisect import bisect_right
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import numpy as np
+import pandas as pd
 from config import Config
+from utils import TradeFeatures, extract_trade_features
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+_NS_PER_HOUR = 3600 * _NS_PER_SECOND
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+_NAT = np.iinfo(np.int64).min
+
+# Parsed-string entries kept per detector before the oldest are evicted
+_TS_CACHE_MAX = 100_000
+
+_FROMISOFORMAT = datetime.fromisoformat
+
+# Memoized analyze_account results kept per detector
+_RESULT_CACHE_MAX = 1024
+
+# Below this many sizes the CV is cheaper in pure Python than in NumPy
+_SMALL_CV_N = 32
+
+
+@dataclass(slots=True)
+class _Timeline:
+    """Parsed trade times (UTC epoch ns, trade order, unparseable ones dropped)"""
+    ns: np.ndarray
+    hour: np.ndarray
+    weekday: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.ns)
+
+
+def _datetime_to_ns(dt: datetime) -> int:
+    """Epoch nanoseconds of a datetime (naive values are read as UTC)"""
+    ts = pd.Timestamp(dt)
+    return (ts.tz_convert('UTC') if ts.tzinfo is not None else ts).as_unit('ns').value
+
+
+def _copy_result(result: Dict) -> Dict:
+    """Copy a cached analyze_account result, including its nested containers"""
+    return {
+        **result,
+        'indicators': dict(result['indicators']),
+        'top_indicators': list(result['top_indicators'])
+    }
+
+
+def _bucket(value: float, thresholds: Tuple[float, ...], scores: Tuple[Any, ...]):
+    """
+    Score lookup in an ascending threshold table
+    
+    Returns scores[i], where i is the number of thresholds <= value, so
+    len(scores) == len(thresholds) + 1. One C-level bisect instead of an
+    if/elif ladder.
+    """
+    return scores[bisect_right(thresholds, value)]
+
+
+def _size_cv(sizes: np.ndarray) -> float:
+    """
+    Coefficient of variation (population std / mean) of a non-empty array
+    
+    Below _SMALL_CV_N values a plain Python two-pass loop beats NumPy's
+    per-call overhead; larger arrays use ndarray methods (the same
+    arithmetic as np.std / np.mean without the dispatch wrappers).
+    Returns 0.0 when the mean is 0.
+    """
+    n = sizes.size
+    if n < _SMALL_CV_N:
+        values = sizes.tolist()
+        mean = sum(values) / n
+        if mean == 0:
+            return 0.0
+        return math.sqrt(sum([(x - mean) * (x - mean) for x in values]) / n) / mean
+    mean = sizes.sum() / n
+    if mean == 0:
+        return 0.0
+    dev = sizes - mean
+    return float(np.sqrt(np.square(dev).sum() / n) / mean)
+
+
+def _interval_stats(ns: np.ndarray) -> Tuple[int, int, int, float]:
+    """
+    Gaps between consecutive trade times (epoch ns, trade order)
+    
+    Returns:
+        (gaps < 1s, gaps < 5s, positive gaps, smallest positive gap in
+        seconds); zero/negative gaps are ignored and the minimum is inf
+        when there are none
+    """
+    intervals = np.diff(ns) / _NS_PER_SECOND
+    intervals = intervals[intervals > 0]
+    if not intervals.size:
+        return 0, 0, 0, float('inf')
+    return (
+        int(np.count_nonzero(intervals < 1)),
+        int(np.count_nonzero(intervals < 5)),
+        int(intervals.size),
+        float(intervals.min()),
+    )
+
 
 class BotDetector:
     """Detects automated trading bots based on account behavior"""
     
+    __slots__ = ('min_trades', 'bot_threshold', '_ts_cache', '_result_cache')
+    
+    # Indicator weights for the overall bot score (sum to 1)
+    _INDICATOR_WEIGHTS = (
+        ('frequency', 0.20),
+        ('timing', 0.20),
+        ('size_pattern', 0.15),
+        ('market_diversity', 0.15),
+        ('execution_speed', 0.20),
+        ('round_numbers', 0.10)
+    )
+    
+    # Score tables for _bucket: ascending thresholds, one more score than thresholds
+    _CONFIDENCE_T = (0.50, 0.70, 0.85)
+    _CONFIDENCE_S = ('LOW', 'MEDIUM', 'HIGH', 'VERY_HIGH')
+    _FREQ_T = (5, 10, 20, 50)  # trades/day
+    _FREQ_S = (0.2, 0.4, 0.6, 0.8, 1.0)
+    _SIZE_CV_T = (0.2, 0.5, 1.0)
+    _SIZE_CV_S = (0.9, 0.6, 0.3, 0.1)
+    _MIN_INTERVAL_T = (0.1, 1, 5)  # seconds
+    _MIN_INTERVAL_S = (1.0, 0.8, 0.5, 0.2)
+    _ROUND_RATIO_T = (0.5, 0.7, 0.9)
+    _ROUND_RATIO_S = (0.2, 0.5, 0.7, 0.9)
+    
     def __init__(self, min_trades: int = None, bot_threshold: float = None):
         """
         Initialize bot detector
@@ -24,76 +151,108 @@ class BotDetector:
         """
         self.min_trades = min_trades or Config.MIN_TRADES_FOR_ANALYSIS
         self.bot_threshold = bot_threshold or Config.BOT_SCORE_THRESHOLD
+        self._ts_cache: Dict[str, Optional[datetime]] = {}
+        self._result_cache: Dict[Tuple, Dict] = {}
+    
+    def clear_cache(self):
+        """Forget memoized analyses and parsed timestamps"""
+        self._result_cache.clear()
+        self._ts_cache.clear()
     
-    def analyze_account(self, trades: List[Dict], positions: List[Dict] = None) -> Dict:
+    def _result_key(self, trades: Optional[List[Dict]]) -> Optional[Tuple]:
+        """
+        Cheap fingerprint of a fill history for memoizing analyze_account
+        
+        Fills arrive newest first, so new activity changes the length and
+        the first trade_id. Returns None (no caching) when the fills carry
+        no trade ids to tell histories apart.
+        """
+        if not trades:
+            return None
+        first_id = trades[0].get('trade_id')
+        last_id = trades[-1].get('trade_id')
+        if first_id is None or last_id is None:
+            return None
+        return (self.min_trades, self.bot_threshold, len(trades), first_id, last_id)
+    
+    def analyze_account(self, trades: Optional[List[Dict]], positions: List[Dict] = None,
+                        features: Optional[TradeFeatures] = None) -> Dict:
         """
         Analyze account for bot-like behavior
         
         Args:
-            trades: List of trade dictionaries
+            trades: List of trade dictionaries (may be None if features is given)
             positions: List of current positions (optional)
+            features: Columns already extracted from `trades` (optional)
         
         Returns:
             Analysis results with bot score and indicators
         """
-        if len(trades) < self.min_trades:
+        total_trades = len(features) if features is not None else len(trades)
+        if total_trades < self.min_trades:
             return {
-                'error': f'Insufficient trades for analysis (need {self.min_trades}, got {len(trades)})',
+                'error': f'Insufficient trades for analysis (need {self.min_trades}, got {total_trades})',
                 'bot_score': 0,
                 'is_bot': False
             }
         
-        # Calculate individual indicators
+        # Polling the same history again reuses the previous analysis
+        key = self._result_key(trades)
+        if key is not None:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                return _copy_result(cached)
+        
+        if features is None:
+            features = extract_trade_features(trades)
+        
+        # Parse every timestamp once; the time-based indicators share it
+        timeline = self._build_timeline(features.timestamps)
+        
+        # Calculate individual indicators; ones whose minimum-data check
+        # already fails score 0.0 without being called
+        n_times = len(timeline)
+        n_sizes = int(np.count_nonzero(features.sizes > 0))
         indicators = {
-            'frequency': self._analyze_frequency(trades),
-            'timing': self._analyze_timing(trades),
-            'size_pattern': self._analyze_size_patterns(trades),
-            'market_diversity': self._analyze_market_diversity(trades),
-            'execution_speed': self._analyze_execution_speed(trades),
-            'round_numbers': self._analyze_round_numbers(trades)
+            'frequency': self._analyze_frequency(features, timeline) if n_times >= 2 else 0.0,
+            'timing': self._analyze_timing(timeline) if n_times >= 10 else 0.0,
+            'size_pattern': self._analyze_size_patterns(features) if n_sizes >= 5 else 0.0,
+            'market_diversity': self._analyze_market_diversity(features),
+            'execution_speed': self._analyze_execution_speed(timeline) if n_times >= 2 else 0.0,
+            'round_numbers': self._analyze_round_numbers(features)
         }
         
         # Calculate overall bot score (weighted average)
-        weights = {
-            'frequency': 0.20,
-            'timing': 0.20,
-            'size_pattern': 0.15,
-            'market_diversity': 0.15,
-            'execution_speed': 0.20,
-            'round_numbers': 0.10
-        }
-        
-        bot_score = sum(indicators[k] * weights[k] for k in weights)
+        bot_score = sum([indicators[k] * w for k, w in self._INDICATOR_WEIGHTS])
         
         # Determine classification
         is_bot = bot_score >= self.bot_threshold
         
         # Confidence level
-        if bot_score >= 0.85:
-            confidence = 'VERY_HIGH'
-        elif bot_score >= 0.70:
-            confidence = 'HIGH'
-        elif bot_score >= 0.50:
-            confidence = 'MEDIUM'
-        else:
-            confidence = 'LOW'
-        
-        # Identify top indicators
-        sorted_indicators = sorted(indicators.items(), key=lambda x: x[1], reverse=True)
-        top_indicators = [k for k, v in sorted_indicators[:3]]
-        
-        return {
+        confidence = _bucket(bot_score, self._CONFIDENCE_T, self._CONFIDENCE_S)
+        
+        # Identify top indicators (ties keep indicator order, as a stable sort would)
+        top_indicators = [k for k, _ in heapq.nlargest(3, indicators.items(), key=itemgetter(1))]
+        
+        result = {
             'bot_score': bot_score,
             'is_bot': is_bot,
             'confidence': confidence,
             'classification': 'LIKELY_BOT' if is_bot else 'LIKELY_HUMAN',
             'indicators': indicators,
             'top_indicators': top_indicators,
-            'total_trades': len(trades),
+            'total_trades': total_trades,
             'reason': f"Top indicators: {', '.join(top_indicators)}"
         }
+        
+        if key is not None:
+            if len(self._result_cache) >= _RESULT_CACHE_MAX:
+                del self._result_cache[next(iter(self._result_cache))]  # FIFO eviction
+            self._result_cache[key] = result
+            return _copy_result(result)
+        return result
     
-    def _analyze_frequency(self, trades: List[Dict]) -> float:
+    def _analyze_frequency(self, features: TradeFeatures, timeline: _Timeline) -> float:
         """
         Analyze trading frequency
         High-frequency trading is a bot indicator
@@ -101,39 +260,27 @@ class BotDetector:
         Returns:
             Score 0-1 (higher = more bot-like)
         """
-        if len(trades) < 2:
+        if len(features) < 2:
             return 0.0
         
         # Calculate trades per day
-        timestamps = [self._parse_timestamp(t.get('created_time', t.get('timestamp'))) 
-                     for t in trades]
-        timestamps = [ts for ts in timestamps if ts is not None]
-        
-        if len(timestamps) < 2:
+        if len(timeline) < 2:
             return 0.0
         
-        time_span_days = (max(timestamps) - min(timestamps)).total_seconds() / 86400
+        span_ns = int(timeline.ns.max()) - int(timeline.ns.min())
+        time_span_days = span_ns / _NS_PER_SECOND / 86400
         if time_span_days < 1:
             time_span_days = 1
         
-        trades_per_day = len(trades) / time_span_days
+        trades_per_day = len(features) / time_span_days
         
         # Score based on frequency
         # >50 trades/day = very likely bot
         # >20 trades/day = likely bot
         # >10 trades/day = possibly bot
-        if trades_per_day >= 50:
-            return 1.0
-        elif trades_per_day >= 20:
-            return 0.8
-        elif trades_per_day >= 10:
-            return 0.6
-        elif trades_per_day >= 5:
-            return 0.4
-        else:
-            return 0.2
+        return _bucket(trades_per_day, self._FREQ_T, self._FREQ_S)
     
-    def _analyze_timing(self, trades: List[Dict]) -> float:
+    def _analyze_timing(self, timeline: _Timeline) -> float:
         """
         Analyze trading timing patterns
         24/7 trading is a bot indicator
@@ -141,36 +288,28 @@ class BotDetector:
         Returns:
             Score 0-1 (higher = more bot-like)
         """
-        timestamps = [self._parse_timestamp(t.get('created_time', t.get('timestamp'))) 
-                     for t in trades]
-        timestamps = [ts for ts in timestamps if ts is not None]
-        
-        if len(timestamps) < 10:
+        n = len(timeline)
+        if n < 10:
             return 0.0
         
         # Analyze hour distribution
-        hours = [ts.hour for ts in timestamps]
-        hour_counts = Counter(hours)
+        hour_counts = np.bincount(timeline.hour, minlength=24)
         
-        # Check for off-hours trading (midnight to 6am)
-        off_hours_trades = sum(hour_counts.get(h, 0) for h in range(0, 6))
-        off_hours_ratio = off_hours_trades / len(timestamps)
+        # Check for off-hours trading (midnight to 6am UTC)
+        off_hours_ratio = int(hour_counts[:6].sum()) / n
         
-        # Check for weekend trading
-        weekdays = [ts.weekday() for ts in timestamps]
-        weekend_trades = sum(1 for w in weekdays if w >= 5)  # 5=Saturday, 6=Sunday
-        weekend_ratio = weekend_trades / len(timestamps)
+        # Check for weekend trading (5=Saturday, 6=Sunday)
+        weekend_ratio = int(np.count_nonzero(timeline.weekday >= 5)) / n
         
         # Check for uniform distribution (bots trade at all hours)
-        hours_with_trades = len(hour_counts)
-        hour_uniformity = hours_with_trades / 24
+        hour_uniformity = int(np.count_nonzero(hour_counts)) / 24
         
         # Combine signals
         score = (off_hours_ratio * 0.4 + weekend_ratio * 0.3 + hour_uniformity * 0.3)
         
         return min(score * 2, 1.0)  # Scale up and cap at 1.0
     
-    def _analyze_size_patterns(self, trades: List[Dict]) -> float:
+    def _analyze_size_patterns(self, features: TradeFeatures) -> float:
         """
         Analyze bet size patterns
         Consistent sizes are a bot indicator
@@ -178,38 +317,20 @@ class BotDetector:
         Returns:
             Score 0-1 (higher = more bot-like)
         """
-        sizes = []
-        for trade in trades:
-            # Try different field names for size
-            size = trade.get('count', trade.get('quantity', trade.get('size', 0)))
-            if size > 0:
-                sizes.append(size)
+        sizes = features.sizes[features.sizes > 0]
         
         if len(sizes) < 5:
             return 0.0
         
         # Calculate coefficient of variation (std / mean)
-        mean_size = np.mean(sizes)
-        std_size = np.std(sizes)
-        
-        if mean_size == 0:
-            return 0.0
-        
-        cv = std_size / mean_size
+        cv = _size_cv(sizes)
         
         # Low CV indicates consistent sizing (bot-like)
         # CV < 0.2 = very consistent
         # CV < 0.5 = somewhat consistent
-        if cv < 0.2:
-            return 0.9
-        elif cv < 0.5:
-            return 0.6
-        elif cv < 1.0:
-            return 0.3
-        else:
-            return 0.1
+        return _bucket(cv, self._SIZE_CV_T, self._SIZE_CV_S)
     
-    def _analyze_market_diversity(self, trades: List[Dict]) -> float:
+    def _analyze_market_diversity(self, features: TradeFeatures) -> float:
         """
         Analyze market diversity
         Trading in many markets simultaneously is a bot indicator
@@ -217,18 +338,18 @@ class BotDetector:
         Returns:
             Score 0-1 (higher = more bot-like)
         """
-        tickers = [t.get('ticker', t.get('market_ticker', '')) for t in trades]
-        tickers = [t for t in tickers if t]
+        tickers = features.tickers[features.tickers != '']
         
-        if not tickers:
+        if not tickers.size:
             return 0.0
         
+        # set() hashes the tickers in C and beats np.unique's object sort
         unique_markets = len(set(tickers))
-        total_trades = len(tickers)
+        total_trades = tickers.size
         
-        # Calculate market switching rate
-        switches = sum(1 for i in range(1, len(tickers)) if tickers[i] != tickers[i-1])
-        switch_rate = switches / max(len(tickers) - 1, 1)
+        # Calculate market switching rate (element-wise compare of neighbours)
+        switches = int(np.count_nonzero(tickers[1:] != tickers[:-1]))
+        switch_rate = switches / max(total_trades - 1, 1)
         
         # High diversity + high switching = bot-like
         diversity_ratio = unique_markets / total_trades
@@ -239,7 +360,7 @@ class BotDetector:
         
         return (diversity_score * 0.6 + switch_score * 0.4)
     
-    def _analyze_execution_speed(self, trades: List[Dict]) -> float:
+    def _analyze_execution_speed(self, timeline: _Timeline) -> float:
         """
         Analyze execution speed
         Very fast execution after market events is a bot indicator
@@ -247,49 +368,28 @@ class BotDetector:
         Returns:
             Score 0-1 (higher = more bot-like)
         """
-        timestamps = [self._parse_timestamp(t.get('created_time', t.get('timestamp'))) 
-                     for t in trades]
-        timestamps = [ts for ts in timestamps if ts is not None]
-        
-        if len(timestamps) < 2:
+        if len(timeline) < 2:
             return 0.0
         
         # Calculate time between consecutive trades
-        intervals = []
-        for i in range(1, len(timestamps)):
-            interval = (timestamps[i] - timestamps[i-1]).total_seconds()
-            if interval > 0:
-                intervals.append(interval)
+        very_fast, fast, n_intervals, min_interval = _interval_stats(timeline.ns)
         
-        if not intervals:
+        if not n_intervals:
             return 0.0
         
         # Look for very fast trades (< 1 second apart)
-        very_fast = sum(1 for i in intervals if i < 1)
-        fast = sum(1 for i in intervals if i < 5)
+        very_fast_ratio = very_fast / n_intervals
+        fast_ratio = fast / n_intervals
         
-        very_fast_ratio = very_fast / len(intervals)
-        fast_ratio = fast / len(intervals)
-        
-        # Calculate minimum interval
-        min_interval = min(intervals)
-        
-        # Score based on speed
-        if min_interval < 0.1:  # Sub-second execution
-            speed_score = 1.0
-        elif min_interval < 1:
-            speed_score = 0.8
-        elif min_interval < 5:
-            speed_score = 0.5
-        else:
-            speed_score = 0.2
+        # Score based on speed (sub-0.1s execution scores highest)
+        speed_score = _bucket(min_interval, self._MIN_INTERVAL_T, self._MIN_INTERVAL_S)
         
         # Combine with ratio of fast trades
         ratio_score = (very_fast_ratio * 0.7 + fast_ratio * 0.3)
         
         return (speed_score * 0.5 + ratio_score * 0.5)
     
-    def _analyze_round_numbers(self, trades: List[Dict]) -> float:
+    def _analyze_round_numbers(self, features: TradeFeatures) -> float:
         """
         Analyze use of round numbers
         Bots often use exact round numbers
@@ -297,34 +397,16 @@ class BotDetector:
         Returns:
             Score 0-1 (higher = more bot-like)
         """
-        sizes = []
-        prices = []
-        
-        for trade in trades:
-            # Get size
-            size = trade.get('count', trade.get('quantity', trade.get('size', 0)))
-            if size > 0:
-                sizes.append(size)
-            
-            # Get price (in cents)
-            price = trade.get('yes_price', trade.get('no_price', trade.get('price', 0)))
-            if price > 0:
-                prices.append(price)
-        
-        round_count = 0
-        total_count = 0
-        
-        # Check sizes for round numbers
-        for size in sizes:
-            total_count += 1
-            if size % 10 == 0 or size % 5 == 0:
-                round_count += 1
-        
-        # Check prices for round numbers (multiples of 5 cents)
-        for price in prices:
-            total_count += 1
-            if price % 5 == 0:
-                round_count += 1
+        sizes = features.sizes[features.sizes > 0]
+        prices = features.prices[features.prices > 0]  # cents
+        
+        # Round sizes and prices are multiples of 5 (contracts / cents); a
+        # multiple of 10 is already a multiple of 5
+        round_count = (
+            int(np.count_nonzero(sizes % 5 == 0))
+            + int(np.count_nonzero(prices % 5 == 0))
+        )
+        total_count = sizes.size + prices.size
         
         if total_count == 0:
             return 0.0
@@ -332,29 +414,69 @@ class BotDetector:
         round_ratio = round_count / total_count
         
         # High use of round numbers is bot-like
-        if round_ratio >= 0.9:
-            return 0.9
-        elif round_ratio >= 0.7:
-            return 0.7
-        elif round_ratio >= 0.5:
-            return 0.5
-        else:
-            return 0.2
+        return _bucket(round_ratio, self._ROUND_RATIO_T, self._ROUND_RATIO_S)
+    
+    def _build_timeline(self, raw: List[Any]) -> _Timeline:
+        """
+        Parse raw fill timestamps in bulk
+        
+        ISO strings and datetimes go through one pandas.to_datetime call and
+        epoch numbers are converted with array math; only strings pandas
+        rejects fall back to _parse_timestamp. Times are bucketed in UTC.
+        """
+        ns = np.full(len(raw), _NAT, dtype=np.int64)
+        
+        numbers = [i for i, ts in enumerate(raw) if isinstance(ts, (int, float))]
+        if numbers:
+            # Round to microseconds like datetime.fromtimestamp does
+            seconds = np.array([raw[i] for i in numbers], dtype=np.float64)
+            ns[numbers] = np.round(seconds * 1e6).astype(np.int64) * 1000
+        
+        others = [i for i, ts in enumerate(raw) if isinstance(ts, (str, datetime))]
+        if others:
+            parsed = pd.to_datetime(
+                pd.Series([raw[i] for i in others], dtype=object),
+                utc=True, errors='coerce', format='ISO8601'
+            )
+            values = np.asarray(parsed.dt.tz_localize(None), dtype='datetime64[ns]').view(np.int64)
+            ns[others] = values
+            for i, value in zip(others, values):
+                if value == _NAT:
+                    dt = self._parse_timestamp(raw[i])
+                    if dt is not None:
+                        ns[i] = _datetime_to_ns(dt)
+        
+        ns = ns[ns != _NAT]
+        return _Timeline(
+            ns=ns,
+            hour=(ns // _NS_PER_HOUR % 24).astype(np.int8),
+            weekday=((ns // _NS_PER_DAY + 3) % 7).astype(np.int8),  # 1970-01-01 was a Thursday
+        )
     
     def _parse_timestamp(self, ts: any) -> datetime:
         """Parse timestamp from various formats"""
-        if isinstance(ts, datetime):
-            return ts
-        elif isinstance(ts, (int, float)):
-            return datetime.fromtimestamp(ts)
-        elif isinstance(ts, str):
+        # Exact-type checks first: fills carry str timestamps almost always
+        kind = type(ts)
+        if kind is str:
+            # Fills often share timestamp strings; parse each distinct one once
+            cache = self._ts_cache
+            if ts in cache:
+                return cache[ts]
             try:
-                # Try ISO format
-                return datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            except:
+                # ISO format; fromisoformat accepts a trailing 'Z' (Python 3.11+)
+                parsed = _FROMISOFORMAT(ts)
+            except ValueError:
                 try:
                     # Try parsing as timestamp
-                    return datetime.fromtimestamp(float(ts))
-                except:
-                    return None
+                    parsed = datetime.fromtimestamp(float(ts), tz=timezone.utc)
+                except (ValueError, OverflowError, OSError):
+                    parsed = None
+            if len(cache) >= _TS_CACHE_MAX:
+                del cache[next(iter(cache))]  # FIFO eviction
+            cache[ts] = parsed
+            return parsed
+        if kind is datetime or isinstance(ts, datetime):
+            return ts
+        if isinstance(ts, (int, float)):
+            return datetime.fromtimestamp(ts, tz=timezone.utc)
         return None
@@ -3,47 +3,110 @@ Configuration management for Kalshi bot
 Loads settings from environment variables with sensible defaults
 """
 import os
+from functools import lru_cache
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+_BOOL = {'true': True, '1': True, 'false': False, '0': False}.get
+
+
+def _parse_bool(value: str) -> bool:
+    """'true'/'1' (any case) enable a flag; anything else disables it"""
+    return _BOOL(value.strip().lower(), False)
+
+
+# Environment-backed settings: name -> (parser, default when unset)
+_SETTINGS = {
+    # Kalshi API Configuration
+    'KALSHI_API_KEY_ID': (str, ''),
+    'KALSHI_PRIVATE_KEY': (str, ''),
+    'KALSHI_API_URL': (str, 'https://api.elections.kalshi.com/trade-api/v2'),
+    'KALSHI_DEMO_URL': (str, 'https://demo-api.kalshi.co/trade-api/v2'),
+    'USE_DEMO': (_parse_bool, 'false'),
+    
+    # Trading Configuration
+    'MAX_POSITION_SIZE': (float, '100'),  # USD
+    'MAX_TOTAL_EXPOSURE': (float, '1000'),  # USD
+    'ENABLE_TRADING': (_parse_bool, 'false'),
+    
+    # Risk Management
+    'STOP_LOSS_PERCENTAGE': (float, '10'),  # %
+    'MAX_SLIPPAGE': (float, '0.02'),  # 2%
+    'MIN_PROFIT_THRESHOLD': (float, '0.01'),  # $0.01
+    
+    # Bot Detection Thresholds
+    'MIN_TRADES_FOR_ANALYSIS': (int, '10'),
+    'BOT_SCORE_THRESHOLD': (float, '0.7'),
+    
+    # Strategy Configuration
+    'ARBITRAGE_MIN_PROFIT': (float, '0.02'),  # $0.02
+    'MARKET_MAKER_SPREAD': (float, '0.02'),  # 2%
+    'COPY_TRADE_RATIO': (float, '0.1'),  # 10%
+    
+    # Logging Configuration
+    'LOG_LEVEL': (str, 'INFO'),
+    'LOG_FILE': (str, 'kalshi_bot.log'),
+    
+    # Rate Limiting
+    'API_CALLS_PER_SECOND': (int, '10'),
+}
+
 
 class Config:
-    """Central configuration for Kalshi trading bot"""
+    """Central configuration for Kalshi trading bot (settings listed in _SETTINGS)"""
     
     # Kalshi API Configuration
-    KALSHI_API_KEY_ID = os.getenv('KALSHI_API_KEY_ID', '')
-    KALSHI_PRIVATE_KEY = os.getenv('KALSHI_PRIVATE_KEY', '')
-    KALSHI_API_URL = os.getenv('KALSHI_API_URL', 'https://api.elections.kalshi.com/trade-api/v2')
-    KALSHI_DEMO_URL = os.getenv('KALSHI_DEMO_URL', 'https://demo-api.kalshi.co/trade-api/v2')
-    USE_DEMO = os.getenv('USE_DEMO', 'false').lower() == 'true'
+    KALSHI_API_KEY_ID: str
+    KALSHI_PRIVATE_KEY: str
+    KALSHI_API_URL: str
+    KALSHI_DEMO_URL: str
+    USE_DEMO: bool
     
     # Trading Configuration
-    MAX_POSITION_SIZE = float(os.getenv('MAX_POSITION_SIZE', '100'))  # USD
-    MAX_TOTAL_EXPOSURE = float(os.getenv('MAX_TOTAL_EXPOSURE', '1000'))  # USD
-    ENABLE_TRADING = os.getenv('ENABLE_TRADING', 'false').lower() == 'true'
+    MAX_POSITION_SIZE: float
+    MAX_TOTAL_EXPOSURE: float
+    ENABLE_TRADING: bool
     
     # Risk Management
-    STOP_LOSS_PERCENTAGE = float(os.getenv('STOP_LOSS_PERCENTAGE', '10'))  # %
-    MAX_SLIPPAGE = float(os.getenv('MAX_SLIPPAGE', '0.02'))  # 2%
-    MIN_PROFIT_THRESHOLD = float(os.getenv('MIN_PROFIT_THRESHOLD', '0.01'))  # $0.01
+    STOP_LOSS_PERCENTAGE: float
+    MAX_SLIPPAGE: float
+    MIN_PROFIT_THRESHOLD: float
     
     # Bot Detection Thresholds
-    MIN_TRADES_FOR_ANALYSIS = int(os.getenv('MIN_TRADES_FOR_ANALYSIS', '10'))
-    BOT_SCORE_THRESHOLD = float(os.getenv('BOT_SCORE_THRESHOLD', '0.7'))
+    MIN_TRADES_FOR_ANALYSIS: int
+    BOT_SCORE_THRESHOLD: float
     
     # Strategy Configuration
-    ARBITRAGE_MIN_PROFIT = float(os.getenv('ARBITRAGE_MIN_PROFIT', '0.02'))  # $0.02
-    MARKET_MAKER_SPREAD = float(os.getenv('MARKET_MAKER_SPREAD', '0.02'))  # 2%
-    COPY_TRADE_RATIO = float(os.getenv('COPY_TRADE_RATIO', '0.1'))  # 10%
+    ARBITRAGE_MIN_PROFIT: float
+    MARKET_MAKER_SPREAD: float
+    COPY_TRADE_RATIO: float
     
     # Logging Configuration
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-    LOG_FILE = os.getenv('LOG_FILE', 'kalshi_bot.log')
+    LOG_LEVEL: str
+    LOG_FILE: str
     
     # Rate Limiting
-    API_CALLS_PER_SECOND = int(os.getenv('API_CALLS_PER_SECOND', '10'))
+    API_CALLS_PER_SECOND: int
+    
+    @classmethod
+    def _load_env(cls):
+        """
+        Read every setting from the environment in one pass
+        
+        Raises:
+            ValueError: If a variable cannot be parsed (names the variable)
+        """
+        env = os.environ
+        for name, (parse, default) in _SETTINGS.items():
+            raw = env.get(name, default)
+            try:
+                value = parse(raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {name}: {raw!r}") from e
+            setattr(cls, name, value)
     
     @classmethod
     def validate(cls):
@@ -85,13 +148,35 @@ class Config:
             raise ValueError("Configuration errors:\n" + "\n".join(f"  - {e}" for e in errors))
     
     @classmethod
+    def snapshot(cls) -> SimpleNamespace:
+        """
+        Return the current settings as a plain namespace
+        
+        Components that read several settings on hot paths take one snapshot
+        at construction instead of resolving Config attributes per call.
+        """
+        return SimpleNamespace(**{name: getattr(cls, name) for name in _SETTINGS})
+    
+    @classmethod
+    def reload(cls):
+        """
+        Re-read settings from the environment and drop cached derived
+        values (API URL, summary)
+        """
+        cls._load_env()
+        cls.get_api_url.cache_clear()
+        cls.summary.cache_clear()
+    
+    @classmethod
+    @lru_cache(maxsize=1)
     def get_api_url(cls):
-        """Get the appropriate API URL based on demo mode"""
+        """Get the appropriate API URL based on demo mode (cached; see reload)"""
         return cls.KALSHI_DEMO_URL if cls.USE_DEMO else cls.KALSHI_API_URL
     
     @classmethod
+    @lru_cache(maxsize=1)
     def summary(cls):
-        """Return a summary of current configuration"""
+        """Return a summary of current configuration (cached; see reload)"""
         return f"""
 Kalshi Bot Configuration:
 ========================
@@ -116,3 +201,6 @@ Logging:
   Level: {cls.LOG_LEVEL}
   File: {cls.LOG_FILE}
 """
+
+
+Config._load_env()
@@ -4,26 +4,104 @@ Risk management system for Kalshi trading
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import numpy as np
 from config import Config
-from utils import calculate_profit_loss, safe_divide
+from utils import safe_divide
 
 logger = logging.getLogger(__name__)
 
+# Side codes for the position table; anything else is tracked as "other"
+_SIDE_CODES = {'yes': 0, 'no': 1}
+_OTHER_SIDE = 2
+
+# Initial row capacity of the position table (doubles when full)
+_INITIAL_CAPACITY = 64
+
 
 class RiskManager:
     """Comprehensive risk management for trading"""
     
+    __slots__ = (
+        'max_position_size', 'max_total_exposure', 'stop_loss_pct', 'max_slippage',
+        'total_exposure', '_tickers', '_sides', '_index',
+        '_quantity', '_value', '_avg_price', '_side_code'
+    )
+    
     def __init__(self):
         """Initialize risk manager"""
-        self.max_position_size = Config.MAX_POSITION_SIZE
-        self.max_total_exposure = Config.MAX_TOTAL_EXPOSURE
-        self.stop_loss_pct = Config.STOP_LOSS_PERCENTAGE
-        self.max_slippage = Config.MAX_SLIPPAGE
+        config = Config.snapshot()
+        self.max_position_size = config.MAX_POSITION_SIZE
+        self.max_total_exposure = config.MAX_TOTAL_EXPOSURE
+        self.stop_loss_pct = config.STOP_LOSS_PERCENTAGE
+        self.max_slippage = config.MAX_SLIPPAGE
         
         # Track current positions
-        self.positions = {}
+        self._clear_positions()
+    
+    def _clear_positions(self):
+        """
+        Empty the position table
+        
+        Positions are stored column-wise (one row per ticker, in insertion
+        order) so portfolio totals are array reductions; _index maps a
+        ticker to its row.
+        """
+        self._tickers: List[str] = []
+        self._sides: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._quantity = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+        self._value = np.zeros(_INITIAL_CAPACITY, dtype=np.float64)
+        self._avg_price = np.zeros(_INITIAL_CAPACITY, dtype=np.float64)
+        self._side_code = np.zeros(_INITIAL_CAPACITY, dtype=np.uint8)
         self.total_exposure = 0.0
     
+    def _add_row(self, ticker: str, side: str) -> int:
+        """Append an empty position row for `ticker` and return its index"""
+        row = len(self._tickers)
+        if row == len(self._value):
+            capacity = 2 * row
+            self._quantity = np.resize(self._quantity, capacity)
+            self._value = np.resize(self._value, capacity)
+            self._avg_price = np.resize(self._avg_price, capacity)
+            self._side_code = np.resize(self._side_code, capacity)
+        self._quantity[row] = 0
+        self._value[row] = 0.0
+        self._avg_price[row] = 0.0
+        self._side_code[row] = _SIDE_CODES.get(side, _OTHER_SIDE)
+        self._tickers.append(ticker)
+        self._sides.append(side)
+        self._index[ticker] = row
+        return row
+    
+    def _drop_row(self, row: int):
+        """Remove a position row, keeping the remaining rows in order"""
+        n = len(self._tickers)
+        for column in (self._quantity, self._value, self._avg_price, self._side_code):
+            column[row:n - 1] = column[row + 1:n]
+        del self._index[self._tickers[row]]
+        del self._tickers[row]
+        del self._sides[row]
+        for ticker in self._tickers[row:]:
+            self._index[ticker] -= 1
+    
+    def _ticker_value(self, ticker: str) -> float:
+        """Current tracked value for `ticker` (0 when not held)"""
+        row = self._index.get(ticker)
+        return 0 if row is None else float(self._value[row])
+    
+    @property
+    def positions(self) -> Dict[str, Dict]:
+        """Tracked positions as {ticker: {quantity, value, side, avg_price}} (a copy)"""
+        return {
+            ticker: {
+                'quantity': int(self._quantity[row]),
+                'value': float(self._value[row]),
+                'side': self._sides[row],
+                'avg_price': float(self._avg_price[row])
+            }
+            for row, ticker in enumerate(self._tickers)
+        }
+    
     def check_position_limits(self, ticker: str, size: int, price: float) -> Tuple[bool, str]:
         """
         Check if a new position would exceed limits
@@ -37,22 +115,24 @@ class RiskManager:
             Tuple of (is_valid, reason)
         """
         position_value = size * price
+        max_position_size = self.max_position_size
         
         # Check individual position size
-        if position_value > self.max_position_size:
-            return False, f"Position size ${position_value:.2f} exceeds max ${self.max_position_size}"
+        if position_value > max_position_size:
+            return False, f"Position size ${position_value:.2f} exceeds max ${max_position_size}"
         
         # Check total exposure
-        current_ticker_exposure = self.positions.get(ticker, {}).get('value', 0)
+        current_ticker_exposure = self._ticker_value(ticker)
         new_ticker_exposure = current_ticker_exposure + position_value
         
-        if new_ticker_exposure > self.max_position_size:
-            return False, f"Total exposure in {ticker} would be ${new_ticker_exposure:.2f}, exceeds max ${self.max_position_size}"
+        if new_ticker_exposure > max_position_size:
+            return False, f"Total exposure in {ticker} would be ${new_ticker_exposure:.2f}, exceeds max ${max_position_size}"
         
         # Check total portfolio exposure
         new_total_exposure = self.total_exposure + position_value
-        if new_total_exposure > self.max_total_exposure:
-            return False, f"Total exposure ${new_total_exposure:.2f} exceeds max ${self.max_total_exposure}"
+        max_total_exposure = self.max_total_exposure
+        if new_total_exposure > max_total_exposure:
+            return False, f"Total exposure ${new_total_exposure:.2f} exceeds max ${max_total_exposure}"
         
         return True, "OK"
     
@@ -74,7 +154,7 @@ class RiskManager:
         base_size_usd = self.max_position_size * confidence
         
         # Adjust for existing exposure
-        current_exposure = self.positions.get(ticker, {}).get('value', 0)
+        current_exposure = self._ticker_value(ticker)
         available_size_usd = min(
             base_size_usd,
             self.max_position_size - current_exposure,
@@ -102,41 +182,41 @@ class RiskManager:
         Returns:
             List of positions that should be closed
         """
-        to_close = []
+        if not positions:
+            return []
+        
+        n = len(positions)
+        tickers = [pos.get('ticker', '') for pos in positions]
+        entry = np.fromiter((pos.get('entry_price', 0) or 0 for pos in positions), dtype=np.float64, count=n)
+        current = np.fromiter((pos.get('market_price', 0) or 0 for pos in positions), dtype=np.float64, count=n)
+        quantity = np.fromiter((pos.get('position', 0) or 0 for pos in positions), dtype=np.float64, count=n)
+        is_yes = np.fromiter((pos.get('side', 'yes').lower() == 'yes' for pos in positions), dtype=bool, count=n)
+        
+        # Skip positions missing a ticker, prices or quantity
+        valid = (entry != 0) & (current != 0) & (quantity != 0)
+        valid &= np.fromiter((bool(t) for t in tickers), dtype=bool, count=n)
+        
+        # P&L percentage for every position at once (same arithmetic as
+        # calculate_profit_loss, prices converted from cents to dollars)
+        entry_usd = entry / 100
+        current_usd = current / 100
+        pnl = np.where(is_yes, current_usd - entry_usd, entry_usd - current_usd) * quantity
+        position_value = np.abs(quantity * entry / 100)
+        valid &= position_value != 0
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_pct = (pnl / position_value) * 100
         
-        for pos in positions:
-            ticker = pos.get('ticker', '')
-            entry_price = pos.get('entry_price', 0)
-            current_price = pos.get('market_price', 0)
-            quantity = pos.get('position', 0)
-            side = pos.get('side', 'yes')
-            
-            if not all([ticker, entry_price, current_price, quantity]):
-                continue
-            
-            # Calculate P&L percentage
-            pnl = calculate_profit_loss(
-                entry_price / 100,  # Convert cents to dollars
-                current_price / 100,
-                quantity,
-                side
+        # Check if stop-loss triggered
+        stop_loss_pct = self.stop_loss_pct
+        triggered = np.flatnonzero(valid & (pnl_pct <= -stop_loss_pct))
+        for i in triggered:
+            logger.warning(
+                f"Stop-loss triggered for {tickers[i]}: "
+                f"{pnl_pct[i]:.1f}% loss (threshold: {stop_loss_pct}%)"
             )
-            
-            position_value = abs(quantity * entry_price / 100)
-            if position_value == 0:
-                continue
-            
-            pnl_pct = (pnl / position_value) * 100
-            
-            # Check if stop-loss triggered
-            if pnl_pct <= -self.stop_loss_pct:
-                logger.warning(
-                    f"Stop-loss triggered for {ticker}: "
-                    f"{pnl_pct:.1f}% loss (threshold: {self.stop_loss_pct}%)"
-                )
-                to_close.append(pos)
-        
-        return to_close
+        
+        return [positions[i] for i in triggered]
     
     def validate_order(self, ticker: str, side: str, quantity: int, 
                       price: float, current_market_price: float) -> Tuple[bool, str]:
@@ -161,8 +241,9 @@ class RiskManager:
         # Check slippage
         if current_market_price > 0:
             slippage = abs(price - current_market_price) / current_market_price
-            if slippage > self.max_slippage:
-                return False, f"Slippage {slippage*100:.1f}% exceeds max {self.max_slippage*100:.1f}%"
+            max_slippage = self.max_slippage
+            if slippage > max_slippage:
+                return False, f"Slippage {slippage*100:.1f}% exceeds max {max_slippage*100:.1f}%"
         
         # Check price validity
         if price <= 0 or price >= 1:
@@ -189,32 +270,28 @@ class RiskManager:
         position_value = quantity * price
         
         if action == 'add':
-            if ticker not in self.positions:
-                self.positions[ticker] = {
-                    'quantity': 0,
-                    'value': 0,
-                    'side': side,
-                    'avg_price': 0
-                }
+            row = self._index.get(ticker)
+            if row is None:
+                row = self._add_row(ticker, side)
             
-            pos = self.positions[ticker]
-            total_quantity = pos['quantity'] + quantity
-            total_value = pos['value'] + position_value
+            total_quantity = int(self._quantity[row]) + quantity
+            total_value = float(self._value[row]) + position_value
             
-            pos['quantity'] = total_quantity
-            pos['value'] = total_value
-            pos['avg_price'] = safe_divide(total_value, total_quantity)
+            self._quantity[row] = total_quantity
+            self._value[row] = total_value
+            self._avg_price[row] = safe_divide(total_value, total_quantity)
             
             self.total_exposure += position_value
             
         elif action == 'remove':
-            if ticker in self.positions:
-                pos = self.positions[ticker]
-                pos['quantity'] = max(0, pos['quantity'] - quantity)
-                pos['value'] = max(0, pos['value'] - position_value)
+            row = self._index.get(ticker)
+            if row is not None:
+                remaining = max(0, int(self._quantity[row]) - quantity)
+                self._quantity[row] = remaining
+                self._value[row] = max(0, float(self._value[row]) - position_value)
                 
-                if pos['quantity'] == 0:
-                    del self.positions[ticker]
+                if remaining == 0:
+                    self._drop_row(row)
                 
                 self.total_exposure = max(0, self.total_exposure - position_value)
     
@@ -225,14 +302,15 @@ class RiskManager:
         Returns:
             Dictionary with portfolio metrics
         """
-        total_positions = len(self.positions)
-        total_value = sum(p['value'] for p in self.positions.values())
+        total_positions = len(self._tickers)
+        values = self._value[:total_positions]
+        sides = self._side_code[:total_positions]
+        total_value = float(values.sum())
         
-        # Calculate exposure by side
-        yes_exposure = sum(p['value'] for p in self.positions.values() 
-                          if p.get('side') == 'yes')
-        no_exposure = sum(p['value'] for p in self.positions.values() 
-                         if p.get('side') == 'no')
+        # Calculate exposure by side (one weighted histogram over the side codes)
+        by_side = np.bincount(sides, weights=values, minlength=_OTHER_SIDE + 1)
+        yes_exposure = float(by_side[_SIDE_CODES['yes']])
+        no_exposure = float(by_side[_SIDE_CODES['no']])
         
         # Calculate utilization
         position_utilization = safe_divide(total_value, self.max_position_size)
@@ -247,13 +325,12 @@ class RiskManager:
             'position_utilization': position_utilization,
             'total_utilization': total_utilization,
             'available_capital': max(0, self.max_total_exposure - self.total_exposure),
-            'positions': dict(self.positions)
+            'positions': self.positions
         }
     
     def reset(self):
         """Reset position tracking"""
-        self.positions = {}
-        self.total_exposure = 0.0
+        self._clear_positions()
         logger.info("Risk manager reset")
     
     def load_positions(self, positions: List[Dict]):
@@ -274,5 +351,5 @@ class RiskManager:
             if ticker and quantity > 0 and market_price > 0:
                 self.update_position(ticker, side, quantity, market_price, action='add')
         
-        logger.info(f"Loaded {len(self.positions)} positions, "
+        logger.info(f"Loaded {len(self._tickers)} positions, "
                    f"total exposure: ${self.total_exposure:.2f}")
@@ -2,15 +2,91 @@
 Arbitrage trading strategy for Kalshi
 Exploits pricing inefficiencies where YES + NO < $1
 """
+import asyncio
+import heapq
 import logging
-from typing import Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from api_client import KalshiAPI
 from risk_manager import RiskManager
 from config import Config
+from utils import Level, run_async
 
 logger = logging.getLogger(__name__)
 
+# Markets per get_orderbooks batch, and batches in flight during a parallel scan
+_BATCH_SIZE = 32
+_MAX_BATCHES_IN_FLIGHT = 2
+
+# Allowance for the market list's top-of-book snapshot lagging the live book
+_SNAPSHOT_SLACK_CENTS = 2
+
+_level_price = attrgetter('price')
+
+
+def _best_asks(orderbook_response: Optional[Dict]) -> Optional[Tuple[Level, Level]]:
+    """Return the best YES and NO asks of a get_orderbook response, or None if either side is empty"""
+    if not orderbook_response:
+        return None
+    
+    # Kalshi nests orderbook data under 'orderbook' key and lists each side
+    # in ascending price order; take the top level by price rather than
+    # trusting the order, as MarketMakerStrategy.calculate_quotes does
+    orderbook = orderbook_response.get('orderbook')
+    if not orderbook:
+        return None
+    
+    yes_orders = orderbook.get('yes')
+    no_orders = orderbook.get('no')
+    if not (yes_orders and no_orders):
+        return None
+    return max(yes_orders, key=_level_price), max(no_orders, key=_level_price)
+
+
+def _may_have_arbitrage(market: Dict) -> bool:
+    """
+    Pre-screen a market with the top-of-book snapshot from get_markets
+    
+    Applies the same predicate as the orderbook check, to the snapshot's
+    best YES and NO bids (the top levels _best_asks reads from the book):
+    markets whose tops already sum to $1 or more (plus slack) are skipped
+    without fetching their orderbook. Markets without a snapshot are
+    always kept.
+    """
+    yes_top = market.get('yes_bid')
+    no_top = market.get('no_bid')
+    if not (yes_top and no_top):
+        return True
+    return yes_top + no_top < 100 + _SNAPSHOT_SLACK_CENTS
+
+
+def _arb_scan_core(yes_cents: np.ndarray, no_cents: np.ndarray, yes_qty: np.ndarray,
+                   no_qty: np.ndarray, min_profit_cents: int) -> Tuple[np.ndarray, ...]:
+    """
+    Integer kernel of the arbitrage scan over per-market top-of-book columns
+    
+    Args:
+        yes_cents: Best YES ask per market, in cents
+        no_cents: Best NO ask per market, in cents
+        yes_qty: Size at the best YES ask
+        no_qty: Size at the best NO ask
+        min_profit_cents: Minimum profit per contract, in cents
+    
+    Returns:
+        Indices of the markets whose asks sum to under $1 by at least
+        min_profit_cents, and their total cost, profit and tradable size
+    """
+    total_cents = yes_cents + no_cents
+    profit_cents = 100 - total_cents
+    candidates = np.flatnonzero((total_cents < 100) & (profit_cents >= min_profit_cents))
+    return (
+        candidates,
+        total_cents[candidates],
+        profit_cents[candidates],
+        np.minimum(yes_qty[candidates], no_qty[candidates]),
+    )
+
 
 class ArbitrageStrategy:
     """Arbitrage strategy exploiting mispriced markets"""
@@ -26,6 +102,7 @@ class ArbitrageStrategy:
         self.api = api
         self.risk_manager = risk_manager
         self.min_profit = Config.ARBITRAGE_MIN_PROFIT
+        self.min_profit_cents = round(self.min_profit * 100)
     
     def _check_market_for_arbitrage(self, market: Dict) -> Optional[Dict]:
         """
@@ -41,82 +118,94 @@ class ArbitrageStrategy:
         if not ticker:
             return None
         
-        # Get orderbook
-        orderbook_response = self.api.get_orderbook(ticker)
-        if not orderbook_response:
-            return None
-        
-        # Kalshi nests orderbook data under 'orderbook' key
-        orderbook = orderbook_response.get('orderbook', {})
-        if not orderbook:
-            return None
-        
-        # Get best prices - Kalshi returns arrays of orders
-        yes_orders = orderbook.get('yes', [])
-        no_orders = orderbook.get('no', [])
+        opportunities = self._evaluate_orderbooks([market], [self.api.get_orderbook(ticker)])
+        return opportunities[0] if opportunities else None
+    
+    def _evaluate_orderbooks(self, markets: List[Dict], orderbook_responses: List[Optional[Dict]],
+                             limit: Optional[int] = None) -> List[Dict]:
+        """
+        Check fetched orderbooks for arbitrage opportunities in one vectorized pass
         
-        # Skip if no orders (empty orderbook)
-        if not yes_orders or not no_orders:
-            return None
+        Args:
+            markets: Market dictionaries, each with a ticker
+            orderbook_responses: Raw get_orderbook responses aligned with `markets`
+            limit: Only return the `limit` most profitable opportunities (None = all)
         
-        # Best ask prices (what we'd pay to buy)
-        # Assuming orders are sorted, take first one
-        if isinstance(yes_orders, list) and len(yes_orders) > 0:
-            best_yes_ask = yes_orders[0]
-        else:
-            return None
-            
-        if isinstance(no_orders, list) and len(no_orders) > 0:
-            best_no_ask = no_orders[0]
-        else:
-            return None
+        Returns:
+            Opportunities sorted by expected profit, highest first
+        """
+        rows, tops = [], []
+        for market, response in zip(markets, orderbook_responses):
+            best = _best_asks(response)
+            if best is None:
+                continue
+            best_yes_ask, best_no_ask = best
+            rows.append(market)
+            tops.append((best_yes_ask.price, best_no_ask.price, best_yes_ask.quantity, best_no_ask.quantity))
+        
+        if not rows:
+            return []
         
-        yes_price = best_yes_ask.get('price', 0) / 100  # Convert cents to dollars
-        no_price = best_no_ask.get('price', 0) / 100
+        # One conversion for all four columns; Fortran order makes each
+        # column contiguous
+        yes_cents, no_cents, yes_qty, no_qty = np.array(tops, dtype=np.int64, order='F').T
+        candidates, total_cents, profit_cents, max_qty = _arb_scan_core(
+            yes_cents, no_cents, yes_qty, no_qty, self.min_profit_cents
+        )
+        if not candidates.size:
+            return []
         
-        # Check for arbitrage (YES + NO < $1)
-        total_cost = yes_price + no_price
+        # Position size depends on per-ticker exposure, so only this step
+        # stays a Python loop, and only over the candidates
+        quantity = np.array([
+            self.risk_manager.calculate_position_size(
+                rows[i]['ticker'], 'arbitrage', int(total) / 200, confidence=1.0
+            )
+            for i, total in zip(candidates, total_cents)
+        ], dtype=np.int64)
+        quantity = np.minimum(max_qty, quantity)
+        keep = quantity > 0
+        candidates, total_cents, profit_cents, max_qty, quantity = (
+            candidates[keep], total_cents[keep], profit_cents[keep], max_qty[keep], quantity[keep]
+        )
+        expected_cents = profit_cents * quantity
         
-        if total_cost < 1.0:
-            profit = 1.0 - total_cost
-            
-            # Check if profit exceeds minimum threshold
-            if profit >= self.min_profit:
-                # Calculate max quantity we can trade
-                max_yes_qty = best_yes_ask.get('quantity', 0)
-                max_no_qty = best_no_ask.get('quantity', 0)
-                max_qty = min(max_yes_qty, max_no_qty)
-                
-                # Calculate position size based on risk limits
-                avg_price = total_cost / 2
-                position_size = self.risk_manager.calculate_position_size(
-                    ticker, 'arbitrage', avg_price, confidence=1.0
-                )
-                
-                quantity = min(max_qty, position_size)
-                
-                if quantity > 0:
-                    return {
-                        'ticker': ticker,
-                        'title': market.get('title', ''),
-                        'yes_price': yes_price,
-                        'no_price': no_price,
-                        'total_cost': total_cost,
-                        'profit_per_contract': profit,
-                        'max_quantity': max_qty,
-                        'recommended_quantity': quantity,
-                        'expected_profit': profit * quantity
-                    }
+        # Rank (only the top `limit` when given, O(N log K)); ties keep
+        # market order either way
+        if limit is None:
+            ranked = np.argsort(-expected_cents, kind='stable')
+        else:
+            ranked = heapq.nlargest(limit, range(len(expected_cents)), key=expected_cents.__getitem__)
         
-        return None
+        # Dollar amounts are only derived for the returned rows
+        opportunities = []
+        for j in ranked:
+            i = candidates[j]
+            market = rows[i]
+            opportunities.append({
+                'ticker': market['ticker'],
+                'title': market.get('title', ''),
+                'yes_cents': int(yes_cents[i]),
+                'no_cents': int(no_cents[i]),
+                'yes_price': int(yes_cents[i]) / 100,
+                'no_price': int(no_cents[i]) / 100,
+                'total_cost': int(total_cents[j]) / 100,
+                'profit_per_contract': int(profit_cents[j]) / 100,
+                'max_quantity': int(max_qty[j]),
+                'recommended_quantity': int(quantity[j]),
+                'expected_profit': int(expected_cents[j]) / 100
+            })
+        return opportunities
     
-    def find_opportunities(self, markets: List[Dict] = None, parallel: bool = True) -> List[Dict]:
+    def find_opportunities(self, markets: List[Dict] = None, parallel: bool = True,
+                           limit: Optional[int] = None) -> List[Dict]:
         """
         Find arbitrage opportunities
         
         Args:
             markets: Optional list of markets to scan (fetches if not provided)
             parallel: Use parallel processing for faster scanning
+            limit: Only return the `limit` most profitable opportunities (None = all)
         
         Returns:
             List of arbitrage opportunities
@@ -124,40 +213,56 @@ class ArbitrageStrategy:
         if markets is None:
             markets = self.api.get_markets(limit=1000, status='open')  # Scan more markets
         
-        opportunities = []
+        # Only markets the snapshot can't rule out pay for a full orderbook fetch
+        markets = [m for m in markets if m.get('ticker') and _may_have_arbitrage(m)]
+        orderbooks = None
         
         if parallel:
-            # Parallel scanning - much faster!
-            logger.info(f"Scanning {len(markets)} markets in parallel...")
-            
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # Submit all market checks
-                future_to_market = {
-                    executor.submit(self._check_market_for_arbitrage, market): market 
-                    for market in markets
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_market):
-                    try:
-                        opportunity = future.result()
-                        if opportunity:
-                            opportunities.append(opportunity)
-                            logger.info(f"Found opportunity: {opportunity['ticker']} - ${opportunity['expected_profit']:.4f} profit")
-                    except Exception as e:
-                        logger.error(f"Error checking market: {e}")
-        else:
-            # Sequential scanning - slower but simpler
-            for market in markets:
-                opportunity = self._check_market_for_arbitrage(market)
-                if opportunity:
-                    opportunities.append(opportunity)
-        
-        # Sort by expected profit
-        opportunities.sort(key=lambda x: x['expected_profit'], reverse=True)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                logger.info(f"Scanning {len(markets)} markets concurrently...")
+                markets, orderbooks = run_async(self._fetch_orderbooks_async(markets))
+        
+        if orderbooks is None:
+            # Sequential fetching - slower but simpler (also used when called
+            # from inside an event loop)
+            orderbooks = [self.api.get_orderbook(m['ticker']) for m in markets]
+        
+        # Sorted by expected profit
+        opportunities = self._evaluate_orderbooks(markets, orderbooks, limit)
+        if logger.isEnabledFor(logging.INFO):
+            for opportunity in opportunities:
+                logger.info("Found opportunity: %s - $%.4f profit", opportunity['ticker'], opportunity['expected_profit'])
         
         return opportunities
     
+    async def _fetch_orderbooks_async(self, markets: List[Dict]) -> Tuple[List[Dict], List[Optional[Dict]]]:
+        """
+        Fetch orderbooks in get_orderbooks batches over one shared HTTP/2 session
+        
+        Returns:
+            The markets whose batch succeeded and their orderbook responses
+        """
+        chunks = [markets[i:i + _BATCH_SIZE] for i in range(0, len(markets), _BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(_MAX_BATCHES_IN_FLIGHT)
+        
+        async def fetch(chunk):
+            async with semaphore:
+                return await self.api.get_orderbooks_async([m['ticker'] for m in chunk])
+        
+        async with self.api.async_session():
+            batches = await asyncio.gather(*(fetch(c) for c in chunks), return_exceptions=True)
+        
+        fetched_markets, orderbooks = [], []
+        for chunk, batch in zip(chunks, batches):
+            if isinstance(batch, Exception):
+                logger.error(f"Error checking {len(chunk)} markets from {chunk[0]['ticker']}: {batch}")
+                continue
+            fetched_markets.extend(chunk)
+            orderbooks.extend(batch)
+        return fetched_markets, orderbooks
+    
     def execute_arbitrage(self, opportunity: Dict, dry_run: bool = False) -> Dict:
         """
         Execute an arbitrage trade
@@ -172,6 +277,8 @@ class ArbitrageStrategy:
         ticker = opportunity['ticker']
         yes_price = opportunity['yes_price']
         no_price = opportunity['no_price']
+        yes_cents = opportunity['yes_cents']
+        no_cents = opportunity['no_cents']
         quantity = opportunity['recommended_quantity']
         
         logger.info(
@@ -207,32 +314,21 @@ class ArbitrageStrategy:
         
         # Place orders
         try:
-            # Place YES order
-            yes_order = self.api.place_order(
-                ticker=ticker,
-                side='yes',
-                quantity=quantity,
-                order_type='limit',
-                price=int(yes_price * 100)  # Convert to cents
-            )
-            
-            if not yes_order:
-                return {'status': 'error', 'reason': 'Failed to place YES order'}
-            
-            # Place NO order
-            no_order = self.api.place_order(
-                ticker=ticker,
-                side='no',
-                quantity=quantity,
-                order_type='limit',
-                price=int(no_price * 100)  # Convert to cents
-            )
+            # Place both legs in one batch request
+            yes_order, no_order = self.api.place_orders_batch([
+                {'ticker': ticker, 'side': 'yes', 'quantity': quantity,
+                 'order_type': 'limit', 'price': yes_cents},
+                {'ticker': ticker, 'side': 'no', 'quantity': quantity,
+                 'order_type': 'limit', 'price': no_cents}
+            ])
             
-            if not no_order:
-                # Cancel YES order if NO order fails
-                if yes_order.get('order_id'):
-                    self.api.cancel_order(yes_order['order_id'])
-                return {'status': 'error', 'reason': 'Failed to place NO order'}
+            if not (yes_order and no_order):
+                # Legs are accepted independently: cancel the one that went through
+                for order in (yes_order, no_order):
+                    if order and order.get('order_id'):
+                        self.api.cancel_order(order['order_id'])
+                failed = 'YES' if not yes_order else 'NO'
+                return {'status': 'error', 'reason': f'Failed to place {failed} order'}
             
             # Update risk manager
             self.risk_manager.update_position(ticker, 'yes', quantity, yes_price, 'add')
@@ -266,7 +362,7 @@ class ArbitrageStrategy:
         """
         logger.info("Scanning for arbitrage opportunities...")
         
-        opportunities = self.find_opportunities()
+        opportunities = self.find_opportunities(limit=max_opportunities)
         
         if not opportunities:
             logger.info("No arbitrage opportunities found")
@@ -2,16 +2,22 @@
 Copy trading strategy for Kalshi
 Monitors and replicates trades from successful accounts
 """
+import asyncio
 import logging
 import time
-from typing import Dict, List, Set
+from collections import deque
+from typing import Deque, Dict, List, Set
 from datetime import datetime, timedelta
 from api_client import KalshiAPI
 from risk_manager import RiskManager
 from config import Config
+from utils import run_async
 
 logger = logging.getLogger(__name__)
 
+# Recent trade IDs remembered per followed account
+_SEEN_TRADES_MAX = 256
+
 
 class CopyTradingStrategy:
     """Copy trading strategy following successful accounts"""
@@ -28,8 +34,10 @@ class CopyTradingStrategy:
         self.risk_manager = risk_manager
         self.copy_ratio = Config.COPY_TRADE_RATIO
         
-        # Track last seen trades to avoid duplicates
+        # Track last seen trades to avoid duplicates: a set for membership
+        # tests plus a bounded deque that evicts the oldest IDs from it
         self.last_trade_ids: Dict[str, Set[str]] = {}
+        self._seen_order: Dict[str, Deque[str]] = {}
     
     def monitor_account(self, account_id: str, min_trade_size: int = 10) -> List[Dict]:
         """
@@ -44,43 +52,71 @@ class CopyTradingStrategy:
         """
         # Get recent trades
         trades = self.api.get_account_trades(account_id, limit=50)
+        return self._find_new_trades(account_id, trades, min_trade_size)
+    
+    async def monitor_account_async(self, account_id: str, min_trade_size: int = 10) -> List[Dict]:
+        """Async variant of monitor_account"""
+        trades = await self.api.get_account_trades_async(account_id, limit=50)
+        return self._find_new_trades(account_id, trades, min_trade_size)
+    
+    def _find_new_trades(self, account_id: str, trades: List[Dict], min_trade_size: int) -> List[Dict]:
+        """
+        Pick out an account's trades that haven't been seen before
+        
+        Args:
+            account_id: Account ID the trades belong to
+            trades: Recent trades of the account
+            min_trade_size: Minimum trade size to copy
         
+        Returns:
+            List of new trades to copy
+        """
         if not trades:
-            logger.warning(f"No trades found for account {account_id}")
+            logger.warning("No trades found for account %s", account_id)
             return []
         
         # Initialize tracking for this account
-        if account_id not in self.last_trade_ids:
+        seen = self.last_trade_ids.get(account_id)
+        if seen is None:
             # First time monitoring - store all current trade IDs
-            self.last_trade_ids[account_id] = set(
-                t.get('trade_id', str(i)) for i, t in enumerate(trades)
-            )
-            logger.info(f"Initialized monitoring for {account_id} with {len(trades)} trades")
+            self.last_trade_ids[account_id] = seen = set()
+            self._seen_order[account_id] = deque(maxlen=_SEEN_TRADES_MAX)
+            for trade in trades:
+                trade_id = trade.get('trade_id') or trade.get('fill_id')
+                if trade_id and trade_id not in seen:
+                    self._remember_trade(account_id, trade_id)
+            logger.info("Initialized monitoring for %s with %d trades", account_id, len(trades))
             return []
         
         # Find new trades
         new_trades = []
-        current_trade_ids = set()
         
         for trade in trades:
-            trade_id = trade.get('trade_id', trade.get('fill_id', ''))
-            current_trade_ids.add(trade_id)
+            trade_id = trade.get('trade_id') or trade.get('fill_id')
             
             # Check if this is a new trade
-            if trade_id and trade_id not in self.last_trade_ids[account_id]:
+            if trade_id and trade_id not in seen:
+                self._remember_trade(account_id, trade_id)
+                
                 # Check minimum size
                 size = trade.get('count', trade.get('quantity', 0))
                 if size >= min_trade_size:
                     new_trades.append(trade)
         
-        # Update tracking
-        self.last_trade_ids[account_id] = current_trade_ids
-        
         if new_trades:
-            logger.info(f"Found {len(new_trades)} new trades from {account_id}")
+            logger.info("Found %d new trades from %s", len(new_trades), account_id)
         
         return new_trades
     
+    def _remember_trade(self, account_id: str, trade_id: str):
+        """Mark a trade as seen, forgetting the oldest one once the window is full"""
+        seen = self.last_trade_ids[account_id]
+        order = self._seen_order[account_id]
+        if len(order) == order.maxlen:
+            seen.discard(order[0])
+        order.append(trade_id)
+        seen.add(trade_id)
+    
     def copy_trade(self, trade: Dict, ratio: float = None, dry_run: bool = False) -> Dict:
         """
         Copy a trade
@@ -107,8 +143,8 @@ class CopyTradingStrategy:
             return {'status': 'skipped', 'reason': 'Copy size too small'}
         
         logger.info(
-            f"Copying trade: {ticker} {side.upper()} "
-            f"{copy_size} @ ${price:.2f} (ratio: {ratio:.1%})"
+            "Copying trade: %s %s %d @ $%.2f (ratio: %.1f%%)",
+            ticker, side.upper(), copy_size, price, ratio * 100
         )
         
         if dry_run or not Config.ENABLE_TRADING:
@@ -127,7 +163,7 @@ class CopyTradingStrategy:
         )
         
         if not is_valid:
-            logger.warning(f"Order validation failed: {reason}")
+            logger.warning("Order validation failed: %s", reason)
             return {'status': 'error', 'reason': reason}
         
         # Place order
@@ -146,7 +182,7 @@ class CopyTradingStrategy:
             # Update risk manager
             self.risk_manager.update_position(ticker, side, copy_size, price, 'add')
             
-            logger.info(f"Successfully copied trade on {ticker}")
+            logger.info("Successfully copied trade on %s", ticker)
             
             return {
                 'status': 'success',
@@ -161,6 +197,37 @@ class CopyTradingStrategy:
             logger.error(f"Failed to copy trade: {e}")
             return {'status': 'error', 'reason': str(e)}
     
+    def _poll_accounts(self, follow_accounts: List[str]) -> List:
+        """
+        Check every followed account for new trades
+        
+        Args:
+            follow_accounts: List of account IDs to follow
+        
+        Returns:
+            New trades (or the exception raised) for each account, in order
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_async(self._poll_accounts_async(follow_accounts))
+        
+        # Called from inside an event loop: poll sequentially
+        polled = []
+        for account_id in follow_accounts:
+            try:
+                polled.append(self.monitor_account(account_id))
+            except Exception as e:
+                polled.append(e)
+        return polled
+    
+    async def _poll_accounts_async(self, follow_accounts: List[str]) -> List:
+        async with self.api.async_session():
+            return await asyncio.gather(
+                *(self.monitor_account_async(account_id) for account_id in follow_accounts),
+                return_exceptions=True
+            )
+    
     def run(self, follow_accounts: List[str], interval: int = 60, 
             max_iterations: int = None, dry_run: bool = False) -> List[Dict]:
         """
@@ -190,21 +257,21 @@ class CopyTradingStrategy:
                 iteration += 1
                 logger.info(f"Iteration {iteration}")
                 
-                # Monitor each account
-                for account_id in follow_accounts:
+                # Monitor every account concurrently, then copy new trades
+                polled = self._poll_accounts(follow_accounts)
+                for account_id, new_trades in zip(follow_accounts, polled):
+                    if isinstance(new_trades, Exception):
+                        logger.error(f"Error monitoring {account_id}: {new_trades}")
+                        continue
+                    
                     try:
-                        new_trades = self.monitor_account(account_id)
-                        
                         # Copy new trades
                         for trade in new_trades:
                             result = self.copy_trade(trade, dry_run=dry_run)
                             results.append(result)
-                            
-                            # Brief pause between trades
-                            time.sleep(1)
                     
                     except Exception as e:
-                        logger.error(f"Error monitoring {account_id}: {e}")
+                        logger.error(f"Error copying trades from {account_id}: {e}")
                 
                 # Wait before next iteration
                 if max_iterations is None or iteration < max_iterations:
@@ -2,15 +2,35 @@
 Market making strategy for Kalshi
 Provides liquidity and captures bid-ask spread
 """
+import asyncio
 import logging
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from api_client import KalshiAPI
 from risk_manager import RiskManager
 from config import Config
+from utils import run_async
 
 logger = logging.getLogger(__name__)
 
+# Mid-price move, as a fraction of the target spread, below which standing
+# quotes are left in place instead of being cancelled and replaced
+_REQUOTE_EPSILON = 0.25
+
+
+def _orderbook_digest(orderbook: Dict) -> int:
+    """
+    Hash the content of a parsed orderbook
+    
+    Args:
+        orderbook: Orderbook with 'yes' and 'no' lists of Level records
+    
+    Returns:
+        Hash that changes whenever any price level or size changes
+    """
+    return hash((tuple(orderbook.get('yes') or ()), tuple(orderbook.get('no') or ())))
+
 
 class MarketMakerStrategy:
     """Market making strategy providing liquidity"""
@@ -30,6 +50,12 @@ class MarketMakerStrategy:
         
         # Track our active quotes
         self.active_quotes: Dict[str, Dict] = {}
+        
+        # Mid price and inventory behind the last quotes placed per ticker
+        self._last_quotes: Dict[str, Dict] = {}
+        
+        # Content hash of the orderbook the current quotes were checked against
+        self._orderbook_hash: Dict[str, int] = {}
     
     def calculate_quotes(self, ticker: str, orderbook: Dict, 
                         current_inventory: int = 0) -> Optional[Dict]:
@@ -38,26 +64,23 @@ class MarketMakerStrategy:
         
         Args:
             ticker: Market ticker
-            orderbook: Current orderbook
+            orderbook: Current orderbook, each side a list of utils.Level
             current_inventory: Current position in this market
         
         Returns:
             Dictionary with bid and ask prices, or None if can't quote
         """
+        # Kalshi books hold bids only: a YES ask is the complement of the
+        # best NO bid
         yes_bids = orderbook.get('yes', [])
-        yes_asks = orderbook.get('yes', [])
         no_bids = orderbook.get('no', [])
-        no_asks = orderbook.get('no', [])
         
-        if not (yes_bids and yes_asks):
+        if not (yes_bids and no_bids):
             return None
         
-        # Get mid price
-        best_yes_bid = max(yes_bids, key=lambda x: x.get('price', 0))
-        best_yes_ask = min(yes_asks, key=lambda x: x.get('price', float('inf')))
-        
-        yes_bid_price = best_yes_bid.get('price', 0) / 100
-        yes_ask_price = best_yes_ask.get('price', 100) / 100
+        # Get mid price (take the max rather than trusting the level order)
+        yes_bid_price = max(level.price for level in yes_bids) / 100
+        yes_ask_price = 1 - max(level.price for level in no_bids) / 100
         
         mid_price = (yes_bid_price + yes_ask_price) / 2
         
@@ -93,6 +116,26 @@ class MarketMakerStrategy:
             'spread': our_ask - our_bid
         }
     
+    def _quotes_unchanged(self, ticker: str, quotes: Dict, current_inventory: int) -> bool:
+        """
+        Check whether the last quotes placed on a ticker are still good
+        
+        Args:
+            ticker: Market ticker
+            quotes: Freshly calculated quotes
+            current_inventory: Current position in this market
+        
+        Returns:
+            True if the mid price barely moved and inventory is the same
+        """
+        last = self._last_quotes.get(ticker)
+        if last is None:
+            return False
+        return (
+            last['inventory'] == current_inventory
+            and abs(quotes['mid_price'] - last['mid_price']) < _REQUOTE_EPSILON * self.target_spread
+        )
+    
     def place_quotes(self, ticker: str, quotes: Dict, 
                     quantity: int, dry_run: bool = False) -> Dict:
         """
@@ -111,8 +154,8 @@ class MarketMakerStrategy:
         ask_price = quotes['ask_price']
         
         logger.info(
-            f"Placing quotes on {ticker}: "
-            f"Bid {quantity} @ ${bid_price:.2f}, Ask {quantity} @ ${ask_price:.2f}"
+            "Placing quotes on %s: Bid %d @ $%.2f, Ask %d @ $%.2f",
+            ticker, quantity, bid_price, quantity, ask_price
         )
         
         if dry_run or not Config.ENABLE_TRADING:
@@ -125,36 +168,31 @@ class MarketMakerStrategy:
                 'quantity': quantity
             }
         
-        # Cancel existing quotes for this ticker
-        self.cancel_quotes(ticker)
+        # Bid buys YES at the lower price; ask sells YES at the higher price,
+        # which means buying NO (NO price = 1 - YES price)
+        orders = [
+            {'ticker': ticker, 'side': 'yes', 'quantity': quantity,
+             'order_type': 'limit', 'price': int(bid_price * 100)},
+            {'ticker': ticker, 'side': 'no', 'quantity': quantity,
+             'order_type': 'limit', 'price': int((1 - ask_price) * 100)}
+        ]
         
         try:
-            # Place bid (buy YES at lower price)
-            bid_order = self.api.place_order(
-                ticker=ticker,
-                side='yes',
-                quantity=quantity,
-                order_type='limit',
-                price=int(bid_price * 100)
-            )
-            
-            if not bid_order:
-                return {'status': 'error', 'reason': 'Failed to place bid'}
+            # Move standing quotes in place; if there are none, or an amend is
+            # rejected (e.g. the order already filled), cancel and place anew
+            bid_order, ask_order = self._amend_quotes(ticker, orders)
             
-            # Place ask (sell YES at higher price, which means buy NO)
-            ask_order = self.api.place_order(
-                ticker=ticker,
-                side='no',
-                quantity=quantity,
-                order_type='limit',
-                price=int((1 - ask_price) * 100)  # NO price = 1 - YES price
-            )
+            if not (bid_order and ask_order):
+                self.cancel_quotes(ticker)
+                bid_order, ask_order = self.api.place_orders_batch(orders)
             
-            if not ask_order:
-                # Cancel bid if ask fails
-                if bid_order.get('order_id'):
-                    self.api.cancel_order(bid_order['order_id'])
-                return {'status': 'error', 'reason': 'Failed to place ask'}
+            if not (bid_order and ask_order):
+                # Sides are accepted independently: cancel the one that went through
+                for order in (bid_order, ask_order):
+                    if order and order.get('order_id'):
+                        self.api.cancel_order(order['order_id'])
+                failed = 'bid' if not bid_order else 'ask'
+                return {'status': 'error', 'reason': f'Failed to place {failed}'}
             
             # Track active quotes
             self.active_quotes[ticker] = {
@@ -165,7 +203,7 @@ class MarketMakerStrategy:
                 'quantity': quantity
             }
             
-            logger.info(f"Successfully placed quotes on {ticker}")
+            logger.info("Successfully placed quotes on %s", ticker)
             
             return {
                 'status': 'success',
@@ -178,6 +216,27 @@ class MarketMakerStrategy:
             logger.error(f"Failed to place quotes: {e}")
             return {'status': 'error', 'reason': str(e)}
     
+    def _amend_quotes(self, ticker: str, orders: List[Dict]) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Amend the standing bid and ask on a ticker to new orders
+        
+        Args:
+            ticker: Market ticker
+            orders: New bid and ask, as place_orders_batch arguments
+        
+        Returns:
+            Amended bid and ask orders, (None, None) if there is nothing to amend
+        """
+        quote = self.active_quotes.get(ticker)
+        if not (quote and quote.get('bid_order_id') and quote.get('ask_order_id')):
+            return None, None
+        
+        bid_order, ask_order = self.api.amend_orders([
+            dict(orders[0], order_id=quote['bid_order_id']),
+            dict(orders[1], order_id=quote['ask_order_id'])
+        ])
+        return bid_order, ask_order
+    
     def cancel_quotes(self, ticker: str = None):
         """
         Cancel quotes for a ticker or all tickers
@@ -196,7 +255,9 @@ class MarketMakerStrategy:
                     self.api.cancel_order(quote['ask_order_id'])
                 
                 del self.active_quotes[ticker]
-                logger.info(f"Cancelled quotes for {ticker}")
+                self._last_quotes.pop(ticker, None)
+                self._orderbook_hash.pop(ticker, None)
+                logger.info("Cancelled quotes for %s", ticker)
         else:
             # Cancel all quotes
             for t in list(self.active_quotes.keys()):
@@ -227,6 +288,35 @@ class MarketMakerStrategy:
         
         return to_close
     
+    def _fetch_market_data(self, markets: List[str]) -> Tuple[List[Dict], List[Optional[Dict]]]:
+        """
+        Fetch positions and the orderbook of every market concurrently
+        
+        Args:
+            markets: List of market tickers
+        
+        Returns:
+            Positions and orderbook responses aligned with `markets`
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_async(self._fetch_market_data_async(markets))
+        
+        # Called from inside an event loop: fall back to a thread pool
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            positions = executor.submit(self.api.get_positions)
+            orderbooks = list(executor.map(self.api.get_orderbook, markets))
+            return positions.result(), orderbooks
+    
+    async def _fetch_market_data_async(self, markets: List[str]) -> Tuple[List[Dict], List[Optional[Dict]]]:
+        async with self.api.async_session():
+            positions, *orderbooks = await asyncio.gather(
+                self.api.get_positions_async(),
+                *(self.api.get_orderbook_async(ticker) for ticker in markets)
+            )
+        return positions, orderbooks
+    
     def run(self, markets: List[str], refresh_interval: int = 30,
             max_iterations: int = None, dry_run: bool = False) -> List[Dict]:
         """
@@ -256,25 +346,38 @@ class MarketMakerStrategy:
                 iteration += 1
                 logger.info(f"Iteration {iteration}")
                 
-                # Get current positions
-                positions = self.api.get_positions()
+                # Get current positions and orderbooks
+                positions, orderbooks = self._fetch_market_data(markets)
                 position_map = {p.get('ticker'): p.get('position', 0) for p in positions}
                 
                 # Update quotes for each market
-                for ticker in markets:
+                for ticker, response in zip(markets, orderbooks):
                     try:
-                        # Get orderbook
-                        orderbook = self.api.get_orderbook(ticker)
+                        # Kalshi nests orderbook data under 'orderbook' key
+                        orderbook = response.get('orderbook') if response else None
                         if not orderbook:
-                            logger.warning(f"No orderbook for {ticker}")
+                            logger.warning("No orderbook for %s", ticker)
                             continue
                         
-                        # Calculate quotes
+                        # Same book and inventory as last time: quotes still stand
                         current_inventory = position_map.get(ticker, 0)
+                        book_hash = _orderbook_digest(orderbook)
+                        last = self._last_quotes.get(ticker)
+                        if (self._orderbook_hash.get(ticker) == book_hash
+                                and last is not None and last['inventory'] == current_inventory):
+                            logger.debug("Orderbook unchanged for %s", ticker)
+                            continue
+                        
+                        # Calculate quotes
                         quotes = self.calculate_quotes(ticker, orderbook, current_inventory)
                         
                         if not quotes:
-                            logger.warning(f"Could not calculate quotes for {ticker}")
+                            logger.warning("Could not calculate quotes for %s", ticker)
+                            continue
+                        
+                        if self._quotes_unchanged(ticker, quotes, current_inventory):
+                            logger.debug("Quotes unchanged for %s", ticker)
+                            self._orderbook_hash[ticker] = book_hash
                             continue
                         
                         # Calculate quote size
@@ -283,14 +386,18 @@ class MarketMakerStrategy:
                         )
                         
                         if quote_size <= 0:
-                            logger.warning(f"No available size for {ticker}")
+                            logger.warning("No available size for %s", ticker)
                             continue
                         
                         # Place quotes
                         result = self.place_quotes(ticker, quotes, quote_size, dry_run)
                         results.append(result)
-                        
-                        time.sleep(0.5)  # Brief pause between markets
+                        if result['status'] in ('success', 'dry_run'):
+                            self._last_quotes[ticker] = {
+                                'mid_price': quotes['mid_price'],
+                                'inventory': current_inventory
+                            }
+                            self._orderbook_hash[ticker] = book_hash
                     
                     except Exception as e:
                         logger.error(f"Error making market on {ticker}: {e}")
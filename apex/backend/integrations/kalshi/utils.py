@@ -1,11 +1,22 @@
 """
 Utility functions for Kalshi bot
 """
+import asyncio
 import time
 import logging
-from typing import List, Dict, Any
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Dict, List, Tuple, TypeVar
 from datetime import datetime
-from collections import deque
+from itertools import starmap
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:  # uvloop ships with uvicorn[standard]; fall back to the stock loop
+    uvloop = None
+
+T = TypeVar('T')
 
 
 def setup_logging(log_level: str = 'INFO', log_file: str = None):
@@ -39,25 +50,66 @@ class RateLimiter:
             calls_per_second: Maximum API calls per second
         """
         self.calls_per_second = calls_per_second
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0
-        self.call_times = deque(maxlen=calls_per_second)
+        # Leaky bucket on the monotonic clock: calls are spaced one interval
+        # apart, and _next_slot_ns is the earliest time the next may go out
+        self._interval_ns = 10**9 // calls_per_second
+        self._next_slot_ns = 0
+        self._lock = threading.Lock()
     
-    def wait_if_needed(self):
-        """Wait if necessary to respect rate limit"""
-        now = time.time()
-        
-        # Remove calls older than 1 second
-        while self.call_times and now - self.call_times[0] > 1.0:
-            self.call_times.popleft()
+    def _reserve_ns(self) -> int:
+        """
+        Claim the next call slot
         
-        # If we've hit the limit, wait
-        if len(self.call_times) >= self.calls_per_second:
-            sleep_time = 1.0 - (now - self.call_times[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        Returns:
+            Nanoseconds to wait before the slot opens (may be negative)
+        """
+        with self._lock:
+            now = time.monotonic_ns()
+            wait_ns = self._next_slot_ns - now
+            self._next_slot_ns = max(now, self._next_slot_ns) + self._interval_ns
+        return wait_ns
+    
+    def wait_if_needed(self):
+        """Wait if necessary to respect rate limit (safe to call from multiple threads)"""
+        # The slot is reserved, so other threads can queue up behind it
+        wait_ns = self._reserve_ns()
+        if wait_ns > 0:
+            time.sleep(wait_ns / 1e9)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """Rate limiter that also lets coroutines wait without blocking the event loop"""
+    
+    async def acquire(self):
+        """
+        Wait asynchronously if necessary to respect rate limit
         
-        self.call_times.append(time.time())
+        The slot is claimed under the lock and the sleep happens outside it,
+        so concurrent coroutines wait out their own slots in parallel. Sync
+        callers of wait_if_needed draw on the same budget.
+        """
+        wait_ns = self._reserve_ns()
+        if wait_ns > 0:
+            await asyncio.sleep(wait_ns / 1e9)
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop
+    
+    Used by the sync entry points that fan out async requests; the loop is
+    uvloop's when it is installed.
+    
+    Args:
+        coro: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
 
 
 def format_timestamp(timestamp: Any) -> str:
@@ -150,20 +202,20 @@ def calculate_statistics(values: List[float]) -> Dict[str, float]:
             'p95': 0
         }
     
-    import numpy as np
-    
-    arr = np.array(values)
+    arr = np.asarray(values, dtype=np.float64)
+    # One call partitions the data for every percentile; p50 is the median
+    p25, p50, p75, p90, p95 = np.percentile(arr, [25, 50, 75, 90, 95])
     
     return {
-        'mean': float(np.mean(arr)),
-        'median': float(np.median(arr)),
-        'std': float(np.std(arr)),
-        'min': float(np.min(arr)),
-        'max': float(np.max(arr)),
-        'p25': float(np.percentile(arr, 25)),
-        'p75': float(np.percentile(arr, 75)),
-        'p90': float(np.percentile(arr, 90)),
-        'p95': float(np.percentile(arr, 95))
+        'mean': float(arr.mean()),
+        'median': float(p50),
+        'std': float(arr.std()),
+        'min': float(arr.min()),
+        'max': float(arr.max()),
+        'p25': float(p25),
+        'p75': float(p75),
+        'p90': float(p90),
+        'p95': float(p95)
     }
 
 
@@ -265,3 +317,81 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
         Result of division or default
     """
     return numerator / denominator if denominator != 0 else default
+
+
+# Fill fields in priority order; the first one present wins
+PRICE_KEYS = ('yes_price', 'no_price', 'price')
+SIZE_KEYS = ('count', 'quantity', 'size')
+TIMESTAMP_KEYS = ('created_time', 'timestamp')
+TICKER_KEYS = ('ticker', 'market_ticker')
+
+
+def _first(d: Dict, keys: Tuple[str, ...], default=0):
+    """Value of the first key in `keys` present in `d` (stops at the first hit)"""
+    for key in keys:
+        if key in d:
+            return d[key]
+    return default
+
+
+@dataclass(slots=True)
+class TradeFeatures:
+    """
+    Structure-of-arrays view of a fill list, aligned by trade index
+    
+    sizes/prices hold 0 where a fill has no (or a null) size/price; prices
+    stay in cents. timestamps keep the raw API value (None when missing)
+    and tickers is an object array using '' when missing.
+    """
+    sizes: np.ndarray
+    prices: np.ndarray
+    timestamps: List[Any]
+    tickers: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+
+def extract_trade_features(trades: List[Dict]) -> TradeFeatures:
+    """
+    Walk the fill list once and return the columns every consumer needs
+    
+    The bot detector and the account scanner's trade stats both read the
+    same fields, so fills are converted here once (see
+    KalshiAPI.get_account_trades_soa) and only the arrays are passed on.
+    """
+    sizes, prices, timestamps, tickers = [], [], [], []
+    for trade in trades:
+        sizes.append(_first(trade, SIZE_KEYS) or 0)
+        prices.append(_first(trade, PRICE_KEYS) or 0)
+        timestamps.append(_first(trade, TIMESTAMP_KEYS, None))
+        tickers.append(_first(trade, TICKER_KEYS, '') or '')
+    return TradeFeatures(
+        sizes=np.asarray(sizes, dtype=np.float64),
+        prices=np.asarray(prices, dtype=np.float64),
+        timestamps=timestamps,
+        tickers=np.asarray(tickers, dtype=object),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class Level:
+    """One orderbook price level; price in cents"""
+    price: int
+    quantity: int
+
+
+def parse_orderbook_levels(orders: Any) -> List[Level]:
+    """
+    Convert one side of an orderbook to Level objects, keeping their order
+    
+    Accepts both {'price': ..., 'quantity': ...} dicts and the
+    [price, quantity] pairs Kalshi returns; anything that isn't a list
+    yields an empty side. The shape is checked once per side rather than
+    per level, since a response never mixes the two.
+    """
+    if not isinstance(orders, list) or not orders:
+        return []
+    if isinstance(orders[0], dict):
+        return [Level(order.get('price', 0), order.get('quantity', 0)) for order in orders]
+    return list(starmap(Level, orders))
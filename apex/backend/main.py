@@ -7,7 +7,7 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any
+from typing import Set, Dict, Any
 import asyncio
 import hmac
 import json
@@ -15,6 +15,7 @@ import os
 import logging
 import importlib
 
+import orjson
 from dotenv import load_dotenv
 
 # Load .env from Apex backend only
@@ -39,30 +40,31 @@ class WebSocketHub:
     """Central WebSocket manager for all domains."""
 
     def __init__(self):
-        self.connections: List[WebSocket] = []
+        self.connections: Set[WebSocket] = set()
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        self.connections.append(ws)
+        self.connections.add(ws)
         logger.info(f"WS connected. Total: {len(self.connections)}")
 
     def disconnect(self, ws: WebSocket):
         if ws in self.connections:
-            self.connections.remove(ws)
+            self.connections.discard(ws)
             logger.info(f"WS disconnected. Total: {len(self.connections)}")
 
     async def broadcast(self, channel: str, msg_type: str, data: Any):
         """Send a message to all connected clients."""
-        message = {"channel": channel, "type": msg_type, "data": data}
-        dead = []
-        for ws in self.connections:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            if ws in self.connections:
-                self.connections.remove(ws)
+        # Encode once for every client instead of once per send_json call
+        payload = orjson.dumps(
+            {"channel": channel, "type": msg_type, "data": data},
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+        # Send to every client at once so one slow socket doesn't hold up the rest
+        targets = tuple(self.connections)
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in targets), return_exceptions=True
+        )
+        self.connections -= {ws for ws, result in zip(targets, results) if isinstance(result, Exception)}
 
 
 hub = WebSocketHub()
@@ -78,6 +80,7 @@ async def lifespan(app: FastAPI):
         logger.warning("Recovered %d stale jobs on startup", recovered)
     yield
     logger.info("🛑 Apex Terminal shutting down...")
+    kalshi.reset_api_client()
 
 
 # ── Rate Limiting ──
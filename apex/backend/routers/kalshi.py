@@ -11,6 +11,7 @@ import logging
 import os
 import sys
 import re
+import threading
 import time
 from datetime import datetime, timezone
 from core.config_manager import get_config
@@ -33,6 +34,9 @@ _activity_log: List[Dict[str, Any]] = []
 _ACTIVITY_LOG_MAX = 100
 _ALERT_COOLDOWN_SEC = 60
 _candidate_alert_last_sent: Dict[str, float] = {}
+_api_client: Optional[Any] = None
+_public_api_client: Optional[Any] = None  # Unauthenticated stand-in until credentials load
+_api_client_lock = threading.Lock()
 
 
 def _get_trading_mode() -> str:
@@ -275,9 +279,40 @@ class WhalesResponse(BaseModel):
 
 # ── Helpers ──
 def _get_api():
-    """Lazy-load Kalshi API client."""
-    from api_client import KalshiAPI
-    return KalshiAPI()
+    """Lazy-load the shared Kalshi API client (one connection pool for all endpoints and strategies).
+
+    Until a client loads its credentials, every call retries them so a key
+    that becomes readable later is picked up; meanwhile one unauthenticated
+    client is shared for public endpoints and each failed retry is closed.
+    """
+    global _api_client, _public_api_client
+    with _api_client_lock:
+        if _api_client is not None:
+            return _api_client
+        from api_client import KalshiAPI
+        api = KalshiAPI()
+        if _api_is_authenticated(api):
+            _api_client = api
+            stale, _public_api_client = _public_api_client, None
+        elif _public_api_client is None:
+            _public_api_client = api
+            stale = None
+        else:
+            api, stale = _public_api_client, api
+    if stale is not None:
+        stale.close()
+    return api
+
+
+def reset_api_client() -> None:
+    """Drop the shared Kalshi API clients and close their connection pools."""
+    global _api_client, _public_api_client
+    with _api_client_lock:
+        clients = (_api_client, _public_api_client)
+        _api_client = _public_api_client = None
+    for api in clients:
+        if api is not None:
+            api.close()
 
 
 def _api_is_authenticated(api: Any) -> bool:
@@ -107,3 +107,41 @@ def test_kalshi_place_order_success_contract(monkeypatch):
     body = resp.json()
     assert body["success"] is True
     assert body["order"]["order_id"] == "abc123"
+
+
+def test_kalshi_client_is_shared_only_once_authenticated(monkeypatch):
+    import api_client
+
+    built = []
+    authenticated = [False]
+
+    class _API:
+        def __init__(self):
+            self.api_key_id = "key-id"
+            self.private_key_obj = object() if authenticated[0] else None
+            self.closed = False
+            built.append(self)
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(api_client, "KalshiAPI", _API)
+    monkeypatch.setattr(kalshi, "_api_client", None)
+    monkeypatch.setattr(kalshi, "_public_api_client", None)
+
+    # Without credentials one public client is shared and each retry is closed
+    public = kalshi._get_api()
+    assert kalshi._get_api() is public
+    assert built[1].closed and not public.closed
+
+    # Once the key loads, the authenticated client replaces the public one
+    authenticated[0] = True
+    authed = kalshi._get_api()
+    assert authed is not public and public.closed
+    assert kalshi._get_api() is authed
+    assert len(built) == 3
+
+    kalshi.reset_api_client()
+    assert authed.closed
+    assert kalshi._get_api() is not authed
+    kalshi.reset_api_client()
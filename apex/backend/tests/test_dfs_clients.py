@@ -0,0 +1,83 @@
+import asyncio  # noqa: I001  (the routers import must run before the vendored ones)
+
+import httpx
+import pytest
+
+from routers import dfs as _dfs_router  # noqa: F401  (puts the vendored DFS app on sys.path)
+from app.core import clients
+
+
+def _patch_transport(monkeypatch, handler):
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        clients.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(clients, "_RETRY_BASE_DELAY", 0.0)
+
+
+def test_get_json_retries_transient_errors(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("slow upstream", request=request)
+        if len(calls) == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json=[{"id": "evt1"}])
+
+    _patch_transport(monkeypatch, handler)
+    client = clients.PropOddsClient()
+    client.api_key = "test-key"
+
+    events = asyncio.run(client.get_upcoming_events("nba"))
+    assert events == [{"id": "evt1"}]
+    assert len(calls) == 3
+
+
+def test_get_json_does_not_retry_plan_errors(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(429)
+
+    _patch_transport(monkeypatch, handler)
+    client = clients.PropOddsClient()
+    client.api_key = "test-key"
+
+    with pytest.raises(clients.PropOddsPlanError):
+        asyncio.run(client.get_upcoming_events("nba"))
+    assert len(calls) == 1
+
+
+def test_parsed_props_keep_mapping_access():
+    event = {"id": "evt1", "commence_time": "2026-02-19T23:00:00Z", "home_team": "A", "away_team": "B"}
+    event_odds = {
+        "bookmakers": [
+            {
+                "key": "fanduel",
+                "markets": [
+                    {
+                        "key": "player_points",
+                        "outcomes": [
+                            {"description": "LeBron James", "name": "Over", "point": 24.5, "price": -115},
+                            {"description": "LeBron James", "name": "Under", "point": 24.5, "price": -105},
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+    props = clients.PropOddsClient()._parse_props_from_event(event, event_odds)
+
+    assert len(props) == 2
+    over = props[0]
+    assert over.market == "player_points"
+    assert over["player_name"] == "LeBron James"
+    assert over.get("odds") == -115
+    assert over.get("missing", "fallback") == "fallback"
+    assert dict(over)["book"] == "fanduel"
+    assert dict(over)["event_id"] == "evt1"
@@ -0,0 +1,58 @@
+import pytest  # noqa: I001  (the routers import must run before the vendored ones)
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from account_scanner import AccountScanner
+
+
+def _stats(trades):
+    return AccountScanner.__new__(AccountScanner)._calculate_trade_stats(trades)
+
+
+def test_total_volume_pairs_each_trade_size_with_its_own_price():
+    trades = [
+        {"ticker": "KXA", "count": 10, "yes_price": 0},  # no price: excluded from volume
+        {"ticker": "KXA", "count": 2, "yes_price": 50},
+        {"ticker": "KXB", "count": 0, "yes_price": 90},  # no size: excluded from volume
+        {"ticker": "KXB", "count": 4, "no_price": 25},
+    ]
+
+    stats = _stats(trades)
+
+    assert stats["total_volume"] == pytest.approx(2 * 0.50 + 4 * 0.25)
+    assert stats["unique_markets"] == 2
+    assert stats["max_size"] == 10
+    assert stats["median_price"] == pytest.approx(0.50)
+
+
+def test_trade_stats_without_priced_trades_report_zero_volume():
+    stats = _stats([{"ticker": "KXA", "count": 3}])
+
+    assert stats["total_volume"] == 0
+    assert "avg_price" not in stats
+
+
+def test_scan_account_extracts_trade_features_once(monkeypatch):
+    import account_scanner
+    from bot_detector import BotDetector
+
+    trades = [
+        {"market_ticker": f"KX{i % 4}", "count": 5, "yes_price": 40 + i, "created_time": f"2026-01-0{1 + i % 5}T12:00:00Z"}
+        for i in range(12)
+    ]
+    calls = []
+    real_extract = account_scanner.extract_trade_features
+
+    def counting_extract(rows):
+        calls.append(len(rows))
+        return real_extract(rows)
+
+    scanner = AccountScanner.__new__(AccountScanner)
+    scanner.bot_detector = BotDetector(min_trades=10)
+    monkeypatch.setattr(scanner, "_fetch_account_data", lambda account_id=None: (trades, []))
+    monkeypatch.setattr(account_scanner, "extract_trade_features", counting_extract)
+
+    analysis = scanner.scan_account("acct")
+
+    assert calls == [12]
+    assert analysis["bot_analysis"] == BotDetector(min_trades=10).analyze_account(trades)
+    assert analysis["trade_stats"]["unique_markets"] == 4
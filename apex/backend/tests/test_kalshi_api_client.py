@@ -0,0 +1,277 @@
+import asyncio  # noqa: I001  (the routers import must run before the vendored ones)
+import base64
+
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from api_client import KalshiAPI
+from utils import Level
+
+
+# One RSA key shared by tests that only need an authenticated client
+_RSA_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _pem(key: PrivateKeyTypes) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def _signed(api: KalshiAPI, path: str = "/trade-api/v2/portfolio/balance"):
+    headers = api._get_auth_headers("GET", path)
+    message = f"{headers['KALSHI-ACCESS-TIMESTAMP']}GET{path}".encode()
+    return base64.b64decode(headers["KALSHI-ACCESS-SIGNATURE"]), message
+
+
+def test_rsa_key_signs_with_pss():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    api = KalshiAPI(api_key_id="key-id", private_key=_pem(key))
+
+    signature, message = _signed(api)
+    key.public_key().verify(
+        signature,
+        message,
+        padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH),
+        hashes.SHA256(),
+    )
+
+
+@pytest.mark.parametrize(
+    "make_key", [ed25519.Ed25519PrivateKey.generate, lambda: ec.generate_private_key(ec.SECP256R1())]
+)
+def test_non_rsa_key_leaves_client_unauthenticated(make_key):
+    api = KalshiAPI(api_key_id="key-id", private_key=_pem(make_key()))
+
+    assert api.token is None
+    assert api._get_auth_headers("GET", "/markets") == {}
+    with pytest.raises(ValueError):
+        api._generate_signature("0", "GET", "/markets")
+
+
+def test_authenticated_endpoints_short_circuit_without_credentials(monkeypatch):
+    api = KalshiAPI()
+    monkeypatch.setattr(api, "_make_request", lambda *a, **kw: pytest.fail("request sent without auth"))
+
+    assert api.get_positions() == []
+    assert api.get_positions() is not api.get_positions()
+    assert api.get_balance() is None
+    assert api.place_order("KXA", "yes", 1, price=50) is None
+    assert api.cancel_order("o1") is False
+    assert asyncio.run(api.get_positions_async()) == []
+
+def test_cancel_all_orders_cancels_every_matching_order(monkeypatch):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    api = KalshiAPI(api_key_id="key-id", private_key=_pem(key))
+    orders = [{"order_id": f"o{i}", "ticker": "KXA" if i % 3 else "KXB"} for i in range(10)]
+    cancelled = []
+
+    monkeypatch.setattr(api, "get_open_orders", lambda: orders)
+    monkeypatch.setattr(api, "cancel_order", lambda order_id: cancelled.append(order_id) or order_id != "o4")
+
+    assert api.cancel_all_orders(ticker="KXA") is False
+    assert sorted(cancelled) == sorted(o["order_id"] for o in orders if o["ticker"] == "KXA")
+
+
+def test_scan_account_fetches_trades_and_positions_concurrently(monkeypatch):
+    import api_client
+    import httpx
+    from account_scanner import AccountScanner
+
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        assert request.headers["KALSHI-ACCESS-KEY"] == "key-id"
+        if request.url.path.endswith("/portfolio/fills"):
+            return httpx.Response(200, json={"fills": [{"ticker": "KXA", "count": 5, "yes_price": 40}]})
+        return httpx.Response(200, json={"positions": [{"ticker": "KXA", "position": 5, "market_price": 45}]})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        api_client.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    scanner = AccountScanner(api=KalshiAPI(api_key_id="key-id", private_key=_pem(key)))
+
+    trades, positions = scanner._fetch_account_data()
+
+    assert trades == [{"ticker": "KXA", "count": 5, "yes_price": 40}]
+    assert positions == [{"ticker": "KXA", "position": 5, "market_price": 45}]
+    assert sorted(path.rsplit("/", 1)[-1] for path in requested) == ["fills", "positions"]
+
+
+def test_signatures_are_reused_within_the_same_millisecond(monkeypatch):
+    import api_client
+
+    api = KalshiAPI(api_key_id="key-id", private_key=_pem(_RSA_KEY))
+    calls = []
+    sign = api._sign
+    monkeypatch.setattr(api, "_sign", lambda message: calls.append(message) or sign(message))
+    monkeypatch.setattr(api_client.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    first = api._get_auth_headers("GET", "/trade-api/v2/markets")
+    second = api._get_auth_headers("GET", "/trade-api/v2/markets")
+    api._get_auth_headers("GET", "/trade-api/v2/portfolio/balance")
+
+    assert first == second
+    assert len(calls) == 2
+
+
+def test_iter_account_trades_follows_cursor(monkeypatch):
+    api = KalshiAPI(api_key_id="key-id", private_key=_pem(_RSA_KEY))
+    pages = {None: ([{"trade_id": 1}, {"trade_id": 2}], "c1"), "c1": ([{"trade_id": 3}], "c2"), "c2": ([], None)}
+    cursors = []
+
+    def fake_page(member_id, limit, cursor):
+        cursors.append(cursor)
+        return pages[cursor]
+
+    monkeypatch.setattr(api, "_get_fills_page", fake_page)
+
+    assert list(api.iter_account_trades()) == [[{"trade_id": 1}, {"trade_id": 2}], [{"trade_id": 3}]]
+    assert cursors == [None, "c1", "c2"]
+
+    cursors.clear()
+    assert list(api.iter_account_trades(max_pages=1)) == [[{"trade_id": 1}, {"trade_id": 2}]]
+    assert cursors == [None]
+
+
+def test_account_trades_soa_returns_aligned_columns(monkeypatch):
+    api = KalshiAPI()
+    fills = [
+        {"ticker": "KXA", "count": 3, "yes_price": 40, "created_time": "2026-01-01T00:00:00Z"},
+        {"market_ticker": "KXB", "quantity": 2, "no_price": 55},
+        {"ticker": "KXA", "count": None, "price": 10, "timestamp": 1767225600},
+    ]
+    monkeypatch.setattr(api, "_get_fills_page", lambda member_id, limit, cursor=None: (fills, None))
+
+    soa = api.get_account_trades_soa()
+
+    assert len(soa) == 3
+    assert soa.sizes.tolist() == [3, 2, 0]
+    assert soa.prices.tolist() == [40, 55, 10]
+    assert soa.timestamps == ["2026-01-01T00:00:00Z", None, 1767225600]
+    assert soa.tickers.tolist() == ["KXA", "KXB", "KXA"]
+
+
+def test_sync_requests_reuse_one_pooled_client(monkeypatch):
+    import api_client
+    import httpx
+
+    clients = []
+    real_client = httpx.Client
+
+    def make_client(**kwargs):
+        assert kwargs["http2"] is True
+        clients.append(real_client(transport=httpx.MockTransport(lambda request: httpx.Response(
+            200, json={"orderbook": {"ticker": request.url.path.split("/")[-2], "yes": [[40, 3]]}}
+        )), **kwargs))
+        return clients[-1]
+
+    monkeypatch.setattr(api_client.httpx, "Client", make_client)
+    api = KalshiAPI()
+
+    assert api.get_orderbook("KXA") == {"orderbook": {"ticker": "KXA", "yes": [Level(40, 3)], "no": []}}
+    assert api.get_orderbook("KXB")["orderbook"]["ticker"] == "KXB"
+    assert len(clients) == 1
+    api.close()
+    assert clients[0].is_closed
+
+
+def test_place_orders_batch_aligns_rejections(monkeypatch):
+    from config import Config
+
+    api = KalshiAPI(api_key_id="key-id", private_key=_pem(_RSA_KEY))
+    sent = []
+
+    def fake_request(method, endpoint, params=None, json=None):
+        sent.append((method, endpoint, json))
+        return {"orders": [{"order": {"order_id": "o1"}, "error": None}, {"order": None, "error": {"code": "x"}}]}
+
+    monkeypatch.setattr(Config, "ENABLE_TRADING", True)
+    monkeypatch.setattr(api, "_make_request", fake_request)
+
+    placed = api.place_orders_batch([
+        {"ticker": "KXA", "side": "yes", "quantity": 3, "price": 40},
+        {"ticker": "KXA", "side": "no", "quantity": 3, "price": 55},
+    ])
+
+    assert placed == [{"order_id": "o1"}, None]
+    assert [(m, e) for m, e, _ in sent] == [("POST", "/portfolio/orders/batched")]
+    assert sent[0][2]["orders"][1] == {
+        "ticker": "KXA", "action": "buy", "side": "no", "count": 3, "type": "limit", "yes_price": None, "no_price": 55,
+    }
+    assert KalshiAPI().place_orders_batch([{"ticker": "KXA", "side": "yes", "quantity": 1}]) == [None]
+
+
+def test_async_sessions_on_separate_threads_keep_their_own_client(monkeypatch):
+    import threading
+
+    import api_client
+    import httpx
+    from utils import run_async
+
+    owners = {}
+    requests_seen = []
+    barrier = threading.Barrier(2)
+    real_client = httpx.AsyncClient
+
+    def make_client(**kwargs):
+        owner = threading.get_ident()
+
+        def handler(request):
+            requests_seen.append((owner, threading.get_ident()))
+            return httpx.Response(200, json={"orderbook": {"yes": [], "no": []}})
+
+        client = real_client(transport=httpx.MockTransport(handler), **kwargs)
+        owners[id(client)] = owner
+        return client
+
+    monkeypatch.setattr(api_client.httpx, "AsyncClient", make_client)
+    api = KalshiAPI()
+
+    async def session():
+        async with api.async_session():
+            # Both sessions are open before either one sends or exits
+            await asyncio.to_thread(barrier.wait)
+            await api.get_orderbook_async("KXA")
+            await asyncio.to_thread(barrier.wait)
+            await api.get_orderbook_async("KXB")
+
+    threads = [threading.Thread(target=run_async, args=(session(),)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(owners) == 2
+    assert len(requests_seen) == 4
+    assert all(owner == caller for owner, caller in requests_seen)
+
+
+def test_amend_orders_caps_its_pool(monkeypatch):
+    import api_client
+
+    workers = []
+    real_pool = api_client.ThreadPoolExecutor
+
+    def make_pool(max_workers):
+        workers.append(max_workers)
+        return real_pool(max_workers=max_workers)
+
+    monkeypatch.setattr(api_client, "ThreadPoolExecutor", make_pool)
+    api = KalshiAPI()
+    monkeypatch.setattr(api, "amend_order", lambda **amendment: amendment)
+
+    amendments = [{"order_id": f"o{i}"} for i in range(40)]
+    assert api.amend_orders(amendments) == amendments
+    assert api.amend_orders([]) == []
+    assert workers == [16]
@@ -0,0 +1,155 @@
+import httpx  # noqa: I001  (the routers import must run before the vendored ones)
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from api_client import KalshiAPI
+from risk_manager import RiskManager
+from strategies import arbitrage
+from strategies.arbitrage import ArbitrageStrategy
+from utils import Level
+
+
+_BOOKS = {
+    "KXA": {"yes": [{"price": 40, "quantity": 10}], "no": [{"price": 50, "quantity": 8}]},
+    "KXB": {"yes": [{"price": 60, "quantity": 10}], "no": [{"price": 45, "quantity": 8}]},
+    "KXC": {"yes": [{"price": 30, "quantity": 5}], "no": [{"price": 55, "quantity": 9}]},
+    "KXD": {"yes": [], "no": [{"price": 10, "quantity": 1}]},
+}
+
+
+def _book(ticker):
+    return KalshiAPI._parse_orderbook({"orderbook": _BOOKS[ticker]})
+
+
+def _patch_transport(monkeypatch, requested):
+    import api_client
+
+    def handler(request):
+        ticker = request.url.path.split("/")[-2]
+        requested.append(ticker)
+        if ticker == "KXE":
+            return httpx.Response(500)
+        return httpx.Response(200, json={"orderbook": _BOOKS[ticker]})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        api_client.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+
+def test_concurrent_scan_matches_sequential(monkeypatch):
+    requested = []
+    _patch_transport(monkeypatch, requested)
+    monkeypatch.setattr(arbitrage, "_BATCH_SIZE", 2)
+    api = KalshiAPI()
+    monkeypatch.setattr(api, "get_orderbook", _book)
+    strategy = ArbitrageStrategy(api, RiskManager())
+    markets = [{"ticker": t, "title": t} for t in ("KXA", "KXB", "KXC", "KXD")]
+
+    concurrent = strategy.find_opportunities(markets + [{"ticker": "KXE"}, {"title": "no ticker"}])
+    sequential = strategy.find_opportunities(markets, parallel=False)
+
+    assert sorted(requested) == ["KXA", "KXB", "KXC", "KXD", "KXE"]
+    assert [o["ticker"] for o in concurrent] == ["KXA", "KXC"]
+    assert concurrent == sequential
+    assert strategy.find_opportunities(markets, parallel=False, limit=1) == sequential[:1]
+
+
+def test_get_orderbooks_aligns_results_with_tickers(monkeypatch):
+    requested = []
+    _patch_transport(monkeypatch, requested)
+
+    books = KalshiAPI().get_orderbooks(["KXB", "KXE", "KXA"])
+
+    assert books == [_book("KXB"), None, _book("KXA")]
+    assert books[0]["orderbook"]["yes"] == [Level(60, 10)]
+
+
+def test_snapshot_prunes_markets_before_fetching(monkeypatch):
+    requested = []
+    _patch_transport(monkeypatch, requested)
+    markets = [
+        {"ticker": "KXA", "yes_bid": 40, "no_bid": 50},
+        {"ticker": "KXB", "yes_bid": 60, "no_bid": 45},
+        {"ticker": "KXC", "yes_bid": 50, "no_bid": 51},
+        {"ticker": "KXD"},
+    ]
+
+    opportunities = ArbitrageStrategy(KalshiAPI(), RiskManager()).find_opportunities(markets)
+
+    assert sorted(requested) == ["KXA", "KXC", "KXD"]
+    assert [o["ticker"] for o in opportunities] == ["KXA", "KXC"]
+
+
+def test_execute_arbitrage_cancels_the_leg_that_went_through(monkeypatch):
+    from config import Config
+
+    class _API:
+        def __init__(self):
+            self.cancelled = []
+
+        def place_orders_batch(self, orders):
+            assert [(o["side"], o["price"]) for o in orders] == [("yes", 40), ("no", 50)]
+            return [None, {"order_id": "no-1"}]
+
+        def cancel_order(self, order_id):
+            self.cancelled.append(order_id)
+            return True
+
+    monkeypatch.setattr(Config, "ENABLE_TRADING", True)
+    api = _API()
+    opportunity = {
+        "ticker": "KXA", "yes_cents": 40, "no_cents": 50, "yes_price": 0.4, "no_price": 0.5,
+        "recommended_quantity": 2, "expected_profit": 0.2,
+    }
+
+    result = ArbitrageStrategy(api, RiskManager()).execute_arbitrage(opportunity)
+
+    assert result == {"status": "error", "reason": "Failed to place YES order"}
+    assert api.cancelled == ["no-1"]
+
+
+def test_min_profit_is_compared_in_whole_cents():
+    api = KalshiAPI()
+    api.get_orderbook = _book
+    strategy = ArbitrageStrategy(api, RiskManager())
+    strategy.min_profit_cents = 10
+
+    # 40c + 50c leaves exactly 10c, which float dollars round just below 0.10
+    opportunities = strategy.find_opportunities([{"ticker": "KXA"}], parallel=False)
+
+    assert [(o["yes_cents"], o["no_cents"], o["profit_per_contract"]) for o in opportunities] == [(40, 50, 0.1)]
+
+
+def test_top_of_book_does_not_depend_on_level_order():
+    ascending = {"yes": [[20, 4], [30, 6], [40, 10]], "no": [[35, 2], [50, 8]]}
+    reversed_book = {side: levels[::-1] for side, levels in ascending.items()}
+    strategy = ArbitrageStrategy(KalshiAPI(), RiskManager())
+
+    opportunities = [
+        strategy._evaluate_orderbooks([{"ticker": "KXA"}], [KalshiAPI._parse_orderbook({"orderbook": book})])
+        for book in (ascending, reversed_book)
+    ]
+
+    assert opportunities[0] == opportunities[1]
+    assert [(o["yes_cents"], o["no_cents"], o["max_quantity"]) for o in opportunities[0]] == [(40, 50, 8)]
+
+
+def test_snapshot_screen_agrees_with_the_orderbook_check(monkeypatch):
+    api = KalshiAPI()
+    monkeypatch.setattr(api, "get_orderbook", _book)
+    strategy = ArbitrageStrategy(api, RiskManager())
+    # Snapshots as the market list reports them: each side's best bid
+    markets = [
+        {"ticker": t, "yes_bid": max((level["price"] for level in b["yes"]), default=0),
+         "no_bid": max((level["price"] for level in b["no"]), default=0)}
+        for t, b in _BOOKS.items()
+    ]
+
+    screened = strategy.find_opportunities(markets, parallel=False)
+    monkeypatch.setattr(arbitrage, "_may_have_arbitrage", lambda market: True)
+    unscreened = strategy.find_opportunities(markets, parallel=False)
+
+    assert [o["ticker"] for o in screened] == ["KXA", "KXC"]
+    assert screened == unscreened
@@ -0,0 +1,112 @@
+from datetime import datetime, timezone  # noqa: I001  (the routers import must run before the vendored ones)
+
+import pytest
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from bot_detector import BotDetector
+
+
+def test_timeline_parses_mixed_timestamp_formats_in_trade_order():
+    raw = [
+        "2026-01-03T10:00:00Z",  # Saturday
+        1767434400.5,  # 2026-01-03T10:00:00.5Z
+        "1767434401",  # epoch seconds as a string (fallback path)
+        datetime(2026, 1, 5, 2, 30, tzinfo=timezone.utc),  # Monday
+        None,
+        "not a time",
+    ]
+
+    timeline = BotDetector(min_trades=1)._build_timeline(raw)
+
+    assert len(timeline) == 4
+    assert timeline.ns[1] - timeline.ns[0] == 500_000_000
+    assert timeline.ns[2] - timeline.ns[1] == 500_000_000
+    assert timeline.hour.tolist() == [10, 10, 10, 2]
+    assert timeline.weekday.tolist() == [5, 5, 5, 0]
+
+
+def test_execution_speed_uses_consecutive_positive_gaps():
+    detector = BotDetector(min_trades=1)
+    timeline = detector._build_timeline([0, 0.05, 0.05, 3.05, 100.05])
+
+    # gaps 0.05s, 3s and 97s; the zero gap is ignored
+    expected_ratio = (1 / 3) * 0.7 + (2 / 3) * 0.3
+    assert detector._analyze_execution_speed(timeline) == pytest.approx(1.0 * 0.5 + expected_ratio * 0.5)
+
+
+def test_parse_timestamp_caches_strings_with_bounded_fifo(monkeypatch):
+    import bot_detector
+
+    monkeypatch.setattr(bot_detector, "_TS_CACHE_MAX", 2)
+    detector = BotDetector(min_trades=1)
+
+    first = detector._parse_timestamp("2026-01-01T00:00:00Z")
+    assert detector._parse_timestamp("2026-01-01T00:00:00Z") is first
+    assert detector._parse_timestamp("garbage") is None
+    detector._parse_timestamp("1767225600")
+
+    assert list(detector._ts_cache) == ["garbage", "1767225600"]
+
+
+@pytest.mark.parametrize(
+    "cv,expected",
+    [(0.0, 0.9), (0.19, 0.9), (0.2, 0.6), (0.49, 0.6), (0.5, 0.3), (1.0, 0.1), (3.0, 0.1)],
+)
+def test_size_cv_score_table_boundaries(cv, expected):
+    import bot_detector
+
+    assert bot_detector._bucket(cv, BotDetector._SIZE_CV_T, BotDetector._SIZE_CV_S) == expected
+
+
+@pytest.mark.parametrize("per_day,expected", [(4.9, 0.2), (5, 0.4), (19.9, 0.6), (20, 0.8), (50, 1.0), (500, 1.0)])
+def test_frequency_score_table_boundaries(per_day, expected):
+    import bot_detector
+
+    assert bot_detector._bucket(per_day, BotDetector._FREQ_T, BotDetector._FREQ_S) == expected
+
+
+def test_analyze_account_memoizes_by_fill_history_fingerprint(monkeypatch):
+    trades = [
+        {"trade_id": f"t{i}", "ticker": "KXA", "count": 5, "yes_price": 50, "created_time": f"2026-01-01T00:00:{i:02d}Z"}
+        for i in range(12)
+    ]
+    detector = BotDetector(min_trades=10)
+    calls = []
+    real_build = BotDetector._build_timeline
+    monkeypatch.setattr(BotDetector, "_build_timeline", lambda self, raw: calls.append(1) or real_build(self, raw))
+
+    first = detector.analyze_account(trades)
+    assert detector.analyze_account(list(trades)) == first
+    assert len(calls) == 1
+
+    # Callers get their own copies, so mutating one doesn't reach the cache
+    snapshot = {**first, "indicators": dict(first["indicators"]), "top_indicators": list(first["top_indicators"])}
+    first["indicators"]["timing"] = -1.0
+    first["top_indicators"].clear()
+    assert detector.analyze_account(trades) == snapshot
+
+    # A new fill at the head of the history changes the fingerprint
+    detector.analyze_account([{**trades[0], "trade_id": "t99"}] + trades)
+    assert len(calls) == 2
+
+    # Without trade ids there is nothing to fingerprint, so nothing is cached
+    detector.clear_cache()
+    anonymous = [{k: v for k, v in t.items() if k != "trade_id"} for t in trades]
+    detector.analyze_account(anonymous)
+    detector.analyze_account(anonymous)
+    assert len(calls) == 4
+    assert detector._result_cache == {}
+
+
+def test_epoch_timestamps_are_read_as_utc_in_any_local_zone(monkeypatch):
+    import time
+
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        timeline = BotDetector()._build_timeline([1700000000, "1700000000"])
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert timeline.ns.tolist() == [1_700_000_000_000_000_000] * 2
@@ -0,0 +1,29 @@
+import pytest  # noqa: I001  (the routers import must run before the vendored ones)
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from config import Config
+
+
+def test_reload_rereads_environment_and_clears_cached_url(monkeypatch):
+    try:
+        monkeypatch.setenv("USE_DEMO", "1")
+        monkeypatch.setenv("MAX_POSITION_SIZE", "250")
+        Config.reload()
+
+        assert Config.USE_DEMO is True
+        assert Config.MAX_POSITION_SIZE == 250.0
+        assert Config.get_api_url() == Config.KALSHI_DEMO_URL
+        assert Config.snapshot().MAX_POSITION_SIZE == 250.0
+    finally:
+        monkeypatch.undo()
+        Config.reload()
+
+
+def test_invalid_setting_names_the_variable(monkeypatch):
+    try:
+        monkeypatch.setenv("API_CALLS_PER_SECOND", "ten")
+        with pytest.raises(ValueError, match="API_CALLS_PER_SECOND"):
+            Config.reload()
+    finally:
+        monkeypatch.undo()
+        Config.reload()
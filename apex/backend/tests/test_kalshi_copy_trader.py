@@ -0,0 +1,72 @@
+import asyncio  # noqa: I001  (the routers import must run before the vendored ones)
+import contextlib
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from risk_manager import RiskManager
+from strategies import copy_trader
+from strategies.copy_trader import CopyTradingStrategy
+
+
+class _API:
+    def __init__(self):
+        self.pages = []
+
+    def get_account_trades(self, account_id, limit=50):
+        return self.pages.pop(0)
+
+
+def _trade(trade_id, count=20):
+    return {"trade_id": trade_id, "ticker": "KXA", "count": count, "yes_price": 40}
+
+
+def test_monitor_account_reports_each_trade_once(monkeypatch):
+    monkeypatch.setattr(copy_trader, "_SEEN_TRADES_MAX", 4)
+    api = _API()
+    strategy = CopyTradingStrategy(api, RiskManager())
+    api.pages = [
+        [_trade("t1"), _trade("t2")],
+        [_trade("t3"), _trade("t1"), _trade("t4", count=1), {"fill_id": "f5", "count": 30}],
+        [_trade("t3"), {"fill_id": "f5", "count": 30}, _trade("t6")],
+        [_trade("t1")],
+    ]
+
+    assert strategy.monitor_account("acct") == []
+    assert [t.get("trade_id", t.get("fill_id")) for t in strategy.monitor_account("acct")] == ["t3", "f5"]
+    assert [t["trade_id"] for t in strategy.monitor_account("acct")] == ["t6"]
+    # t1 and t2 were evicted from the window of 4 remembered IDs
+    assert strategy.last_trade_ids["acct"] == {"t3", "t4", "f5", "t6"}
+    assert [t["trade_id"] for t in strategy.monitor_account("acct")] == ["t1"]
+
+
+class _AsyncAPI:
+    def __init__(self, pages):
+        self.pages = pages
+        self.in_flight = 0
+        self.peak = 0
+
+    @contextlib.asynccontextmanager
+    async def async_session(self):
+        yield self
+
+    async def get_account_trades_async(self, account_id, limit=50):
+        if account_id == "broken":
+            raise RuntimeError("boom")
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return self.pages[account_id].pop(0)
+
+
+def test_run_polls_followed_accounts_concurrently(monkeypatch):
+    monkeypatch.setattr(copy_trader.time, "sleep", lambda seconds: None)
+    api = _AsyncAPI({
+        "a": [[_trade("a1")], [_trade("a2"), _trade("a1")]],
+        "b": [[_trade("b1")], [_trade("b1")]],
+        "c": [[], [_trade("c1")]],
+    })
+
+    results = CopyTradingStrategy(api, RiskManager()).run(["a", "broken", "b", "c"], max_iterations=2, dry_run=True)
+
+    assert api.peak == 3
+    assert [(r["status"], r["quantity"]) for r in results] == [("dry_run", int(20 * copy_trader.Config.COPY_TRADE_RATIO))]
@@ -0,0 +1,142 @@
+import asyncio  # noqa: I001  (the routers import must run before the vendored ones)
+import contextlib
+
+import pytest
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from risk_manager import RiskManager
+from utils import Level
+from strategies import market_maker
+from strategies.market_maker import MarketMakerStrategy
+
+
+class _API:
+    def __init__(self, books):
+        self.books = books
+        self.calls = []
+        self.in_session = False
+
+    @contextlib.asynccontextmanager
+    async def async_session(self):
+        self.in_session = True
+        try:
+            yield self
+        finally:
+            self.in_session = False
+
+    async def get_positions_async(self):
+        assert self.in_session
+        self.calls.append("positions")
+        await asyncio.sleep(0)
+        return [{"ticker": "KXA", "position": 4}]
+
+    async def get_orderbook_async(self, ticker):
+        assert self.in_session
+        self.calls.append(ticker)
+        await asyncio.sleep(0)
+        return {"orderbook": self.books[ticker]} if self.books.get(ticker) else None
+
+
+# Kalshi lists each side in ascending price order, so the best bid is last
+_BOOK = {"yes": [Level(38, 5), Level(40, 10)], "no": [Level(43, 2), Level(45, 8)]}
+
+
+def test_run_quotes_every_market_without_fixed_pauses(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(market_maker.time, "sleep", sleeps.append)
+    api = _API({"KXA": _BOOK, "KXB": _BOOK, "KXC": None})
+
+    results = MarketMakerStrategy(api, RiskManager()).run(["KXA", "KXB", "KXC"], refresh_interval=7, max_iterations=2, dry_run=True)
+
+    # Second iteration sees the same books, so the quotes are left standing
+    assert [r["ticker"] for r in results] == ["KXA", "KXB"]
+    assert all(r["status"] == "dry_run" for r in results)
+    assert sleeps == [7]
+    assert api.calls[:4] == ["positions", "KXA", "KXB", "KXC"]
+
+
+def test_run_requotes_only_markets_that_moved():
+    moved = {"yes": [Level(28, 5), Level(30, 10)], "no": [Level(53, 2), Level(55, 8)]}
+    resized = {"yes": [Level(38, 9), Level(40, 3)], "no": [Level(43, 4), Level(45, 1)]}
+    api = _API({"KXA": _BOOK, "KXB": _BOOK, "KXC": _BOOK})
+    strategy = MarketMakerStrategy(api, RiskManager())
+
+    first = strategy.run(["KXA", "KXB", "KXC"], max_iterations=1, dry_run=True)
+    api.books.update(KXB=moved, KXC=resized)
+    second = strategy.run(["KXA", "KXB", "KXC"], max_iterations=1, dry_run=True)
+
+    assert [r["ticker"] for r in first] == ["KXA", "KXB", "KXC"]
+    assert [r["ticker"] for r in second] == ["KXB"]
+
+
+def test_calculate_quotes_prices_the_yes_ask_from_the_no_book():
+    strategy = MarketMakerStrategy(_API({}), RiskManager())
+    strategy.target_spread = 0.02
+
+    quotes = strategy.calculate_quotes("KXA", _BOOK)
+
+    # Best YES bid 40c, best NO bid 45c -> YES ask 55c
+    assert quotes["mid_price"] == pytest.approx(0.475)
+    assert quotes["bid_price"] == pytest.approx(0.465)
+    assert quotes["ask_price"] == pytest.approx(0.485)
+    reversed_book = {side: levels[::-1] for side, levels in _BOOK.items()}
+    assert strategy.calculate_quotes("KXA", reversed_book) == quotes
+    assert strategy.calculate_quotes("KXA", {"yes": _BOOK["yes"], "no": []}) is None
+
+
+def test_place_quotes_amends_standing_orders_in_place(monkeypatch):
+    from config import Config
+
+    class _OrderAPI:
+        def __init__(self):
+            self.calls = []
+            self.reject_amends = False
+
+        def place_orders_batch(self, orders):
+            self.calls.append(("place", [o["price"] for o in orders]))
+            return [{"order_id": f"{o['side']}-{len(self.calls)}"} for o in orders]
+
+        def amend_orders(self, amendments):
+            self.calls.append(("amend", [(a["order_id"], a["price"]) for a in amendments]))
+            return [None if self.reject_amends else {"order_id": a["order_id"]} for a in amendments]
+
+        def cancel_order(self, order_id):
+            self.calls.append(("cancel", order_id))
+            return True
+
+    monkeypatch.setattr(Config, "ENABLE_TRADING", True)
+    api = _OrderAPI()
+    strategy = MarketMakerStrategy(api, RiskManager())
+
+    strategy.place_quotes("KXA", {"bid_price": 0.40, "ask_price": 0.45}, 5)
+    strategy.place_quotes("KXA", {"bid_price": 0.41, "ask_price": 0.46}, 5)
+    api.reject_amends = True
+    result = strategy.place_quotes("KXA", {"bid_price": 0.42, "ask_price": 0.47}, 5)
+
+    assert api.calls == [
+        ("place", [40, 55]),
+        ("amend", [("yes-1", 41), ("no-1", 54)]),
+        ("amend", [("yes-1", 42), ("no-1", 53)]),
+        ("cancel", "yes-1"),
+        ("cancel", "no-1"),
+        ("place", [42, 53]),
+    ]
+    assert result["status"] == "success"
+    assert strategy.active_quotes["KXA"]["bid_order_id"] == "yes-6"
+
+
+def test_run_skips_quoting_when_book_and_inventory_are_unchanged(monkeypatch):
+    api = _API({"KXA": _BOOK, "KXB": _BOOK})
+    strategy = MarketMakerStrategy(api, RiskManager())
+    quoted = []
+    calculate = strategy.calculate_quotes
+    monkeypatch.setattr(strategy, "calculate_quotes", lambda ticker, *a: quoted.append(ticker) or calculate(ticker, *a))
+
+    strategy.run(["KXA", "KXB"], max_iterations=1, dry_run=True)
+    strategy.run(["KXA", "KXB"], max_iterations=1, dry_run=True)
+    api.books["KXB"] = {"yes": [Level(38, 5), Level(40, 10)], "no": [Level(43, 2), Level(45, 9)]}
+    strategy.run(["KXA", "KXB"], max_iterations=1, dry_run=True)
+    api.get_positions_async = lambda: asyncio.sleep(0, [{"ticker": "KXA", "position": 5}])
+    strategy.run(["KXA", "KXB"], max_iterations=1, dry_run=True)
+
+    assert quoted == ["KXA", "KXB", "KXB", "KXA"]
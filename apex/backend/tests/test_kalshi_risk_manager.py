@@ -0,0 +1,37 @@
+import pytest  # noqa: I001  (the routers import must run before the vendored ones)
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+from risk_manager import RiskManager
+
+
+def test_position_table_tracks_adds_removes_and_side_exposure():
+    rm = RiskManager()
+    for i in range(100):  # past the initial table capacity
+        rm.update_position(f"T{i}", "yes" if i % 2 else "no", 2, 0.25)
+    rm.update_position("T1", "no", 2, 0.5)  # side stays as first recorded
+    rm.update_position("T0", "no", 2, 0.25, action="remove")
+
+    stats = rm.get_portfolio_stats()
+
+    assert stats["total_positions"] == 99
+    assert list(stats["positions"])[:2] == ["T1", "T2"]
+    assert stats["positions"]["T1"] == {"quantity": 4, "value": 1.5, "side": "yes", "avg_price": 0.375}
+    assert stats["yes_exposure"] == pytest.approx(50 * 0.5 + 1.0)
+    assert stats["no_exposure"] == pytest.approx(49 * 0.5)
+    assert stats["total_value"] == pytest.approx(stats["total_exposure"])
+    assert rm.check_position_limits("T1", 1, 0.5) == (True, "OK")
+
+
+def test_check_stop_loss_flags_losing_positions_by_side():
+    rm = RiskManager()
+    rm.stop_loss_pct = 10.0
+    positions = [
+        {"ticker": "A", "entry_price": 50, "market_price": 40, "position": 10, "side": "yes"},  # -20%
+        {"ticker": "B", "entry_price": 50, "market_price": 40, "position": 10, "side": "no"},  # +20%
+        {"ticker": "C", "entry_price": 50, "market_price": 55, "position": 10, "side": "no"},  # -10%: triggers
+        {"ticker": "D", "entry_price": 0, "market_price": 10, "position": 10, "side": "yes"},  # no entry: skipped
+        {"ticker": "", "entry_price": 50, "market_price": 10, "position": 10, "side": "yes"},  # no ticker: skipped
+    ]
+
+    assert rm.check_stop_loss(positions) == [positions[0], positions[2]]
+    assert rm.check_stop_loss([]) == []
@@ -0,0 +1,60 @@
+import asyncio  # noqa: I001  (the routers import must run before the vendored ones)
+
+from routers import kalshi as _kalshi_router  # noqa: F401  (puts the vendored Kalshi modules on sys.path)
+import utils
+from utils import AsyncRateLimiter, RateLimiter
+
+
+def test_rate_limiter_spaces_calls_on_the_monotonic_clock(monkeypatch):
+    clock = [5_000_000_000]
+    sleeps = []
+    monkeypatch.setattr(utils.time, "monotonic_ns", lambda: clock[0])
+    monkeypatch.setattr(utils.time, "sleep", sleeps.append)
+    limiter = RateLimiter(calls_per_second=4)
+
+    for _ in range(3):
+        limiter.wait_if_needed()
+    clock[0] += 2_000_000_000
+    limiter.wait_if_needed()
+
+    # Calls are a quarter second apart; an idle gap doesn't bank a burst
+    assert sleeps == [0.25, 0.5]
+
+
+def test_async_rate_limiter_sleeps_outside_the_lock(monkeypatch):
+    clock = [5_000_000_000]
+    monkeypatch.setattr(utils.time, "monotonic_ns", lambda: clock[0])
+    limiter = AsyncRateLimiter(calls_per_second=10)
+    waits = []
+
+    async def call():
+        start = asyncio.get_running_loop().time()
+        await limiter.acquire()
+        waits.append(round(asyncio.get_running_loop().time() - start, 2))
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(4)))
+
+    asyncio.run(run())
+
+    # Each waiter sleeps out its own slot concurrently, not one after another
+    assert sorted(waits) == [0.0, 0.1, 0.2, 0.3]
+
+    # Sync callers share the same budget
+    sleeps = []
+    monkeypatch.setattr(utils.time, "sleep", sleeps.append)
+    limiter.wait_if_needed()
+    assert sleeps == [0.4]
+
+
+def test_calculate_statistics_matches_numpy():
+    import numpy as np
+
+    values = [float(v) for v in np.random.default_rng(7).normal(50, 10, 501)]
+
+    stats = utils.calculate_statistics(values)
+
+    assert stats["median"] == float(np.median(values))
+    assert stats["p90"] == float(np.percentile(values, 90))
+    assert stats["min"] == min(values) and stats["max"] == max(values)
+    assert utils.calculate_statistics([])["p95"] == 0
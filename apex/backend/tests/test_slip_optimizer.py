@@ -0,0 +1,59 @@
+from itertools import combinations  # noqa: I001  (the routers import must run before the vendored ones)
+from math import comb
+
+import pytest
+
+from routers import dfs as _dfs_router  # noqa: F401  (puts the vendored DFS app on sys.path)
+from app.logic import slip_optimizer
+
+
+def _leg(player: str, odds: int, edge: float, opposing: int | None = None, market: str = "player_points"):
+    return {
+        "player_name": player,
+        "market": market,
+        "line": 10.5,
+        "side": "over",
+        "sharp_odds": odds,
+        "opposing_odds": opposing,
+        "edge_pct": edge,
+        "available_on_sleeper_compatible": True,
+    }
+
+
+def _reference_flex_ev(leg_probs, table):
+    n = len(leg_probs)
+    p = sum(leg_probs) / n
+    return sum(comb(n, k) * p**k * (1 - p) ** (n - k) * table.get(k, 0.0) for k in range(n + 1)) - 1.0
+
+
+@pytest.mark.parametrize("book,mode", [("prizepicks", "flex"), ("underdog", "insured")])
+def test_flex_ev_matches_binomial_reference(book, mode):
+    legs = [_leg("A", -120, 4.0, 100), _leg("B", -110, 2.0), _leg("C", -130, 5.0, 110), _leg("D", -105, 1.0)]
+    cand = slip_optimizer.calculate_slip_ev(legs, 4, book=book, mode=mode)
+
+    probs = []
+    for p in legs:
+        conf = slip_optimizer.leg_confidence_weight(p)
+        fair = slip_optimizer.no_vig_prob(p["sharp_odds"], p["opposing_odds"])
+        probs.append(slip_optimizer.confidence_adjusted_prob(fair, conf))
+    expected = _reference_flex_ev(probs, slip_optimizer.BOOK_PAYOUTS[book][mode][4])
+    assert cand.expected_value == pytest.approx(expected)
+
+
+def test_generate_top_slips_finds_best_power_slip():
+    odds = [-150, -140, -135, -130, -125, -120, -118, -115, -112, -110, -108, -105, 100, 105]
+    legs = [_leg(f"Player {i}", o, 6.0 - i * 0.3, o + 10 if i % 2 else None) for i, o in enumerate(odds)]
+    # Same player twice: combos must never pair these legs.
+    legs.append(_leg("Player 0", -155, 6.5, market="player_rebounds"))
+
+    slips = slip_optimizer.generate_top_slips(legs, slip_sizes=[4], top_n=3)
+
+    brute = max(
+        slip_optimizer.calculate_slip_ev(list(c), 4).expected_value
+        for c in combinations(legs, 4)
+        if len({p["player_name"] for p in c}) == 4
+    )
+    assert slips[0]["expected_value_pct"] == round(brute * 100, 2)
+    for slip in slips:
+        names = [p["player_name"] for p in slip["players"]]
+        assert len(names) == len(set(names))
@@ -48,3 +48,32 @@ def test_write_auth_guard_optional(monkeypatch):
         headers={"x-api-key": "unit-test-key"},
     )
     assert allowed.status_code == 200
+
+
+def test_hub_broadcast_sends_concurrently_and_prunes_dead_sockets():
+    import asyncio
+
+    class _Socket:
+        def __init__(self, fail=False):
+            self.fail = fail
+            self.sent = []
+
+        async def send_text(self, payload):
+            await asyncio.sleep(0.05)
+            if self.fail:
+                raise RuntimeError("closed")
+            self.sent.append(payload)
+
+    hub = main.WebSocketHub()
+    alive, dead = _Socket(), _Socket(fail=True)
+    hub.connections = {alive, dead, _Socket()}
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await hub.broadcast("system", "log", {"n": 1})
+        return loop.time() - start
+
+    assert asyncio.run(run()) < 0.1
+    assert alive.sent == ['{"channel":"system","type":"log","data":{"n":1}}']
+    assert dead not in hub.connections and len(hub.connections) == 2
@@ -0,0 +1,87 @@
+import asyncio  # noqa: I001  (the routers import must run before the vendored ones)
+
+import numpy as np
+import pytest
+
+from routers import dfs as _dfs_router  # noqa: F401  (puts the vendored DFS app on sys.path)
+from app.logic import strategy_engine
+
+
+def test_american_to_implied_vec_matches_scalar():
+    odds = [-250, -140, -110, -100, 100, 120, 300]
+    vec = strategy_engine.american_to_implied_vec(odds)
+    assert vec.tolist() == pytest.approx([strategy_engine.american_to_implied(o) for o in odds])
+
+
+def test_zero_odds_map_to_zero_probability():
+    from app.logic import slip_optimizer
+
+    # 0 is not a valid American price; the slip optimizer always treated it as 0.0
+    assert strategy_engine.american_to_implied(0) == 0.0
+    assert slip_optimizer.american_to_implied_prob(0) == 0.0
+    assert strategy_engine.american_to_implied_vec([0, -110]).tolist() == [0.0, strategy_engine.american_to_implied(-110)]
+
+
+@pytest.mark.parametrize("assumed_vig", [0.05, 0.0, -0.1])
+def test_edge_arrays_match_scalar_calculate_edge(assumed_vig):
+    sharp = [-400, -250, -140, -110, -100, 100, 120, 300]
+    opposing = [None, -300, 105, None, -120, 110, None, -500]
+
+    sharp_p, opp_p, fair_p, vig_pct, edge = strategy_engine._edge_arrays(
+        np.array(sharp, dtype=np.float64),
+        np.array([np.nan if o is None else o for o in opposing], dtype=np.float64),
+        0.5425,
+        assumed_vig,
+    )
+
+    for i, (s, o) in enumerate(zip(sharp, opposing)):
+        calc = strategy_engine.calculate_edge(s, 0.5425, o, assumed_vig)
+        assert float(sharp_p[i]) == calc["sharp_prob"]
+        assert float(edge[i]) == calc["edge"]
+        assert round(float(fair_p[i]), 4) == calc["fair_prob"]
+        assert round(float(vig_pct[i]), 2) == calc["vig_pct"]
+        assert (round(float(opp_p[i]), 4) if o is not None else None) == calc["opposing_prob"]
+
+
+def test_scan_matches_evaluate_prop():
+    metadata = {
+        "1": {"first_name": "LeBron", "last_name": "James"},
+        "2": {"first_name": "Nikola", "last_name": "Jokic"},
+    }
+    trending = [{"player_id": "1"}, {"player_id": "2"}, {"player_id": "3"}]
+    props = [
+        {"player_name": "lebron james", "market": "player_points", "line": 24.5, "odds": -150, "book": "fanduel"},
+        {"player_name": "LeBron James", "market": "player_assists", "line": 7.5, "odds": 110, "book": "pinnacle"},
+        {
+            "player_name": "Nikola Jokic",
+            "market": "player_rebounds",
+            "line": 12.5,
+            "odds": -135,
+            "opposing_odds": 105,
+            "book": "draftkings",
+        },
+    ]
+
+    opps = asyncio.run(strategy_engine.scan_for_opportunities(trending, metadata, props))
+
+    expected = sorted(
+        (
+            strategy_engine.evaluate_prop(
+                player_id=pid,
+                player_name=name,
+                market=p["market"],
+                line=p["line"],
+                sharp_odds=p["odds"],
+                sharp_book=p["book"],
+                opposing_odds=p.get("opposing_odds"),
+            )
+            for pid, name, p in [("1", "LeBron James", props[0]), ("1", "LeBron James", props[1]), ("2", "Nikola Jokic", props[2])]
+        ),
+        key=lambda x: x.edge,
+        reverse=True,
+    )
+    assert opps == expected
+
+    floor = (expected[1].edge + expected[2].edge) / 2
+    filtered = asyncio.run(strategy_engine.scan_for_opportunities(trending, metadata, props, min_edge=floor))
+    assert filtered == expected[:2]